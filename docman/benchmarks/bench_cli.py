@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+End-to-End CLI Benchmark
+
+Generates seeded synthetic monorepos (see generate_examples.py --synthetic) at
+several scales and times each phase of cli.main on them: a cold run (no parse
+cache, no index) and a warm run (cache and index in place). Results are
+written as JSON and compared with a stored baseline (benchmarks/baseline.json,
+meant to be committed for the machine that runs the benchmark, e.g. CI); the
+benchmark fails when throughput (documents per second) drops by more than the
+threshold, or when there is no baseline to compare with.
+
+Usage:
+    python benchmarks/bench_cli.py [--scales 1000,10000] [--repeat N] [--jobs N]
+                                   [--threshold 0.2] [--output FILE] [--baseline FILE]
+                                   [--update-baseline] [--allow-missing-baseline]
+                                   [--workdir DIR]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cli
+from generate_examples import SyntheticSpec, generate_synthetic_repo
+
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+MODES = ("cold", "warm")
+
+# Deep enough for 100k documents; the rest are the generator's defaults
+BASE_SPEC = SyntheticSpec(depth=6, fan_out=10)
+
+
+def spec_for_scale(documents: int, seed: int) -> SyntheticSpec:
+    """A spec whose repository has about `documents` validated documents."""
+    documented = max(documents // BASE_SPEC.docs_per_dir - 1, 0)
+    directories = round(documented / (1 - BASE_SPEC.ignored_share))
+    return replace(BASE_SPEC, directories=directories, seed=seed)
+
+
+def run_cli(repo: Path, jobs: int) -> Dict:
+    """Run cli.main once on `repo`, output discarded; return wall and phase times."""
+    argv = sys.argv
+    sys.argv = ["cli.py", str(repo), "--jobs", str(jobs)]
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            exit_code = cli.main()
+            seconds = time.perf_counter() - start
+    finally:
+        sys.argv = argv
+    return {"seconds": seconds, "exit_code": exit_code,
+            "phases": dict(cli.PHASES.timings)}
+
+
+def reset_repo(repo: Path) -> None:
+    """Remove everything a run leaves behind, for a cold run."""
+    shutil.rmtree(repo / ".docman-cache", ignore_errors=True)
+    (repo / "DOCUMENTATION_INDEX.md").unlink(missing_ok=True)
+
+
+def bench_scale(repo: Path, documents: int, repeat: int, jobs: int) -> List[Dict]:
+    """Best-of-`repeat` cold and warm runs on a generated repository."""
+    results = []
+    for mode in MODES:
+        best = None
+        for _ in range(repeat):
+            if mode == "cold":
+                reset_repo(repo)
+            run = run_cli(repo, jobs)
+            if best is None or run["seconds"] < best["seconds"]:
+                best = run
+        best.update(mode=mode, documents=documents,
+                    docs_per_second=documents / best["seconds"])
+        results.append(best)
+
+        phases = "  ".join(f"{name} {seconds * 1000:.0f}"
+                           for name, seconds in best["phases"].items())
+        print(f"  {mode:<5} {best['seconds'] * 1000:9.1f} ms  "
+              f"{best['docs_per_second']:9.0f} docs/s   (ms: {phases})")
+    return results
+
+
+def compare(runs: List[Dict], baseline: Dict, threshold: float) -> List[str]:
+    """Descriptions of the runs whose throughput regressed past the threshold."""
+    reference = {(run["scale"], run["mode"]): run for run in baseline.get("runs", [])}
+    regressions = []
+    generated = baseline.get('generated', 'unknown date')
+    print(f"\n📊 Against baseline ({generated}), threshold {threshold:.0%}:")
+    for run in runs:
+        old = reference.get((run["scale"], run["mode"]))
+        if old is None:
+            print(f"  {run['scale']:>7} {run['mode']:<5} no baseline")
+            continue
+        change = run["docs_per_second"] / old["docs_per_second"] - 1
+        status = "✅"
+        if change < -threshold:
+            status = "❌"
+            regressions.append(f"{run['scale']} docs {run['mode']}: {change:+.1%}")
+        print(f"  {status} {run['scale']:>7} {run['mode']:<5} "
+              f"{old['docs_per_second']:9.0f} -> "
+              f"{run['docs_per_second']:9.0f} docs/s ({change:+.1%})")
+    return regressions
+
+
+def write_json(path: Path, data: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    """Run the benchmark, store the results and check them against the baseline."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark cli.main phases on synthetic monorepos")
+    parser.add_argument("--scales", default="1000,10000",
+                        help="Comma-separated document counts (default: 1000,10000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repetitions, best is kept (default: 3)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes passed to the CLI "
+                             "(default: 1, for stable numbers)")
+    parser.add_argument("--seed", type=int, default=BASE_SPEC.seed,
+                        help=f"Generator seed (default: {BASE_SPEC.seed})")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed throughput drop against the baseline "
+                             "(default: 0.2 = 20%%)")
+    parser.add_argument("--output", default=str(RESULTS_DIR / "latest.json"),
+                        help="Results file (default: benchmarks/results/latest.json)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH),
+                        help="Baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store these results as the new baseline instead of "
+                             "comparing")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Pass when there is no baseline yet instead of failing")
+    parser.add_argument("--workdir",
+                        help="Keep the generated repositories here "
+                             "(default: a temp dir)")
+    args = parser.parse_args()
+
+    # Without a baseline the regression gate cannot fire: fail before spending
+    # time on the runs
+    baseline_path = Path(args.baseline)
+    if not (baseline_path.exists() or args.update_baseline
+            or args.allow_missing_baseline):
+        print(f"❌ No baseline at {baseline_path}; record one with --update-baseline "
+              f"(make bench-baseline) or pass --allow-missing-baseline")
+        return 1
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="docman-bench-"))
+    # An empty config: the defaults, whatever .docmanrc surrounds the checkout
+    config_path = workdir / ".docmanrc"
+    workdir.mkdir(parents=True, exist_ok=True)
+    config_path.write_text("", encoding="utf-8")
+    os.environ["DOCMAN_CONFIG"] = str(config_path)
+
+    runs = []
+    try:
+        for scale in scales:
+            spec = spec_for_scale(scale, args.seed)
+            repo = workdir / f"repo-{scale}"
+            started = time.perf_counter()
+            stats = generate_synthetic_repo(repo, spec)
+            print(f"⏱️  {stats['documents']} documents in "
+                  f"{stats['directories']} directories "
+                  f"(generated in {time.perf_counter() - started:.1f} s)")
+            for run in bench_scale(repo, stats["documents"], args.repeat, args.jobs):
+                run.update(scale=scale, spec=asdict(spec))
+                runs.append(run)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "jobs": args.jobs,
+        "runs": runs,
+    }
+    write_json(Path(args.output), results)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.update_baseline:
+        write_json(baseline_path, results)
+        print(f"📌 Baseline updated: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"ℹ️  No baseline at {baseline_path}; record one with --update-baseline "
+              f"(make bench-baseline)")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare(runs, baseline, args.threshold)
+    if regressions:
+        print(f"❌ Throughput regressed: {', '.join(regressions)}")
+        return 1
+    print("✅ No throughput regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
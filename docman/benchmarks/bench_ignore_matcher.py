@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Ignore Matcher Micro-Benchmark
+
+Compares the legacy per-call should_ignore_path implementation with the
+compiled IgnoreMatcher on a synthetic set of repo-relative paths.
+
+Usage:
+    python benchmarks/bench_ignore_matcher.py [--paths N] [--repeat N]
+"""
+
+import argparse
+import fnmatch
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import DocManConfig
+from utils import IgnoreMatcher
+
+
+def legacy_should_ignore_path(path: Path, ignore_patterns: Set[str]) -> bool:
+    """The should_ignore_path implementation DocMan shipped before IgnoreMatcher."""
+    path_str = str(path)
+
+    for part in path.parts:
+        if part in ignore_patterns:
+            return True
+        if f"{part}/" in ignore_patterns:
+            return True
+
+    for pattern in ignore_patterns:
+        if pattern.endswith('/'):
+            if f"/{pattern}" in f"/{path_str}/" or path_str.startswith(pattern[:-1]):
+                return True
+        elif '*' in pattern:
+            if fnmatch.fnmatch(path.name, pattern):
+                return True
+
+    return False
+
+
+def generate_paths(count: int, seed: int = 42) -> List[str]:
+    """Generate repo-relative paths with a realistic mix of ignored components."""
+    rng = random.Random(seed)
+    words = ["apps", "libs", "docs", "services", "api", "web", "guide", "utils",
+             "models", "config", "reference", "tutorials", "internal", "shared"]
+    ignored = ["node_modules", "venv", "__pycache__", ".git", "core"]
+    files = ["README.md", "guide.md", "notes.md", "CHANGELOG.md", "debug.log",
+             "scratch.tmp"]
+
+    paths = []
+    for _ in range(count):
+        depth = rng.randint(1, 6)
+        parts = [rng.choice(words) for _ in range(depth)]
+        if rng.random() < 0.1:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(ignored))
+        parts.append(rng.choice(files))
+        paths.append("/".join(parts))
+    return paths
+
+
+def time_it(label: str, func, paths, repeat: int) -> float:
+    """Run func over all paths `repeat` times and report the best wall time."""
+    best = float("inf")
+    ignored = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ignored = sum(1 for p in paths if func(p))
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<28} {best * 1000:9.1f} ms   ({ignored} ignored)")
+    return best
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description="Benchmark ignore-pattern matching")
+    parser.add_argument("--paths", type=int, default=100_000,
+                        help="Number of paths (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repetitions, best is kept (default: 3)")
+    args = parser.parse_args()
+
+    patterns = DocManConfig().ignore_patterns
+    paths = generate_paths(args.paths)
+    path_objects = [Path(p) for p in paths]
+
+    print(f"⏱️  Ignore matching on {len(paths)} paths, {len(patterns)} patterns")
+    legacy = time_it("legacy should_ignore_path",
+                     lambda p: legacy_should_ignore_path(p, patterns),
+                     path_objects, args.repeat)
+    matcher = IgnoreMatcher(patterns)
+    compiled = time_it("IgnoreMatcher.matches", matcher.matches, paths, args.repeat)
+
+    print(f"🚀 Speedup: {legacy / compiled:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,37 +7,90 @@ into any monorepo to validate and maintain documentation standards.
 
 Usage:
     python cli.py [OPTIONS] [REPO_PATH]
+    python cli.py serve [--config PATH] [--no-cache] [REPO_PATH]
+    python cli.py query [CONDITION] [--format text|json] [--order-by COLUMN]
+                        [--limit N] [--repo PATH]
+    python cli.py move OLD NEW [--dry-run] [--repo PATH]
 
 Options:
     --verbose, -v       Enable verbose output
     --fix              Batch auto-fix: create missing README files with confirmation
     --report           Generate detailed report
     --create-config    Create standardized .docmanrc.template with defaults
+    --no-cache         Do not use the on-disk parse cache (.docman-cache/)
+    --changed-since REF  Only validate docs changed since a git ref (and affected docs)
+    --staged           Only validate docs changed in the git index (pre-commit hooks)
+    --format FORMAT    Output format: text (default), json or ndjson (streamed records)
+    --file PATH        Validate only this file (repeatable) without walking or indexing
+    --stdin-file PATH  Validate stdin as if it were PATH (an unsaved editor buffer)
+    --stdin-json       Validate a JSON object {path: contents} on stdin instead
+    --jobs N, -j N     Validate files on N worker processes (default: CPU count)
+    --watch            Keep running and re-validate affected docs whenever files change
+    --check            Read-only: report index differences as violations, write nothing
+    --who-links-to PATH      List the links pointing at a document or directory
+    --impact-of-delete PATH  List the links that would break if PATH were deleted
+    --export-graph FORMAT    Print the doc-to-doc link graph as dot or json
+    --fix-links-after-rename Rewrite links to files renamed in git (see --staged)
+    --git-ref REF      Validate the tree of a git ref (no checkout); read-only
+    --git-dir PATH     Repository for --git-ref (e.g. a bare repository)
+    --archive PATH     Validate a tar/zip documentation bundle without extracting it
     --help, -h         Show this help message
 
 Examples:
     python cli.py                    # Check current directory
     python cli.py /path/to/repo      # Check specific repository
     python cli.py --verbose --fix    # Check with verbose output and auto-fix
+    python cli.py --changed-since origin/main   # Validate only what a PR touches
+    python cli.py --file docs/guide.md   # Validate a single document
+    python cli.py --stdin-file docs/guide.md < buffer.md   # Lint before saving
+    python cli.py --format ndjson    # Machine-readable records for CI and editors
+    python cli.py --watch            # Re-validate continuously while editing
+    python cli.py --check            # CI: fail if the index is stale, write nothing
+    python cli.py --git-ref "$newrev" --git-dir .   # pre-receive hook
+    python cli.py --archive dist/docs-bundle.tar.gz  # Gate a release on its bundle
+    python cli.py --impact-of-delete docs/old-api.md   # What breaks if it goes away
+    python cli.py move docs/setup.md docs/guide/setup.md   # Move a doc, fix links to it
+    python cli.py serve              # JSON-RPC validation daemon on stdio (for editors)
+    python cli.py query "status='🚫 Deprecated' and last_updated < '2025-01-01'"
 """
 
 import sys
 import os
+import json
+import time
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.config import load_config, create_config_template
-from src.utils import find_all_directories, find_all_markdown_files
+from src.scanner import RepoSnapshot, scan_repository
+from src.docfs import OverlayFS
+from src.git_changes import GitError, get_changes, find_files_linking_to
+from src.git_tree import GitTree
+from src.archive import ArchiveError, ArchiveTree
+from src.cache import ParseCache
+from src.catalog import QUERY_COLUMNS, CatalogError, DocumentCatalog
+from src.link_graph import GRAPH_FORMATS, LinkGraph, inbound_to_dicts
+from src.link_rewriter import LinkRewriter, move_path
+from src.corpus import DocumentCorpus
+from src.session import ValidationSession, merge_violations
+from src.watcher import PollingWatcher, create_watcher
+from src.parallel import ParallelValidator, default_jobs
+from src.server import DocManServer
 from src.indexer import DocumentationIndexer
-from src.reporter import Reporter, ValidationResult
+from src.reporter import Reporter, ValidationResult, Violation
 from src.validators.readme_validator import ReadmeValidator
 from src.validators.metadata_validator import MetadataValidator
 from src.validators.link_validator import LinkValidator
 from src.autofix import AutoFixer
+from src.utils import PhaseTimer
+
+# Wall-clock time per phase of the last run (read by benchmarks/bench_cli.py)
+PHASES = PhaseTimer()
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -85,11 +138,377 @@ def parse_arguments() -> argparse.Namespace:
         help="Path to configuration file (overrides search)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Only validate docs changed since a git ref (untracked ones included), "
+             "their parent/child READMEs and docs linking to deleted or renamed paths"
+    )
+
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Only validate docs changed in the git index (for pre-commit hooks)"
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=Reporter.OUTPUT_FORMATS,
+        default="text",
+        help="Output format: text summary (default), one JSON document, or NDJSON "
+             "records streamed as violations are found"
+    )
+
+    parser.add_argument(
+        "--file",
+        action="append",
+        metavar="PATH",
+        help="Validate only this markdown file (repeatable): metadata, links and "
+             "parent/child dates, without walking the repository or touching the index"
+    )
+
+    parser.add_argument(
+        "--stdin-file",
+        metavar="PATH",
+        help="Validate the contents read from stdin in place of PATH (which need not "
+             "exist yet), like --file; links resolve against the repository; nothing "
+             "is written"
+    )
+
+    parser.add_argument(
+        "--stdin-json",
+        action="store_true",
+        help="Batch form of --stdin-file: stdin is a JSON object mapping paths to "
+             "contents; links between the supplied documents see each other's "
+             "contents"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=default_jobs(),
+        metavar="N",
+        help="Worker processes for metadata and link validation on large repositories "
+             "(default: CPU count; 1 disables the pool)"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the first run, keep watching the repository and re-validate "
+             "changed docs, their parent/child READMEs and docs linking to them"
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="Polling interval for --watch when inotify is not available (default: 1.0)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk parse cache (.docman-cache/)"
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Read-only mode: compare the would-be DOCUMENTATION_INDEX.md with the "
+             "file on disk and report differences as violations; nothing is "
+             "written (parse cache included)"
+    )
+
+    parser.add_argument(
+        "--who-links-to",
+        metavar="PATH",
+        help="List every link pointing at a document or directory, answered from the "
+             "link graph recorded by the last run (no validation)"
+    )
+
+    parser.add_argument(
+        "--impact-of-delete",
+        metavar="PATH",
+        help="List the links that would break if a document or directory were deleted "
+             "(from the link graph recorded by the last run)"
+    )
+
+    parser.add_argument(
+        "--export-graph",
+        choices=GRAPH_FORMATS,
+        metavar="FORMAT",
+        help="Print the doc-to-doc link graph as Graphviz dot or json adjacency lists"
+    )
+
+    parser.add_argument(
+        "--fix-links-after-rename",
+        action="store_true",
+        help="Before validating, rewrite links to documents renamed in git (working "
+             "tree vs HEAD, or vs --changed-since REF, or the index with --staged)"
+    )
+
+    parser.add_argument(
+        "--git-ref",
+        metavar="REF",
+        help="Validate the documentation of a commit without a checkout: the tree "
+             "is listed once and markdown blobs are streamed from git; implies "
+             "--check"
+    )
+
+    parser.add_argument(
+        "--git-dir",
+        metavar="PATH",
+        help="Git directory for --git-ref (works with bare repositories)"
+    )
+
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        help="Validate a documentation bundle (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz "
+             "or .zip) without extracting it: members are streamed once; implies "
+             "--check"
+    )
+
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.git_dir and not args.git_ref:
+        parser.error("--git-dir requires --git-ref")
+    for option in ("git_ref", "archive"):
+        if getattr(args, option) and (
+                args.file or args.changed_since or args.staged or args.watch
+                or args.fix or args.fix_links_after_rename):
+            flag = "--" + option.replace('_', '-')
+            parser.error(f"{flag} cannot be combined with --file, "
+                         "--changed-since, --staged, --watch, --fix or "
+                         "--fix-links-after-rename")
+    if args.git_ref and args.archive:
+        parser.error("--git-ref and --archive are mutually exclusive")
+    if args.stdin_file and args.stdin_json:
+        parser.error("--stdin-file and --stdin-json are mutually exclusive")
+    if (args.stdin_file or args.stdin_json) and (
+            args.file or args.changed_since or args.staged or args.watch or args.fix
+            or args.fix_links_after_rename or args.git_ref or args.archive):
+        parser.error("--stdin-file/--stdin-json cannot be combined with --file, "
+                     "--changed-since, --staged, --watch, --fix, "
+                     "--fix-links-after-rename, --git-ref or --archive")
+    return args
+
+
+def serve(argv) -> int:
+    """Run the JSON-RPC validation daemon on stdin/stdout."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py serve",
+        description="DocMan validation daemon (JSON-RPC 2.0 over stdio)"
+    )
+    parser.add_argument("repo_path", nargs="?", default=".",
+                        help="Path to repository root (default: current directory)")
+    parser.add_argument("--config", type=str,
+                        help="Path to configuration file (overrides search)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not read or write the on-disk parse cache "
+                             "(.docman-cache/)")
+    args = parser.parse_args(argv)
+
+    if args.config:
+        os.environ['DOCMAN_CONFIG'] = args.config
+    config = load_config()
+    repo_path = Path(args.repo_path).resolve()
+
+    # stdout carries the protocol; anything printed by components goes to stderr
+    protocol_out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    cache = None if args.no_cache else ParseCache.for_config(repo_path, config)
+    try:
+        session = ValidationSession(repo_path, config, cache=cache)
+        return DocManServer(session, sys.stdin.buffer, protocol_out).serve()
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def query(argv) -> int:
+    """Answer a query against the documentation catalog built by the last run."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py query",
+        description="Query the documentation catalog (.docman-cache/catalog.sqlite). "
+                    "CONDITION is an SQL expression over the columns "
+                    f"{', '.join(QUERY_COLUMNS)}; subqueries may use the links "
+                    "(source, target, line, kind, resolved) and headings "
+                    "(path, level, text, slug, line) tables."
+    )
+    parser.add_argument("condition", nargs="?", default="",
+                        help="e.g. \"status='🚫 Deprecated' and last_updated < "
+                             "'2025-01-01'\" (default: all documents)")
+    parser.add_argument("--repo", default=".", metavar="PATH",
+                        help="Path to repository root (default: current directory)")
+    parser.add_argument("--format", choices=("text", "json"), default="text",
+                        help="Output format: one line per document (default) "
+                             "or a JSON array")
+    parser.add_argument("--order-by", choices=QUERY_COLUMNS, default="path",
+                        help="Sort column (default: path)")
+    parser.add_argument("--limit", type=int, metavar="N",
+                        help="Return at most N documents")
+    args = parser.parse_args(argv)
+
+    try:
+        catalog = DocumentCatalog(Path(args.repo).resolve(), read_only=True)
+        try:
+            rows = catalog.query(args.condition, order_by=args.order_by,
+                                 limit=args.limit)
+        finally:
+            catalog.close()
+    except CatalogError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        json.dump(rows, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for row in rows:
+            print(f"{row['path']} – {row['status'] or '-'} – {row['version'] or '-'} – "
+                  f"{row['last_updated'] or '-'}")
+    return 0
+
+
+def move(argv) -> int:
+    """Move a document or directory and rewrite every link affected by the move."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py move",
+        description="Move a markdown file or directory inside the repository and "
+                    "rewrite the relative links pointing into it (and out of it) in a "
+                    "single pass."
+    )
+    parser.add_argument("old", help="Existing file or directory (relative to --repo)")
+    parser.add_argument("new",
+                        help="Destination path, relative to --repo (must not exist)")
+    parser.add_argument("--repo", default=".", metavar="PATH",
+                        help="Path to repository root (default: current directory)")
+    parser.add_argument("--config", type=str,
+                        help="Path to configuration file (overrides search)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only list the links that would be rewritten")
+    args = parser.parse_args(argv)
+
+    if args.config:
+        os.environ['DOCMAN_CONFIG'] = args.config
+    config = load_config()
+    repo_path = Path(args.repo).resolve()
+
+    moves = {}
+    for name in (args.old, args.new):
+        # Relative paths are taken from the repository, not from the working directory
+        path = (repo_path / name).resolve()
+        try:
+            moves[name] = path.relative_to(repo_path).as_posix()
+        except ValueError:
+            print(f"❌ {name} is outside the repository {repo_path}")
+            return 1
+    old, new = moves[args.old], moves[args.new]
+    if not (repo_path / old).exists():
+        print(f"❌ Not found: {args.old}")
+        return 1
+    if (repo_path / new).exists():
+        print(f"❌ Destination already exists: {args.new}")
+        return 1
+
+    with open_link_tools(repo_path, config) as (indexer, catalog):
+        rewriter = LinkRewriter(repo_path, catalog, {old: new}, fs=indexer.fs)
+        edits = rewriter.plan()
+        print_link_edits(edits, dry_run=args.dry_run)
+        if args.dry_run:
+            return 0
+
+        files, links = rewriter.apply(edits)
+        move_path(repo_path, old, new)
+        print(f"📦 Moved {old} → {new}; rewrote {links} links in {files} files")
+
+        indexer.snapshot = scan_repository(repo_path, config.ignore_patterns)
+        if indexer.index_file.exists():
+            # The moved documents get their new index entries (the catalog is
+            # synced on the way)
+            indexer.update_index([])
+        else:
+            indexer.sync_catalog()
+    return 0
+
+
+@contextmanager
+def open_link_tools(repo_path: Path, config):
+    """
+    An indexer with an up-to-date, writable catalog, for link rewriting (both
+    closed on exit).
+    """
+    cache = ParseCache.for_config(repo_path, config)
+    catalog = DocumentCatalog(repo_path)
+    try:
+        snapshot = scan_repository(repo_path, config.ignore_patterns)
+        indexer = DocumentationIndexer(repo_path, config.ignore_patterns,
+                                       snapshot=snapshot, cache=cache, catalog=catalog,
+                                       shard_depth=config.index_shard_depth,
+                                       shard_threshold=config.index_shard_threshold)
+        # Only documents changed since the last run are re-read
+        indexer.sync_catalog()
+        yield indexer, catalog
+    finally:
+        catalog.close()
+        if cache is not None:
+            cache.close()
+
+
+def print_link_edits(edits, dry_run: bool = False) -> None:
+    """List planned link rewrites, one line per link."""
+    count = sum(len(file_edits) for file_edits in edits.values())
+    verb = "Would rewrite" if dry_run else "Rewriting"
+    print(f"🔗 {verb} {count} links in {len(edits)} files")
+    for current, file_edits in edits.items():
+        for edit in file_edits:
+            print(f"  • {current}:{edit.line}: {edit.old} → {edit.new}")
+
+
+def fix_links_after_rename(args: argparse.Namespace, config, repo_path: Path) -> int:
+    """Rewrite links to documents renamed in git; returns 1 if git cannot be queried."""
+    since = None if args.staged else (args.changed_since or "HEAD")
+    try:
+        changes = get_changes(repo_path, since=since, staged=args.staged)
+    except GitError as e:
+        print(f"❌ Could not determine renamed files: {e}")
+        return 1
+    if changes.deleted:
+        # Moves that were also edited are only detected once git sees both sides
+        # in the index
+        print(f"⚠️  {len(changes.deleted)} deleted files were not matched to a rename "
+              "(stage moved and edited files with `git add -A` so git can detect "
+              "them): "
+              f"{', '.join(path.as_posix() for path in changes.deleted)}")
+    if not changes.renamed:
+        if args.verbose or config.verbose_output:
+            print("🔀 No renamed files")
+        return 0
+
+    renames = {old.as_posix(): new.as_posix() for old, new in changes.renamed.items()}
+    with open_link_tools(repo_path, config) as (indexer, catalog):
+        rewriter = LinkRewriter(repo_path, catalog, renames, fs=indexer.fs)
+        moved_files = [new for new in renames.values() if new.endswith('.md')]
+        edits = rewriter.plan(moved_files=moved_files, already_moved=True)
+        files, links = rewriter.apply(edits)
+    print(f"🔀 {len(renames)} renamed files: rewrote {links} links in {files} files")
+    return 0
 
 
 def main() -> int:
     """Main entry point for DocMan CLI."""
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        return serve(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "query":
+        return query(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "move":
+        return move(sys.argv[2:])
+
     args = parse_arguments()
 
     # Handle config template creation
@@ -100,12 +519,6 @@ def main() -> int:
         print("💡 Copy to .docmanrc in your project root and customize as needed")
         return 0
 
-    # Initialize auto-fixer if needed
-    auto_fixer = None
-    if args.fix:
-        # We'll initialize this after loading config
-        pass
-
     # Load configuration with optional override
     if args.config:
         os.environ['DOCMAN_CONFIG'] = args.config
@@ -113,12 +526,324 @@ def main() -> int:
 
     # Initialize components
     repo_path = Path(args.repo_path).resolve()
-    reporter = Reporter(verbose=args.verbose or config.verbose_output)
-    indexer = DocumentationIndexer(repo_path, config.ignore_patterns)
+    if args.who_links_to or args.impact_of_delete or args.export_graph:
+        return run_graph_query(args, repo_path)
+    if args.format == "text":
+        reporter = Reporter(verbose=args.verbose or config.verbose_output)
+    else:
+        if args.watch:
+            print("❌ --watch only supports --format text")
+            return 1
+        # Records own stdout; progress and verbose messages go to stderr
+        reporter = Reporter(verbose=args.verbose or config.verbose_output,
+                            output_format=args.format, stream=sys.stdout)
+        sys.stdout = sys.stderr
+
+    if args.check and (args.fix or args.watch or args.fix_links_after_rename):
+        print("❌ --check cannot be combined with --fix, --fix-links-after-rename "
+              "or --watch")
+        return 1
+
+    if args.fix_links_after_rename:
+        status = fix_links_after_rename(args, config, repo_path)
+        if status:
+            return status
+
+    # Step 1: Walk the repository once; every phase below shares this snapshot.
+    # In incremental git modes the snapshot only covers the affected paths.
+    PHASES.reset()
+    PHASES.start("scan")
+    removed_paths = []
+    if args.file:
+        if args.changed_since or args.staged or args.watch or args.fix:
+            print("❌ --file cannot be combined with --changed-since, --staged, "
+                  "--watch or --fix")
+            return 1
+        files = resolve_file_arguments(args.file, repo_path)
+        if files is None:
+            return 1
+        # Only the files' own directories are listed
+        snapshot = RepoSnapshot.from_paths(repo_path, config.ignore_patterns,
+                                           files=files)
+        for skipped in sorted(set(files) - set(snapshot.markdown_files)):
+            print(f"⚠️  Skipping {skipped.relative_to(repo_path)}: "
+                  "not a markdown file or ignored")
+    elif args.stdin_file or args.stdin_json:
+        buffers = read_stdin_buffers(args, repo_path)
+        if buffers is None:
+            return 1
+        # The buffers shadow the files on disk; nothing is written
+        args.check = True
+        fs = OverlayFS(buffers)
+        snapshot = RepoSnapshot.from_paths(repo_path, config.ignore_patterns,
+                                           files=buffers, fs=fs)
+        for skipped in sorted(set(buffers) - set(snapshot.markdown_files)):
+            print(f"⚠️  Skipping {skipped.relative_to(repo_path)}: "
+                  "not a markdown file or ignored")
+        if args.verbose or config.verbose_output:
+            print(f"📝 Validating {len(snapshot.markdown_files)} unsaved documents")
+    elif args.changed_since or args.staged:
+        try:
+            changes = get_changes(repo_path, since=args.changed_since,
+                                  staged=args.staged)
+            linking_files = find_files_linking_to(repo_path, changes.removed_paths)
+        except GitError as e:
+            print(f"❌ Could not determine changed files: {e}")
+            return 1
+
+        removed_paths = changes.removed_paths
+        snapshot = RepoSnapshot.from_paths(repo_path, config.ignore_patterns,
+                                           files=changes.changed + linking_files,
+                                           directories=changes.touched_directories)
+        if args.verbose or config.verbose_output:
+            source = ("staged changes" if args.staged
+                      else f"changes since {args.changed_since}")
+            print(f"🔀 Incremental mode ({source}): "
+                  f"{len(snapshot.markdown_files)} documents, "
+                  f"{len(removed_paths)} removed paths")
+    elif args.git_ref:
+        try:
+            git_dir = Path(args.git_dir).resolve() if args.git_dir else None
+            tree = GitTree(repo_path, args.git_ref, git_dir=git_dir)
+        except GitError as e:
+            print(f"❌ Could not read {args.git_ref}: {e}")
+            return 1
+        # A commit can only be checked, never fixed
+        args.check = True
+        snapshot = tree.snapshot(config.ignore_patterns)
+        if args.verbose or config.verbose_output:
+            print(f"🌳 Validating {args.git_ref}: {len(tree.blobs)} files, "
+                  f"{len(snapshot.markdown_files)} documents")
+    elif args.archive:
+        try:
+            tree = ArchiveTree(Path(args.archive).resolve(), config.ignore_patterns)
+        except (ArchiveError, OSError) as e:
+            print(f"❌ Could not read archive {args.archive}: {e}")
+            return 1
+        args.check = True
+        # Paths are reported relative to the bundle's root
+        repo_path = tree.root
+        snapshot = tree.snapshot()
+        if args.verbose or config.verbose_output:
+            print(f"📦 Validating {args.archive}: {len(tree.files)} files, "
+                  f"{len(snapshot.markdown_files)} documents, "
+                  f"largest {tree.largest // 1024} KB")
+    else:
+        snapshot = scan_repository(repo_path, config.ignore_patterns)
+
+    # Parsed documents are shared across runs through the on-disk cache, and
+    # across the phases of this run through the in-memory corpus
+    if args.git_ref or args.archive:
+        # Contents come from git or the archive, never from disk, and the cache
+        # is keyed by file stats; archive members were already parsed while
+        # streaming
+        cache = None
+        loader = tree if args.archive else None
+        corpus = DocumentCorpus.for_config(None, config, fs=tree, loader=loader)
+    else:
+        cache = (None if args.no_cache
+                 else ParseCache.for_config(repo_path, config, read_only=args.check,
+                                            fs=snapshot.fs))
+        corpus = DocumentCorpus.for_config(cache, config, fs=snapshot.fs)
+    # The catalog lives next to the parse cache and is only written by full and
+    # incremental runs
+    catalog = None
+    if not (args.no_cache or args.check or args.file or args.watch):
+        catalog = DocumentCatalog.for_config(repo_path, config, fs=snapshot.fs)
+    try:
+        if args.file or args.stdin_file or args.stdin_json:
+            return run_file_validation(config, repo_path, reporter, snapshot, corpus)
+        if args.watch:
+            if not snapshot.complete:
+                print("❌ --watch cannot be combined with --changed-since or --staged")
+                return 1
+            results = ValidationResult(missing_readmes=[], metadata_violations=[],
+                                       broken_links=[], date_bumps=[],
+                                       new_index_entries=[])
+            run_validation(args, config, repo_path, reporter, snapshot, corpus,
+                           removed_paths, results=results)
+            # The session keeps the parsed documents in memory for the whole
+            # watch; it is created after the first pass because it lists the
+            # snapshot through its overlay
+            session = ValidationSession(repo_path, config, cache=cache,
+                                        snapshot=snapshot, corpus=corpus)
+            return watch(args, session, results.violations)
+        return run_validation(args, config, repo_path, reporter, snapshot, corpus,
+                              removed_paths, catalog)
+    finally:
+        PHASES.start("close")
+        if args.git_ref:
+            tree.close()
+        if args.verbose or config.verbose_output:
+            stats = corpus.stats()
+            print(f"🧠 Document corpus: {stats['misses']} documents read, "
+                  f"{stats['hits']} reuses, {stats['evictions']} evictions")
+        if cache is not None:
+            if args.verbose or config.verbose_output:
+                stats = cache.stats()
+                print(f"💾 Parse cache: {stats['hits']} hits, {stats['misses']} misses")
+            cache.close()
+        if catalog is not None:
+            if args.verbose or config.verbose_output:
+                print(f"🗂️  Catalog: {catalog.updated} documents updated, "
+                      f"{catalog.removed} removed")
+            catalog.close()
+        PHASES.stop()
+
+
+def run_graph_query(args: argparse.Namespace, repo_path: Path) -> int:
+    """
+    Answer --who-links-to, --impact-of-delete and --export-graph from the
+    persisted link graph.
+    """
+    try:
+        catalog = DocumentCatalog(repo_path, read_only=True)
+    except CatalogError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    try:
+        graph = LinkGraph(catalog)
+        if args.export_graph:
+            sys.stdout.write(graph.export(args.export_graph))
+            return 0
+
+        path = graph.repo_path(args.who_links_to or args.impact_of_delete)
+        if args.who_links_to:
+            links = graph.who_links_to(path)
+            heading = f"🔗 {len(links)} links to {path}"
+        else:
+            links = graph.impact_of_delete(path)
+            sources = len({link.source for link in links})
+            heading = (f"💥 Deleting {path} would break {len(links)} links "
+                       f"in {sources} documents")
+
+        if args.format == "json":
+            print(json.dumps(inbound_to_dicts(links), ensure_ascii=False, indent=2))
+        elif args.format == "ndjson":
+            for record in inbound_to_dicts(links):
+                print(json.dumps(record, ensure_ascii=False))
+        else:
+            print(heading)
+            for link in links:
+                print(f"  • {link.source}:{link.line}: {link.link}")
+        return 0
+    finally:
+        catalog.close()
+
+
+def stream_violations(reporter: Reporter,
+                      violations: Iterable[Violation]) -> List[Violation]:
+    """Hand each violation to the reporter as soon as it is found and collect them."""
+    records = []
+    for violation in violations:
+        reporter.emit(violation)
+        records.append(violation)
+    return records
+
+
+def resolve_file_arguments(names, repo_path: Path) -> Optional[list]:
+    """Resolve --file arguments to absolute paths in the repository (None on error)."""
+    files = []
+    for name in names:
+        path = Path(name).resolve()
+        if not path.is_file():
+            print(f"❌ File not found: {name}")
+            return None
+        try:
+            path.relative_to(repo_path)
+        except ValueError:
+            print(f"❌ {name} is outside the repository {repo_path}")
+            return None
+        files.append(path)
+    return files
+
+
+def read_stdin_buffers(args: argparse.Namespace,
+                       repo_path: Path) -> Optional[Dict[Path, bytes]]:
+    """
+    Read --stdin-file / --stdin-json contents: absolute path inside the
+    repository -> bytes (None on error). Paths are resolved like --file.
+    """
+    if args.stdin_file:
+        raw = {args.stdin_file: sys.stdin.buffer.read()}
+    else:
+        try:
+            raw = json.load(sys.stdin.buffer)
+        except ValueError as e:
+            print(f"❌ Invalid JSON on stdin: {e}")
+            return None
+        if (not isinstance(raw, dict)
+                or not all(isinstance(v, str) for v in raw.values())):
+            print("❌ --stdin-json expects a JSON object mapping paths to file contents")
+            return None
+
+    buffers = {}
+    for name, content in raw.items():
+        path = Path(name).resolve()
+        try:
+            path.relative_to(repo_path)
+        except ValueError:
+            print(f"❌ {name} is outside the repository {repo_path}")
+            return None
+        buffers[path] = content.encode('utf-8') if isinstance(content, str) else content
+    return buffers
+
+
+def run_file_validation(config, repo_path: Path, reporter: Reporter,
+                        snapshot: RepoSnapshot, corpus) -> int:
+    """
+    Validate only the documents of a partial snapshot: metadata, links and
+    parent/child dates. Link targets are checked with one stat each and the
+    index is never read or written, so latency depends on the file count only.
+    """
+    files = snapshot.markdown_files
+    metadata_validator = MetadataValidator(repo_path, config.ignore_patterns, config,
+                                           snapshot=snapshot, cache=corpus)
+    link_validator = LinkValidator(repo_path, config.ignore_patterns, snapshot=snapshot,
+                                   cache=corpus)
+    readmes = [f for f in files if f.name == "README.md"]
+
+    metadata_records = stream_violations(reporter,
+                                         metadata_validator.iter_violations(files))
+    link_records = stream_violations(reporter,
+                                     link_validator.iter_link_violations(files))
+    date_records = stream_violations(reporter,
+                                     link_validator.collect_date_violations(readmes))
+
+    results = ValidationResult(
+        missing_readmes=[],
+        metadata_violations=[v.format() for v in metadata_records],
+        broken_links=[v.format() for v in link_records],
+        date_bumps=[v.format() for v in date_records],
+        new_index_entries=[],
+        violations=metadata_records + link_records + date_records
+    )
+    return reporter.print_summary(results)
+
+
+def run_validation(args: argparse.Namespace, config, repo_path: Path,
+                   reporter: Reporter, snapshot: RepoSnapshot, corpus, removed_paths=(),
+                   catalog=None, results: Optional[ValidationResult] = None) -> int:
+    """
+    Run all validation phases against a (full or partial) repository snapshot.
+
+    Every phase loads documents through `corpus` (the run's DocumentCorpus, or
+    the watch session), so each file is read at most once, and every read or
+    write goes through the snapshot's DocFS. The indexer keeps `catalog` (if
+    any) in sync with the index. The findings are collected in `results`
+    when one is passed (watch mode starts from them).
+    """
+    auto_fixer = None
+    indexer = DocumentationIndexer(repo_path, config.ignore_patterns,
+                                   snapshot=snapshot, cache=corpus,
+                                   shard_depth=config.index_shard_depth,
+                                   shard_threshold=config.index_shard_threshold,
+                                   catalog=catalog)
 
     # Initialize auto-fixer if --fix option is used
     if args.fix:
-        auto_fixer = AutoFixer(repo_path, config)
+        auto_fixer = AutoFixer(repo_path, config, fs=snapshot.fs)
 
     if args.verbose or config.verbose_output:
         print(f"🔍 Analyzing repository: {repo_path}")
@@ -133,21 +858,25 @@ def main() -> int:
         print(f"📋 Using ignore patterns: {sorted(config.ignore_patterns)}")
     
     # Initialize validation results
-    results = ValidationResult(
-        missing_readmes=[],
-        metadata_violations=[],
-        broken_links=[],
-        date_bumps=[],
-        new_index_entries=[]
-    )
+    if results is None:
+        results = ValidationResult(
+            missing_readmes=[],
+            metadata_violations=[],
+            broken_links=[],
+            date_bumps=[],
+            new_index_entries=[]
+        )
     
     # Step 2: README Presence Validation
+    PHASES.start("readme")
     verbose = args.verbose or config.verbose_output
     if verbose:
         print("📋 Checking README presence...")
 
-    readme_validator = ReadmeValidator(repo_path, config.ignore_patterns)
-    readme_violations = readme_validator.validate()
+    readme_validator = ReadmeValidator(repo_path, config.ignore_patterns,
+                                       snapshot=snapshot)
+    readme_records = stream_violations(reporter, readme_validator.collect_violations())
+    readme_violations = [v.format() for v in readme_records]
     results.missing_readmes = readme_violations
 
     if verbose and readme_violations:
@@ -158,21 +887,43 @@ def main() -> int:
     # Apply auto-fixes if requested
     if args.fix and auto_fixer and readme_violations:
         print("\n🔧 Auto-fix: Creating missing README files...")
-        missing_dirs = auto_fixer.get_missing_readme_directories(readme_violations)
+        missing_dirs = auto_fixer.get_missing_readme_directories(readme_records)
         created_count = auto_fixer.fix_missing_readmes(missing_dirs, interactive=True)
 
         if created_count > 0:
-            # Re-run README validation to update results
-            readme_violations = readme_validator.validate()
+            # Record the new READMEs in the snapshot and re-run README validation
+            readmes = (d / "README.md" for d in missing_dirs)
+            snapshot.add_paths(path for path in readmes if snapshot.fs.exists(path))
+            readme_records = readme_validator.collect_violations()
+            readme_violations = [v.format() for v in readme_records]
             results.missing_readmes = readme_violations
             print(f"📊 Updated validation: {len(readme_violations)} missing READMEs remaining")
 
+    # Per-file metadata and link checks run on a process pool for large repositories
+    use_pool = False
+    if not args.watch and not snapshot.virtual:
+        # Later phases reuse the documents parsed by the workers through the corpus
+        parallel = ParallelValidator(repo_path, config, jobs=args.jobs,
+                                     cache=corpus.cache, snapshot=snapshot,
+                                     corpus=corpus)
+        use_pool = parallel.should_run(len(snapshot.markdown_files))
+    if use_pool:
+        PHASES.start("parallel")
+        if verbose:
+            print(f"⚙️  Validating {len(snapshot.markdown_files)} documents with "
+                  f"{parallel.jobs} worker processes...")
+        pooled_metadata, pooled_links = parallel.validate(snapshot.markdown_files)
+
     # Step 3: Metadata Format Enforcement
+    PHASES.start("metadata")
     if verbose:
         print("📋 Checking metadata format...")
 
-    metadata_validator = MetadataValidator(repo_path, config.ignore_patterns, config)
-    metadata_violations = metadata_validator.validate()
+    metadata_validator = MetadataValidator(repo_path, config.ignore_patterns, config,
+                                           snapshot=snapshot, cache=corpus)
+    metadata_records = stream_violations(
+        reporter, pooled_metadata if use_pool else metadata_validator.iter_violations())
+    metadata_violations = [v.format() for v in metadata_records]
     results.metadata_violations = metadata_violations
 
     if verbose and metadata_violations:
@@ -181,11 +932,18 @@ def main() -> int:
             print(f"  {violation}")
 
     # Step 4: Link & Date Integrity
+    PHASES.start("links")
     if verbose:
         print("🔗 Checking link integrity and date consistency...")
 
-    link_validator = LinkValidator(repo_path, config.ignore_patterns)
-    link_violations, date_issues = link_validator.validate()
+    link_validator = LinkValidator(repo_path, config.ignore_patterns, snapshot=snapshot,
+                                   cache=corpus)
+    link_records = stream_violations(
+        reporter, pooled_links if use_pool else link_validator.iter_link_violations())
+    PHASES.start("dates")
+    date_records = stream_violations(reporter, link_validator.collect_date_violations())
+    link_violations = [v.format() for v in link_records]
+    date_issues = [v.format() for v in date_records]
     results.broken_links = link_violations
     results.date_bumps = date_issues  # Note: these are reports, not actual bumps
 
@@ -200,37 +958,116 @@ def main() -> int:
                 print(f"  {issue}")
 
     # Step 5: Index Management
+    PHASES.start("index")
     if verbose:
         print("📚 Managing documentation index...")
 
-    # Find all markdown files for indexing (using config ignore patterns)
-    all_md_files = find_all_markdown_files(repo_path, config.ignore_patterns)
+    # Markdown files for indexing come from the shared snapshot
+    all_md_files = snapshot.markdown_files
     missing_from_index = indexer.find_missing_entries(all_md_files)
 
-    # Update index if there are missing entries
     new_entries_count = 0
-    if missing_from_index:
-        if verbose:
-            print(f"Found {len(missing_from_index)} files missing from index:")
-            for missing_file in missing_from_index:
-                relative_path = missing_file.relative_to(repo_path)
-                print(f"  {relative_path}")
+    if verbose and missing_from_index:
+        print(f"Found {len(missing_from_index)} files missing from index:")
+        for missing_file in missing_from_index:
+            relative_path = missing_file.relative_to(repo_path)
+            print(f"  {relative_path}")
 
+    if args.check:
+        # The would-be index is rendered in memory and compared; nothing is written
+        if snapshot.complete:
+            index_records = indexer.check_index(missing_from_index)
+        else:
+            index_records = indexer.check_entries(snapshot.markdown_files,
+                                                  removed_paths)
+        index_records = stream_violations(reporter, index_records)
+        results.index_checked = True
+        results.index_drift = [v.format() for v in index_records]
+        results.violations = (readme_records + metadata_records + link_records
+                              + date_records + index_records)
+        PHASES.start("report")
+        return reporter.print_summary(results)
+
+    if snapshot.complete:
+        # Adds missing entries and refreshes changed ones; the file is only written
+        # when it differs
         new_entries_count = indexer.update_index(missing_from_index)
         if verbose and new_entries_count > 0:
             print(f"Added {new_entries_count} entries to DOCUMENTATION_INDEX.md")
 
+    if not snapshot.complete and (snapshot.markdown_files or removed_paths):
+        # Incremental: patch only the entries of the affected and removed documents
+        new_entries_count = indexer.update_entries(snapshot.markdown_files,
+                                                   removed_paths)
+        if verbose and new_entries_count > 0:
+            print(f"Added {new_entries_count} entries to DOCUMENTATION_INDEX.md")
+
     # Create summary entries for reporting
     index_entries = []
     for missing_file in missing_from_index:
         relative_path = missing_file.relative_to(repo_path)
         index_entries.append(f"✅ Added {relative_path} to index")
+        results.index_files.append(str(relative_path))
 
     results.new_index_entries = index_entries
+    results.violations = readme_records + metadata_records + link_records + date_records
     
     # Generate report and return exit code
+    PHASES.start("report")
     return reporter.print_summary(results)
 
 
+def watch(args: argparse.Namespace, session: ValidationSession,
+          violations: List[Violation]) -> int:
+    """
+    Re-validate affected documents whenever files change, streaming a summary
+    per batch. `violations` is the result of the initial full pass.
+    """
+    watcher = create_watcher(session.snapshot, poll_interval=args.poll_interval)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    print(f"\n👀 Watching {session.repo_root} ({mode}), press Ctrl+C to stop")
+    sys.stdout.flush()
+
+    try:
+        while True:
+            changed = watcher.next_batch()
+            started = time.perf_counter()
+
+            if watcher.overflowed:
+                # Events were dropped by the kernel: fall back to a full pass
+                watcher.overflowed = False
+                session.rescan()
+                fresh = violations = session.validate_workspace()
+                checked = len(session.snapshot.markdown_files)
+            else:
+                files, directories = session.apply_changes(changed)
+                fresh = session.validate_files(files, directories)
+                violations = merge_violations(violations, fresh, session.repo_root,
+                                              list(changed) + files + directories)
+                checked = len(files)
+            watcher.sync()
+            if session.cache is not None:
+                session.cache.commit()
+
+            elapsed = (time.perf_counter() - started) * 1000
+            errors = sum(1 for v in violations if v.severity == "error")
+            warnings = len(violations) - errors
+            print(f"\n🔄 {time.strftime('%H:%M:%S')} {len(changed)} changed paths, "
+                  f"re-validated {checked} docs in {elapsed:.1f} ms")
+            for violation in fresh:
+                print(f"  {violation.format()}")
+            if errors == 0 and warnings == 0:
+                print("✅ All documentation checks passed")
+            else:
+                print(f"📊 {errors} issues, {warnings} warnings in the repository")
+            sys.stdout.flush()
+
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+        return 0
+    finally:
+        watcher.close()
+
+
 if __name__ == "__main__":
     sys.exit(main())
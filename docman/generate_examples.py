@@ -4,12 +4,30 @@ Example Structure Generator for DocMan
 
 This script generates the example repository structure used for testing and demonstration.
 The examples are not committed to git to keep the tool clean.
+
+With --synthetic it instead generates a seeded monorepo of any size (directory
+count, depth, fan-out, docs per directory, link density, broken-link and
+metadata-error rates, document sizes, ignored subtrees), used by
+benchmarks/bench_cli.py.
+
+Usage:
+    python generate_examples.py
+    python generate_examples.py --synthetic [--output DIR] [--dirs N] [--depth N]
+        [--fan-out N] [--docs-per-dir N] [--link-density X] [--broken-link-rate X]
+        [--metadata-error-rate X] [--size-distribution fixed|uniform|lognormal]
+        [--doc-size BYTES] [--ignored-share X] [--seed N]
 """
 
+import argparse
+import math
 import os
+import posixpath
+import random
+import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 def create_directory_structure():
     """Create the basic directory structure"""
@@ -402,8 +420,308 @@ This file contains links to all documentation in the repository.
         f.write(index_content)
     print(f"✅ Created index file: {index_file}")
 
+
+# Synthetic monorepos for benchmarks
+
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+DIRECTORY_WORDS = ["apps", "libs", "services", "docs", "tools", "packages", "api",
+                   "web", "models", "config", "guides", "reference", "internal",
+                   "shared", "infra"]
+# Ignored by the default configuration
+IGNORED_DIRECTORY_NAMES = ["node_modules", "venv"]
+# Written into every generated tree; only directories carrying it are ever replaced
+SYNTHETIC_MARKER = ".docman-synthetic"
+VALID_STATUSES = ["✅ Production Ready", "🚧 Draft", "🚫 Deprecated", "⚠️ Experimental",
+                  "🔄 In Progress"]
+FILLER_WORDS = ("documentation module service release version index link anchor "
+                "section repository package library deploy configure monitor pipeline "
+                "schema request response cache latency throughput review owner "
+                "migration contract").split()
+
+
+@dataclass
+class SyntheticSpec:
+    """Shape of a generated monorepo; the same spec always generates the same tree."""
+    directories: int = 100        # directories besides the root, ignored ones included
+    depth: int = 4                # maximum nesting below the root
+    fan_out: int = 8              # maximum subdirectories per directory
+    docs_per_dir: int = 3         # README.md plus topic_N.md files
+    link_density: float = 3.0     # average links per document
+    broken_link_rate: float = 0.02
+    metadata_error_rate: float = 0.05
+    size_distribution: str = "lognormal"
+    doc_size: int = 2048          # bytes: median (lognormal), mean (uniform) or exact
+    ignored_share: float = 0.1    # share of the directories inside ignored subtrees
+    seed: int = 42
+
+    @property
+    def ignored_directories(self) -> int:
+        return round(self.directories * self.ignored_share)
+
+    def validate(self):
+        """Raise ValueError if the spec cannot be generated."""
+        if (self.directories < 0 or self.depth < 1 or self.fan_out < 1
+                or self.docs_per_dir < 1):
+            raise ValueError("--dirs must be >= 0 and --depth, --fan-out and "
+                             "--docs-per-dir >= 1")
+        for name in ("broken_link_rate", "metadata_error_rate", "ignored_share"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"--{name.replace('_', '-')} must be between 0 and 1")
+        if self.link_density < 0 or self.doc_size < 1:
+            raise ValueError("--link-density must be >= 0 and --doc-size >= 1")
+        if self.size_distribution not in SIZE_DISTRIBUTIONS:
+            raise ValueError(f"--size-distribution must be one of "
+                             f"{', '.join(SIZE_DISTRIBUTIONS)}")
+        documented = self.directories - self.ignored_directories
+        capacity = sum(self.fan_out ** level for level in range(1, self.depth + 1))
+        if documented > capacity:
+            raise ValueError(f"{documented} directories do not fit in depth "
+                             f"{self.depth} with fan-out {self.fan_out} "
+                             f"(at most {capacity})")
+
+
+def build_directory_tree(spec: SyntheticSpec, rng: random.Random) -> List[str]:
+    """
+    Repo-relative documented directories ('' is the root), each under a random
+    parent with room.
+    """
+    count = spec.directories - spec.ignored_directories
+    directories = [""]
+    # [path, depth, children] of every directory that can still take a child
+    open_parents = [["", 0, 0]]
+    while len(directories) <= count:
+        slot = rng.randrange(len(open_parents))
+        parent = open_parents[slot]
+        path = posixpath.join(parent[0], f"{rng.choice(DIRECTORY_WORDS)}_{parent[2]}")
+        directories.append(path)
+        parent[2] += 1
+        if parent[2] >= spec.fan_out:
+            open_parents[slot] = open_parents[-1]
+            open_parents.pop()
+        if parent[1] + 1 < spec.depth:
+            open_parents.append([path, parent[1] + 1, 0])
+    return directories
+
+
+def build_ignored_tree(spec: SyntheticSpec, rng: random.Random,
+                       directories: List[str]) -> List[str]:
+    """Directories inside ignored subtrees (node_modules/, venv/) of documented ones."""
+    roots: List[str] = []
+    ignored = []
+    for k in range(spec.ignored_directories):
+        # About ten packages per ignored subtree
+        if k % 10 == 0:
+            root = posixpath.join(rng.choice(directories),
+                                  rng.choice(IGNORED_DIRECTORY_NAMES))
+            if root not in roots:
+                roots.append(root)
+                ignored.append(root)
+                continue
+        ignored.append(posixpath.join(rng.choice(roots), f"pkg_{k}"))
+    return ignored
+
+
+def pick_doc_size(spec: SyntheticSpec, rng: random.Random) -> int:
+    """Target size in bytes of one document."""
+    if spec.size_distribution == "fixed":
+        return spec.doc_size
+    if spec.size_distribution == "uniform":
+        return rng.randint(spec.doc_size // 2, spec.doc_size * 3 // 2)
+    # Capped so a single document cannot dominate a run
+    return min(int(spec.doc_size * math.exp(rng.gauss(0.0, 1.0))), spec.doc_size * 64)
+
+
+def render_metadata(rng: random.Random, broken: bool) -> str:
+    """Metadata block; a broken one has a missing field or a malformed value."""
+    status = rng.choice(VALID_STATUSES)
+    version = f"{rng.randint(0, 5)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+    date = f"202{rng.randint(4, 5)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if broken:
+        mistake = rng.randrange(4)
+        if mistake == 0:
+            return f"**Version**: {version}  \n**Last Updated**: {date}\n"
+        if mistake == 1:
+            status = "Done"
+        elif mistake == 2:
+            version = version.rsplit(".", 1)[0]
+        else:
+            date = date.replace("-", "/")
+    return (f"**Status**: {status}  \n**Version**: {version}  \n"
+            f"**Last Updated**: {date}\n")
+
+
+def render_document(spec: SyntheticSpec, rng: random.Random, document: str,
+                    targets: List[str],
+                    paragraphs: List[str]) -> Tuple[str, int, int, bool]:
+    """
+    Contents of one document, with its link count, broken link count and
+    whether its metadata is broken.
+    """
+    directory = posixpath.dirname(document)
+    broken_metadata = rng.random() < spec.metadata_error_rate
+    title = posixpath.basename(directory or "root").replace("_", " ").title()
+    parts = [f"# {title}\n\n", render_metadata(rng, broken_metadata),
+             "\n## Overview\n\n", rng.choice(paragraphs), "\n\n## Usage\n\n"]
+
+    links = int(spec.link_density) + (rng.random() < spec.link_density % 1)
+    broken_links = 0
+    for n in range(links):
+        if rng.random() < spec.broken_link_rate:
+            target = posixpath.join(directory, f"missing_{n}.md")
+            broken_links += 1
+        else:
+            target = rng.choice(targets)
+        label = posixpath.basename(target)
+        href = posixpath.relpath(target, directory or ".")
+        if rng.random() < 0.2:
+            href += "#usage"
+        parts.append(f"- [{label}]({href})\n")
+
+    # Pad to the target size; every fourth section has a code fence whose link
+    # is not checked
+    size = pick_doc_size(spec, rng)
+    length = sum(len(part) for part in parts)
+    section = 0
+    while length < size:
+        section += 1
+        block = f"\n## Section {section}\n\n{rng.choice(paragraphs)}\n"
+        if section % 4 == 0:
+            block += "\n```markdown\n[Example](example.md)\n```\n"
+        parts.append(block)
+        length += len(block)
+    return "".join(parts), links, broken_links, broken_metadata
+
+
+def generate_synthetic_repo(output: Path, spec: SyntheticSpec) -> Dict[str, int]:
+    """
+    Generate a monorepo under `output`, replacing an earlier generated tree
+    there; an existing non-empty directory without the generator's marker file
+    is refused with ValueError rather than deleted. Returns what was
+    generated: directories, documents and links DocMan validates, the broken
+    links and metadata errors among them, ignored documents and bytes written.
+    """
+    spec.validate()
+    rng = random.Random(spec.seed)
+    output = Path(output)
+    if output.exists():
+        generated = (output / SYNTHETIC_MARKER).is_file()
+        if not output.is_dir() or (any(output.iterdir()) and not generated):
+            raise ValueError(f"{output} exists and was not generated by this script; "
+                             f"refusing to replace it")
+        shutil.rmtree(output)
+
+    directories = build_directory_tree(spec, rng)
+    ignored = build_ignored_tree(spec, rng, directories)
+    names = ["README.md"] + [f"topic_{i}.md" for i in range(1, spec.docs_per_dir)]
+    documents = [posixpath.join(d, name) for d in directories for name in names]
+    ignored_documents = [posixpath.join(d, name) for d in ignored for name in names]
+    paragraphs = []
+    for _ in range(64):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(40, 90))]
+        paragraphs.append(" ".join(words).capitalize() + ".")
+
+    stats = {"directories": len(directories) - 1, "documents": len(documents),
+             "links": 0, "broken_links": 0, "metadata_errors": 0,
+             "ignored_directories": len(ignored),
+             "ignored_documents": len(ignored_documents), "bytes": 0}
+    for directory in directories + ignored:
+        (output / directory).mkdir(parents=True, exist_ok=True)
+    marker = f"Generated by generate_examples.py --synthetic (seed {spec.seed})\n"
+    (output / SYNTHETIC_MARKER).write_text(marker, encoding="utf-8")
+
+    for number, document in enumerate(documents + ignored_documents):
+        content, links, broken_links, broken_metadata = render_document(
+            spec, rng, document, documents, paragraphs)
+        data = content.encode("utf-8")
+        (output / document).write_bytes(data)
+        stats["bytes"] += len(data)
+        if number >= len(documents):
+            continue  # ignored documents are never validated
+        stats["links"] += links
+        stats["broken_links"] += broken_links
+        stats["metadata_errors"] += broken_metadata
+    return stats
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description="Generate DocMan example repositories")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Generate a seeded synthetic monorepo instead of "
+                             "examples/samplerepo")
+    parser.add_argument("--output", default="examples/synthetic",
+                        help="Output directory; an earlier generated tree there is "
+                             "replaced (default: examples/synthetic)")
+    parser.add_argument("--dirs", type=int, default=defaults.directories,
+                        help="Directories besides the root "
+                             f"(default: {defaults.directories})")
+    parser.add_argument("--depth", type=int, default=defaults.depth,
+                        help=f"Maximum directory depth (default: {defaults.depth})")
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out,
+                        help="Maximum subdirectories per directory "
+                             f"(default: {defaults.fan_out})")
+    parser.add_argument("--docs-per-dir", type=int, default=defaults.docs_per_dir,
+                        help="Markdown files per directory, README.md included "
+                             f"(default: {defaults.docs_per_dir})")
+    parser.add_argument("--link-density", type=float, default=defaults.link_density,
+                        help="Average links per document "
+                             f"(default: {defaults.link_density})")
+    parser.add_argument("--broken-link-rate", type=float,
+                        default=defaults.broken_link_rate,
+                        help="Share of links to missing files "
+                             f"(default: {defaults.broken_link_rate})")
+    parser.add_argument("--metadata-error-rate", type=float,
+                        default=defaults.metadata_error_rate,
+                        help="Share of documents with broken metadata "
+                             f"(default: {defaults.metadata_error_rate})")
+    parser.add_argument("--size-distribution", choices=SIZE_DISTRIBUTIONS,
+                        default=defaults.size_distribution,
+                        help="Distribution of document sizes "
+                             f"(default: {defaults.size_distribution})")
+    parser.add_argument("--doc-size", type=int, default=defaults.doc_size,
+                        help="Median, mean or exact document size in bytes "
+                             f"(default: {defaults.doc_size})")
+    parser.add_argument("--ignored-share", type=float, default=defaults.ignored_share,
+                        help="Share of directories in ignored subtrees "
+                             f"(default: {defaults.ignored_share})")
+    parser.add_argument("--seed", type=int, default=defaults.seed,
+                        help=f"Random seed (default: {defaults.seed})")
+    return parser.parse_args()
+
+
+def generate_synthetic(args: argparse.Namespace):
+    """Generate a synthetic monorepo from the command line arguments"""
+    spec = SyntheticSpec(directories=args.dirs, depth=args.depth, fan_out=args.fan_out,
+                         docs_per_dir=args.docs_per_dir, link_density=args.link_density,
+                         broken_link_rate=args.broken_link_rate,
+                         metadata_error_rate=args.metadata_error_rate,
+                         size_distribution=args.size_distribution,
+                         doc_size=args.doc_size,
+                         ignored_share=args.ignored_share, seed=args.seed)
+    print(f"🎨 Generating synthetic monorepo in {args.output} (seed {spec.seed})...")
+    try:
+        stats = generate_synthetic_repo(Path(args.output), spec)
+    except (ValueError, OSError) as e:
+        print(f"❌ Error generating synthetic repository: {e}")
+        sys.exit(1)
+
+    print(f"✅ {stats['directories']} directories, {stats['documents']} documents, "
+          f"{stats['bytes'] // 1024} KB")
+    print(f"🔗 {stats['links']} links, {stats['broken_links']} broken")
+    print(f"📋 {stats['metadata_errors']} documents with metadata errors")
+    print(f"🙈 {stats['ignored_documents']} documents in "
+          f"{stats['ignored_directories']} ignored directories")
+    print()
+    print(f"🚀 You can now test DocMan with: python cli.py {args.output}")
+
+
 def main():
     """Main function to generate example structure"""
+    args = parse_arguments()
+    if args.synthetic:
+        return generate_synthetic(args)
+
     print("🎨 Generating DocMan example structure...")
     print("=" * 50)
     
@@ -0,0 +1,165 @@
+"""
+Archive Source
+
+Validates a documentation bundle (tar, tar.gz/bz2/xz or zip) without
+extracting it. Members are streamed once, in archive order: their names build
+the directory and file listing for the README and link checks, and markdown
+members are parsed on the fly, so memory is bounded by the largest member
+(plus the compact parsed records) rather than by the size of the archive.
+Bundles built from a directory (`tar czf docs.tgz docs/`, `git archive
+--prefix=docs/`) keep every member under that directory; it is taken as the
+root of the documentation.
+"""
+
+import posixpath
+import tarfile
+import zipfile
+import zlib
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from docfs import SnapshotFS, decode_text
+from documents import ParsedDocument, parse_document
+from scanner import RepoSnapshot
+from utils import CACHE_DIR_NAME, DEFAULT_IGNORE_PATTERNS, get_ignore_matcher
+
+# (name, is_dir, size, read) per member; read() must be called before the next member
+Member = Tuple[str, bool, int, Optional[Callable[[], bytes]]]
+
+
+class ArchiveError(Exception):
+    """Raised when a file is not a readable tar or zip archive."""
+
+
+class ArchiveTree(SnapshotFS):
+    """The files of an archive, with markdown members parsed while streaming."""
+
+    # Raw contents are kept only for these members (the index check compares text)
+    RETAINED_NAMES = {"DOCUMENTATION_INDEX.md"}
+
+    def __init__(self, archive_path: Path, ignore_patterns: Set[str] = None,
+                 root: Path = None):
+        """
+        Stream the archive once. Paths are exposed under `root` (default: the
+        archive path itself, a virtual location). When every member lies below
+        one top-level directory (and the names are not `./`-rooted), that
+        directory is the root and is stripped from the paths; `prefix` holds
+        its name. Markdown members in ignored subtrees are listed but never read.
+        """
+        self.archive_path = Path(archive_path)
+        self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
+        self.documents: Dict[str, ParsedDocument] = {}
+        self.largest = 0  # size of the largest member read
+        self._errors: Dict[str, Exception] = {}
+        self._retained: Dict[str, bytes] = {}
+        self.prefix: Optional[str] = None
+
+        matcher = get_ignore_matcher(set(self.ignore_patterns) | {CACHE_DIR_NAME})
+        files: Dict[str, int] = {}  # member path -> size
+        directories = set()
+        top = None  # the one top-level directory seen so far ('' once there is none)
+        try:
+            for name, is_dir, size, read in self._members():
+                relative = _normalize(name)
+                if relative is None:
+                    continue
+                first, _, rest = relative.partition('/')
+                rooted = name.replace('\\', '/').lstrip('/').startswith('./')
+                if rooted or not (rest or is_dir):
+                    top = ''  # ./-rooted names or a top-level file: no common directory
+                elif top is None:
+                    top = first
+                elif top != first:
+                    top = ''
+                if is_dir:
+                    directories.add(relative)
+                    continue
+                files[relative] = size
+                # While the top-level directory may still be a prefix, a member is
+                # only skipped if it is ignored with and without it
+                ignored = (matcher.matches(relative)
+                           and (not top or matcher.matches(rest)))
+                if relative.endswith(".md") and not ignored:
+                    self._read_member(relative, read)
+        except (tarfile.TarError, zipfile.BadZipFile, EOFError, zlib.error) as e:
+            raise ArchiveError(f"{self.archive_path.name}: {e}")
+
+        self.prefix = top or None
+        if self.prefix is not None:
+            files = {_strip_top(path): size for path, size in files.items()}
+            directories = {_strip_top(path) for path in directories
+                           if path != self.prefix}
+            self._errors = {_strip_top(path): error
+                            for path, error in self._errors.items()}
+            self._retained = {_strip_top(path): data
+                              for path, data in self._retained.items()}
+            self.documents = {_strip_top(path): document
+                              for path, document in self.documents.items()}
+        # Drop members read before the prefix turned out not to be one
+        self.documents = {path: document for path, document in self.documents.items()
+                          if not matcher.matches(path)}
+        super().__init__(root or self.archive_path, files, directories)
+
+    def _members(self) -> Iterator[Member]:
+        """Members of the archive in stored order (tar is read as a stream)."""
+        if zipfile.is_zipfile(self.archive_path):
+            with zipfile.ZipFile(self.archive_path) as archive:
+                for info in archive.infolist():
+                    yield (info.filename, info.is_dir(), info.file_size,
+                           lambda info=info: archive.read(info))
+            return
+        with tarfile.open(self.archive_path, mode='r|*') as archive:
+            for member in archive:
+                if member.isdir():
+                    yield member.name, True, 0, None
+                elif member.isfile():
+                    yield (member.name, False, member.size,
+                           lambda member=member: archive.extractfile(member).read())
+
+    def _read_member(self, relative: str, read: Callable[[], bytes]) -> None:
+        """Parse a markdown member; its bytes are dropped unless it is an index file."""
+        data = read()
+        self.largest = max(self.largest, len(data))
+        try:
+            self.documents[relative] = parse_document(decode_text(data))
+        except UnicodeDecodeError as e:
+            self._errors[relative] = e
+        if posixpath.basename(relative) in self.RETAINED_NAMES:
+            self._retained[relative] = data
+
+    def snapshot(self, ignore_patterns=None) -> RepoSnapshot:
+        """A complete RepoSnapshot of the archive, scanned from the member listing."""
+        ignore_patterns = ignore_patterns or self.ignore_patterns
+        return RepoSnapshot(self.root, ignore_patterns, self).scan()
+
+    def _read(self, key: str) -> bytes:
+        data = self._retained.get(key)
+        if data is None:
+            raise OSError(f"{key}: archive members are not kept after streaming")
+        return data
+
+    def load(self, file_path) -> ParsedDocument:
+        """Parsed document of a markdown member (a loader, like the parse cache)."""
+        key = self._key(file_path)
+        error = self._errors.get(key)
+        if error is not None:
+            raise error
+        document = self.documents.get(key)
+        if document is None:
+            raise FileNotFoundError(f"No such document in "
+                                    f"{self.archive_path.name}: {key}")
+        return document
+
+
+def _normalize(name: str) -> Optional[str]:
+    """Repo-relative POSIX path of a member name (None for the root or outside it)."""
+    relative = posixpath.normpath(name.replace('\\', '/').lstrip('/'))
+    if relative in ('.', '') or relative == '..' or relative.startswith('../'):
+        return None
+    return relative
+
+
+def _strip_top(relative: str) -> str:
+    """A member path without its top-level directory (unchanged for top-level files)."""
+    return relative.partition('/')[2] or relative
@@ -12,15 +12,21 @@ from datetime import datetime
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 from config import DocManConfig
+from docfs import DISK, DocFS
+from reporter import Violation
 
 
 class AutoFixer:
     """Handles automatic fixes for documentation issues."""
     
-    def __init__(self, repo_root: Path, config: DocManConfig):
-        """Initialize auto-fixer with repository root and configuration."""
+    def __init__(self, repo_root: Path, config: DocManConfig, fs: DocFS = None):
+        """
+        Initialize auto-fixer with repository root, configuration and the DocFS
+        to write to (disk by default).
+        """
         self.repo_root = Path(repo_root)
         self.config = config
+        self.fs = fs or DISK
     
     def create_missing_readme_template(self, directory: Path) -> str:
         """Create a README template with dynamic metadata based on configuration."""
@@ -110,7 +116,7 @@ Additional notes or considerations.
                 template_content = self.create_missing_readme_template(dir_path)
                 
                 # Create the README file
-                readme_path.write_text(template_content, encoding='utf-8')
+                self.fs.write_atomic(readme_path, template_content.encode('utf-8'))
                 
                 relative_path = dir_path.relative_to(self.repo_root) if dir_path != self.repo_root else Path(".")
                 print(f"✅ Created README.md in {relative_path}")
@@ -126,23 +132,31 @@ Additional notes or considerations.
         
         return created_count
     
-    def get_missing_readme_directories(self, missing_readme_violations: List[str]) -> List[Path]:
+    def get_missing_readme_directories(
+            self, missing_readme_violations: List[Violation]) -> List[Path]:
         """
-        Extract directory paths from missing README violations.
+        Get directory paths from missing README violations.
         
         Args:
-            missing_readme_violations: List of violation strings like "🚧 Missing README: path/to/dir"
+            missing_readme_violations: Violation records with rule "missing-readme"
+                (legacy "🚧 Missing README: path/to/dir" strings are still accepted)
             
         Returns:
             List of Path objects for directories missing README files
         """
         directories = []
         for violation in missing_readme_violations:
-            # Extract path from violation string
-            if "Missing README:" in violation:
+            if isinstance(violation, Violation):
+                if violation.rule != "missing-readme":
+                    continue
+                path_str = violation.file
+            elif "Missing README:" in violation:
                 path_str = violation.split("Missing README:")[-1].strip()
-                dir_path = self.repo_root / path_str
-                if dir_path.exists() and dir_path.is_dir():
-                    directories.append(dir_path)
+            else:
+                continue
+
+            dir_path = self.repo_root / path_str
+            if self.fs.is_dir(dir_path):
+                directories.append(dir_path)
         
         return directories
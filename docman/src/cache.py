@@ -0,0 +1,252 @@
+"""
+Persistent Parse Cache
+
+Stores each markdown file's parsed record (metadata block, links, Last Updated
+date) in a SQLite database under .docman-cache/ so unchanged files are never
+opened again. Entries are keyed by the repo-relative path and validated against
+(st_size, st_mtime_ns, st_ino); the whole cache is invalidated when the DocMan
+version or the parsing-relevant configuration changes, and it is bounded with
+least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Dict, Optional, Set
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from documents import ParsedDocument, parse_document
+from utils import CACHE_DIR_NAME
+from docfs import DISK, DocFS
+
+try:
+    from src import __version__ as DOCMAN_VERSION
+except ImportError:
+    DOCMAN_VERSION = "unknown"
+
+
+def config_fingerprint(config=None) -> str:
+    """Hash the DocMan version and the configuration values that affect results."""
+    data = {'docman_version': DOCMAN_VERSION, 'schema': ParseCache.SCHEMA_VERSION}
+    if config is not None:
+        data.update({
+            'required_metadata': list(getattr(config, 'required_metadata', [])),
+            'valid_statuses': list(getattr(config, 'valid_statuses', [])),
+            'ignore_patterns': sorted(getattr(config, 'ignore_patterns', [])),
+            'version_pattern': getattr(config, 'version_pattern', 'semantic'),
+            'date_format': getattr(config, 'date_format', 'YYYY-MM-DD'),
+        })
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ParseCache:
+    """SQLite-backed cache of ParsedDocument records keyed by path and stat."""
+
+    SCHEMA_VERSION = 3
+    DEFAULT_MAX_ENTRIES = 100_000
+    DATABASE_NAME = "parse-cache.sqlite"
+
+    def __init__(self, repo_root: Path, cache_dir: Path = None, fingerprint: str = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, read_only: bool = False,
+                 fs: DocFS = None):
+        """
+        Open (or create) the cache database for a repository.
+
+        A read-only cache serves existing entries but never creates, updates or
+        evicts anything (raises OSError if there is no cache yet). Documents
+        are read through `fs` (disk by default); files without a stable stat
+        signature there (in-memory buffers) are parsed but never stored.
+        """
+        self.repo_root = Path(repo_root)
+        self.fs = fs or DISK
+        self.cache_dir = Path(cache_dir or self.repo_root / CACHE_DIR_NAME)
+        self.fingerprint = fingerprint or config_fingerprint()
+        self.max_entries = max_entries
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self._touched: Set[str] = set()
+        self._stale = False
+        self._db = self._connect_read_only() if read_only else self._connect()
+        self._run = self._begin_run()
+
+    @classmethod
+    def for_config(cls, repo_root: Path, config, read_only: bool = False,
+                   fs: DocFS = None) -> Optional["ParseCache"]:
+        """Open the configured cache of a repository (None if disabled or unusable)."""
+        if not getattr(config, 'cache_enabled', True):
+            return None
+        try:
+            max_entries = int(getattr(config, 'cache_max_entries',
+                                      cls.DEFAULT_MAX_ENTRIES))
+            return cls(repo_root, fingerprint=config_fingerprint(config),
+                       max_entries=max_entries, read_only=read_only, fs=fs)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            if not read_only:
+                print(f"⚠️  Warning: Parse cache disabled: {e}")
+            return None
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        """Open an existing database without write access."""
+        db_path = self.cache_dir / self.DATABASE_NAME
+        if not db_path.is_file():
+            raise OSError(f"no parse cache at {db_path}")
+        # immutable: no -wal/-shm files are created; rows are still checked
+        # against the file's stat
+        db = sqlite3.connect(f"{db_path.as_uri()}?mode=ro&immutable=1", uri=True,
+                             timeout=5)
+        db.execute("SELECT 1 FROM documents LIMIT 1")
+        return db
+
+    def _connect(self) -> sqlite3.Connection:
+        """Create the cache directory and open the database (recreated if corrupt)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = self.cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Created by DocMan\n*\n", encoding='utf-8')
+
+        db_path = self.cache_dir / self.DATABASE_NAME
+        try:
+            return self._open_database(db_path)
+        except sqlite3.DatabaseError:
+            db_path.unlink(missing_ok=True)
+            return self._open_database(db_path)
+
+    def _open_database(self, db_path: Path) -> sqlite3.Connection:
+        """Open the database and make sure the schema exists."""
+        db = sqlite3.connect(str(db_path), timeout=5)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute("""CREATE TABLE IF NOT EXISTS documents (
+                          path TEXT PRIMARY KEY,
+                          size INTEGER, mtime_ns INTEGER, inode INTEGER,
+                          payload TEXT, last_used INTEGER)""")
+        db.execute("CREATE INDEX IF NOT EXISTS documents_last_used "
+                   "ON documents(last_used)")
+        return db
+
+    def _meta(self, key: str) -> Optional[str]:
+        """Read a value from the meta table."""
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?",
+                               (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        """Write a value to the meta table."""
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                         (key, value))
+
+    def _begin_run(self) -> int:
+        """Drop stale entries on a fingerprint change; return this run's LRU counter."""
+        if self.read_only:
+            # Entries written under another version or configuration are ignored,
+            # not dropped
+            self._stale = self._meta('fingerprint') != self.fingerprint
+            return int(self._meta('run') or 0)
+        with self._db:
+            if self._meta('fingerprint') != self.fingerprint:
+                self._db.execute("DELETE FROM documents")
+                self._set_meta('fingerprint', self.fingerprint)
+            run = int(self._meta('run') or 0) + 1
+            self._set_meta('run', str(run))
+        return run
+
+    def _key(self, file_path: Path) -> str:
+        """Cache key: the path relative to the repository root."""
+        try:
+            return Path(file_path).relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return Path(file_path).as_posix()
+
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[ParsedDocument]:
+        """Return the cached record if the file's size, mtime and inode match."""
+        if self._stale:
+            return None
+        key = self._key(file_path)
+        row = self._db.execute(
+            "SELECT size, mtime_ns, inode, payload FROM documents WHERE path = ?",
+            (key,)
+        ).fetchone()
+        signature = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        if row is None or tuple(row[:3]) != signature:
+            return None
+        self._touched.add(key)
+        return ParsedDocument.from_dict(json.loads(row[3]))
+
+    def put(self, file_path: Path, stat: os.stat_result,
+            document: ParsedDocument) -> None:
+        """Store a freshly parsed record."""
+        if self.read_only:
+            return
+        key = self._key(file_path)
+        payload = json.dumps(document.to_dict(), ensure_ascii=False,
+                             separators=(',', ':'))
+        self._db.execute(
+            "INSERT OR REPLACE INTO documents "
+            "(path, size, mtime_ns, inode, payload, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, stat.st_size, stat.st_mtime_ns, stat.st_ino, payload, self._run)
+        )
+
+    def load(self, file_path: Path) -> ParsedDocument:
+        """Return the parsed record for a file, opening it only on a cache miss."""
+        file_path = Path(file_path)
+        stat = self.fs.stat(file_path)
+        if stat.st_mtime_ns is None:
+            self.misses += 1
+            return parse_document(self.fs.read_text(file_path))
+        document = self.get(file_path, stat)
+        if document is not None:
+            self.hits += 1
+            return document
+
+        self.misses += 1
+        document = parse_document(self.fs.read_text(file_path))
+        self.put(file_path, stat, document)
+        return document
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries beyond max_entries; returns how many."""
+        count = self._db.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        self._db.execute(
+            "DELETE FROM documents WHERE path IN "
+            "(SELECT path FROM documents ORDER BY last_used ASC LIMIT ?)", (excess,)
+        )
+        return excess
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this run."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def commit(self) -> None:
+        """
+        Record LRU usage, enforce the size bound and commit (long-running
+        callers use this between requests).
+        """
+        if self._db is None or self.read_only:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "UPDATE documents SET last_used = ? WHERE path = ?",
+                    ((self._run, key) for key in self._touched)
+                )
+                self.evict()
+            self._touched.clear()
+        except sqlite3.Error as e:
+            print(f"⚠️  Warning: Failed to update parse cache: {e}")
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        if self._db is None:
+            return
+        self.commit()
+        self._db.close()
+        self._db = None
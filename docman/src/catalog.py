@@ -0,0 +1,301 @@
+"""
+Documentation Catalog
+
+A SQLite database (.docman-cache/catalog.sqlite) with one row per indexed
+document: path, title, Status, Version, Last Updated, size and mtime, plus
+its outbound links and headings in side tables. The indexer keeps it in sync
+incrementally (only files whose size, mtime or inode changed are re-read,
+through the run's DocFS),
+and `cli.py query` answers questions about the documentation with indexed
+lookups instead of grepping every file.
+"""
+
+import json
+import posixpath
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from docfs import DISK, DocFS
+from documents import ParsedDocument, load_document, split_link
+from utils import CACHE_DIR_NAME
+from cache import config_fingerprint
+
+
+# Columns a query can filter, sort on and print
+QUERY_COLUMNS = ('path', 'title', 'status', 'version', 'last_updated', 'size', 'mtime',
+                 'link_count', 'heading_count')
+# Operations a query may perform (anything else, e.g. writes or ATTACH, is denied)
+_ALLOWED_ACTIONS = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION}
+
+
+class CatalogError(Exception):
+    """Raised when the catalog is missing or a query is invalid."""
+
+
+def resolve_link(source: str, target: str) -> Optional[str]:
+    """
+    Repo-relative path a link in `source` points to (lexically normalized, fragment
+    dropped), or None for same-file anchors and targets outside the repository.
+    """
+    path, _ = split_link(target)
+    if not path or path.startswith('/'):
+        return None
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+    if resolved == '..' or resolved.startswith('../'):
+        return None
+    return resolved
+
+
+def document_title(document: ParsedDocument) -> Optional[str]:
+    """The first level-1 heading of a document, else its first heading."""
+    for heading in document.headings:
+        if heading.level == 1:
+            return heading.text
+    return document.headings[0].text if document.headings else None
+
+
+class DocumentCatalog:
+    """SQLite catalog of documents, their metadata, links and headings."""
+
+    SCHEMA_VERSION = 2
+    DATABASE_NAME = "catalog.sqlite"
+
+    def __init__(self, repo_root: Path, cache_dir: Path = None, read_only: bool = False,
+                 fs: DocFS = None):
+        """
+        Open (or create) the catalog of a repository, whose documents are
+        stat'ed and read through `fs` (the disk by default).
+
+        A read-only catalog is used for queries; it raises CatalogError if no
+        catalog has been built yet.
+        """
+        self.repo_root = Path(repo_root)
+        self.fs = fs or DISK
+        self.cache_dir = (Path(cache_dir) if cache_dir
+                          else self.repo_root / CACHE_DIR_NAME)
+        self.db_path = self.cache_dir / self.DATABASE_NAME
+        self.read_only = read_only
+        self.updated = 0
+        self.removed = 0
+        self._db = self._connect_read_only() if read_only else self._connect()
+
+    @classmethod
+    def for_config(cls, repo_root: Path, config,
+                   fs: DocFS = None) -> Optional["DocumentCatalog"]:
+        """Open the catalog for a repository, or None if it is disabled or unusable."""
+        if not getattr(config, 'catalog_enabled', True):
+            return None
+        try:
+            return cls(repo_root, fs=fs)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Warning: Documentation catalog disabled: {e}")
+            return None
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        """Open an existing catalog without write access."""
+        if not self.db_path.is_file():
+            raise CatalogError(f"no catalog at {self.db_path}; "
+                               "run `python cli.py` once to build it")
+        try:
+            db = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True,
+                                 timeout=5)
+            db.execute("SELECT 1 FROM documents LIMIT 1")
+        except sqlite3.Error as e:
+            raise CatalogError(f"unreadable catalog at {self.db_path}: {e}")
+        return db
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Create the cache directory and open the catalog, recreating it on schema
+        change or corruption.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = self.cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Created by DocMan\n*\n", encoding='utf-8')
+
+        try:
+            return self._open_database()
+        except sqlite3.DatabaseError:
+            self.db_path.unlink(missing_ok=True)
+            return self._open_database()
+
+    def _open_database(self) -> sqlite3.Connection:
+        """Open the database and make sure the current schema exists."""
+        db = sqlite3.connect(str(self.db_path), timeout=5)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA foreign_keys=ON")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        # Rows parsed by another DocMan version may differ: start over
+        fingerprint = f"{self.SCHEMA_VERSION}:{config_fingerprint()}"
+        row = db.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        with db:
+            if row is None or row[0] != fingerprint:
+                for table in ('links', 'headings', 'documents'):
+                    db.execute(f"DROP TABLE IF EXISTS {table}")
+                db.execute("INSERT OR REPLACE INTO meta (key, value) "
+                           "VALUES ('fingerprint', ?)", (fingerprint,))
+            db.execute("""CREATE TABLE IF NOT EXISTS documents (
+                              path TEXT PRIMARY KEY,
+                              title TEXT, status TEXT, version TEXT, last_updated TEXT,
+                              size INTEGER, mtime REAL, mtime_ns INTEGER, inode INTEGER,
+                              link_count INTEGER, heading_count INTEGER,
+                              metadata TEXT)""")
+            db.execute("""CREATE TABLE IF NOT EXISTS links (
+                              source TEXT REFERENCES documents(path) ON DELETE CASCADE,
+                              target TEXT, line INTEGER, kind TEXT, resolved TEXT)""")
+            db.execute("""CREATE TABLE IF NOT EXISTS headings (
+                              path TEXT REFERENCES documents(path) ON DELETE CASCADE,
+                              level INTEGER, text TEXT, slug TEXT, line INTEGER)""")
+            db.execute("CREATE INDEX IF NOT EXISTS documents_status "
+                       "ON documents(status, last_updated)")
+            db.execute("CREATE INDEX IF NOT EXISTS documents_last_updated "
+                       "ON documents(last_updated)")
+            db.execute("CREATE INDEX IF NOT EXISTS documents_version "
+                       "ON documents(version)")
+            db.execute("CREATE INDEX IF NOT EXISTS links_source ON links(source)")
+            db.execute("CREATE INDEX IF NOT EXISTS links_target ON links(target)")
+            # Reverse adjacency: who links to a path
+            db.execute("CREATE INDEX IF NOT EXISTS links_resolved "
+                       "ON links(resolved, source)")
+            db.execute("CREATE INDEX IF NOT EXISTS headings_path ON headings(path)")
+        return db
+
+    def _key(self, file_path: Path) -> str:
+        """Row key: the path relative to the repository root, with forward slashes."""
+        file_path = Path(file_path)
+        if not file_path.is_absolute():
+            return file_path.as_posix()
+        try:
+            return file_path.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def sync(self, files: Iterable[Path], loader=None, removed: Iterable[Path] = (),
+             complete: bool = False) -> int:
+        """
+        Bring the rows of the given files up to date; return how many were rewritten.
+
+        Files whose (size, mtime, inode) match their row are skipped without
+        being opened; the others are loaded through `loader` (a corpus or parse
+        cache), else read from the catalog's DocFS. Files without a stable stat
+        (in-memory buffers) are always re-read. Rows of `removed` paths are
+        deleted, and with complete=True so is every row whose file is not in
+        `files`.
+        """
+        if self._db is None or self.read_only:
+            return 0
+        stored = {path: (size, mtime_ns, inode) for path, size, mtime_ns, inode in
+                  self._db.execute("SELECT path, size, mtime_ns, inode FROM documents")}
+        seen = set()
+        updated = 0
+        with self._db:
+            for file_path in files:
+                key = self._key(file_path)
+                seen.add(key)
+                try:
+                    stat = self.fs.stat(file_path)
+                except OSError:
+                    continue
+                fingerprint = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                if stat.st_mtime_ns is not None and stored.get(key) == fingerprint:
+                    continue
+                try:
+                    document = load_document(Path(file_path), loader, self.fs)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                self._write_row(key, stat, document)
+                updated += 1
+
+            gone = {self._key(path) for path in removed}
+            if complete:
+                gone |= stored.keys() - seen
+            gone &= stored.keys()
+            self._db.executemany("DELETE FROM documents WHERE path = ?",
+                                 ((key,) for key in gone))
+
+        self.updated += updated
+        self.removed += len(gone)
+        return updated
+
+    def _write_row(self, key: str, stat, document: ParsedDocument) -> None:
+        """Replace a document's row together with its links and headings."""
+        metadata = document.metadata
+        self._db.execute("DELETE FROM documents WHERE path = ?", (key,))
+        self._db.execute(
+            "INSERT INTO documents (path, title, status, version, last_updated, "
+            "size, mtime, mtime_ns, inode, link_count, heading_count, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, document_title(document), metadata.get('Status'),
+             metadata.get('Version'), metadata.get('Last Updated'), stat.st_size,
+             getattr(stat, 'st_mtime', None), stat.st_mtime_ns, stat.st_ino,
+             len(document.links), len(document.headings),
+             json.dumps(metadata, ensure_ascii=False))
+        )
+        self._db.executemany(
+            "INSERT INTO links (source, target, line, kind, resolved) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((key, link.target, link.line, link.kind, resolve_link(key, link.target))
+             for link in document.links)
+        )
+        self._db.executemany(
+            "INSERT INTO headings (path, level, text, slug, line) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((key, heading.level, heading.text, heading.slug, heading.line)
+             for heading in document.headings)
+        )
+
+    def index_fields(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        (Status, Last Updated) of every document, keyed by path: what the
+        markdown index renders.
+        """
+        return {path: (status, last_updated) for path, status, last_updated in
+                self._db.execute("SELECT path, status, last_updated FROM documents")}
+
+    def query(self, where: str = "", order_by: str = "path",
+              limit: int = None) -> List[Dict[str, object]]:
+        """
+        Return the documents matching an SQL condition over QUERY_COLUMNS.
+
+        The condition may use subqueries on the links (source, target, line,
+        kind, resolved) and headings (path, level, text, slug, line) tables.
+        Only reads are allowed; anything else raises CatalogError.
+        """
+        if order_by not in QUERY_COLUMNS:
+            raise CatalogError(f"cannot order by {order_by!r} "
+                               f"(columns: {', '.join(QUERY_COLUMNS)})")
+        sql = f"SELECT {', '.join(QUERY_COLUMNS)} FROM documents"
+        if where.strip():
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
+        parameters: Tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters = (int(limit),)
+
+        self._db.set_authorizer(
+            lambda action, *_: (sqlite3.SQLITE_OK if action in _ALLOWED_ACTIONS
+                                else sqlite3.SQLITE_DENY))
+        try:
+            rows = self._db.execute(sql, parameters).fetchall()
+        except sqlite3.Error as e:
+            raise CatalogError(f"invalid query: {e}")
+        finally:
+            self._db.set_authorizer(None)
+        return [dict(zip(QUERY_COLUMNS, row)) for row in rows]
+
+    def execute(self, sql: str, parameters: Tuple = ()) -> sqlite3.Cursor:
+        """Run a read statement against the catalog (used by the link graph)."""
+        return self._db.execute(sql, parameters)
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._db is None:
+            return
+        self._db.close()
+        self._db = None
@@ -56,6 +56,19 @@ class DocManConfig:
     exit_on_errors: bool = True
     auto_fix: bool = False
 
+    # Parse cache settings (stored under .docman-cache/ in the repository)
+    cache_enabled: bool = True
+    cache_max_entries: int = 100_000
+    # In-memory document corpus bound for a single run (megabytes)
+    corpus_max_mb: int = 256
+    # SQLite catalog of all indexed documents (.docman-cache/catalog.sqlite), used
+    # by `cli.py query`
+    catalog_enabled: bool = True
+    # Sharded index: subtrees up to this depth with at least shard_threshold documents
+    # get their own index (0 = off)
+    index_shard_depth: int = 0
+    index_shard_threshold: int = 0
+
     # Private attributes (set by ConfigLoader)
     _config_path: str = field(default="defaults", init=False)
     _is_fallback: bool = field(default=False, init=False)
@@ -203,6 +216,18 @@ class ConfigLoader:
             config.auto_fix = data["autoFix"]
         if "verbose" in data:
             config.verbose_output = data["verbose"]
+        if "cacheEnabled" in data:
+            config.cache_enabled = data["cacheEnabled"]
+        if "cacheMaxEntries" in data:
+            config.cache_max_entries = int(data["cacheMaxEntries"])
+        if "corpusMaxMb" in data:
+            config.corpus_max_mb = int(data["corpusMaxMb"])
+        if "catalogEnabled" in data:
+            config.catalog_enabled = data["catalogEnabled"]
+        if "indexShardDepth" in data:
+            config.index_shard_depth = int(data["indexShardDepth"])
+        if "indexShardThreshold" in data:
+            config.index_shard_threshold = int(data["indexShardThreshold"])
     
     def _load_from_ini(self, config: DocManConfig, content: str):
         """Load configuration from INI-style format."""
@@ -387,7 +412,13 @@ class ConfigLoader:
             'generate_reports': 'generate_reports',
             'exit_on_errors': 'exit_on_errors',
             'version_pattern': 'version_pattern',
-            'date_format': 'date_format'
+            'date_format': 'date_format',
+            'cache_enabled': 'cache_enabled',
+            'cache_max_entries': 'cache_max_entries',
+            'corpus_max_mb': 'corpus_max_mb',
+            'catalog_enabled': 'catalog_enabled',
+            'index_shard_depth': 'index_shard_depth',
+            'index_shard_threshold': 'index_shard_threshold'
         }
 
         if key in key_mapping:
@@ -395,6 +426,12 @@ class ConfigLoader:
             if key == 'ignore_patterns':
                 # Convert list to set for ignore patterns
                 setattr(config, attr_name, set(value) if isinstance(value, list) else value)
+            elif key in ('cache_max_entries', 'corpus_max_mb', 'index_shard_depth',
+                         'index_shard_threshold'):
+                try:
+                    setattr(config, attr_name, int(value))
+                except (TypeError, ValueError):
+                    pass
             else:
                 setattr(config, attr_name, value)
 
@@ -478,6 +515,24 @@ emoji_indicators = true
 # Reporting settings
 generate_reports = true
 exit_on_errors = true
+
+# Parse cache (.docman-cache/ in the repository root, git-ignored automatically)
+# Unchanged files (same size, mtime and inode) are never re-read between runs
+cache_enabled = true
+cache_max_entries = 100000
+
+# Parsed documents kept in memory during one run (least recently used
+# evicted beyond this)
+corpus_max_mb = 256
+
+# Catalog of all documents (.docman-cache/catalog.sqlite) for `python cli.py query`
+catalog_enabled = true
+
+# Sharded index for large monorepos: directories up to this depth holding at least
+# index_shard_threshold documents get their own DOCUMENTATION_INDEX.md, linked from
+# the root index; only shards whose subtree changed are rewritten (0 = single index)
+index_shard_depth = 0
+index_shard_threshold = 0
 """
     
     output_path.write_text(template_content, encoding='utf-8')
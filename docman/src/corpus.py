@@ -0,0 +1,130 @@
+"""
+Document Corpus
+
+Holds the parsed documents of one run in memory so every phase (metadata,
+links, dates, index) reads and decodes each file at most once. Documents come
+from a loader of already parsed documents (an archive) or the parse cache when
+one is given, otherwise from the run's DocFS (the disk by default). The corpus is
+bounded by an estimated memory size and evicts least-recently-used documents
+when the bound is exceeded.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from documents import ParsedDocument, load_document
+from docfs import DocFS
+
+# Rough per-object overhead (bytes) used by the size estimate
+_RECORD_OVERHEAD = 64
+
+
+def estimate_size(document: ParsedDocument) -> int:
+    """Approximate memory of a parsed document (string lengths, record overhead)."""
+    size = _RECORD_OVERHEAD * 4
+    for name, value in document.metadata.items():
+        size += len(name) + len(value) + 2 * _RECORD_OVERHEAD
+    for link in document.links:
+        size += len(link.target) + 2 * _RECORD_OVERHEAD
+    for heading in document.headings:
+        size += len(heading.text) + len(heading.slug) + 3 * _RECORD_OVERHEAD
+    size += sum(len(anchor) + _RECORD_OVERHEAD for anchor in document.anchors)
+    size += len(document.code_fences) * _RECORD_OVERHEAD
+    return size
+
+
+class DocumentCorpus:
+    """In-memory, size-bounded LRU of parsed documents shared by all phases of a run."""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cache=None, max_bytes: int = DEFAULT_MAX_BYTES, fs: DocFS = None,
+                 loader=None):
+        """
+        Initialize with an optional parse cache backend, a memory bound in bytes
+        and the DocFS read without a cache. `loader` (anything with load(path),
+        such as an ArchiveTree) holds documents parsed elsewhere and replaces
+        both.
+        """
+        self.cache = cache
+        self.fs = fs
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self._documents: "OrderedDict[Path, ParsedDocument]" = OrderedDict()
+        self._sizes: Dict[Path, int] = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def for_config(cls, cache, config, fs: DocFS = None,
+                   loader=None) -> "DocumentCorpus":
+        """Create a corpus bounded by the configured corpus_max_mb."""
+        max_mb = getattr(config, 'corpus_max_mb',
+                         cls.DEFAULT_MAX_BYTES // (1024 * 1024))
+        return cls(cache, max_bytes=int(max_mb) * 1024 * 1024, fs=fs, loader=loader)
+
+    def __contains__(self, file_path) -> bool:
+        return Path(file_path) in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, file_path: Path) -> Optional[ParsedDocument]:
+        """Return the document if in memory (marking it recently used), else None."""
+        file_path = Path(file_path)
+        document = self._documents.get(file_path)
+        if document is not None:
+            self._documents.move_to_end(file_path)
+        return document
+
+    def load(self, file_path: Path) -> ParsedDocument:
+        """Return the parsed document, read via the parse cache or disk on first use."""
+        file_path = Path(file_path)
+        document = self.get(file_path)
+        if document is not None:
+            self.hits += 1
+            return document
+
+        self.misses += 1
+        document = load_document(file_path, self.loader or self.cache, self.fs)
+        self.add(file_path, document)
+        return document
+
+    def add(self, file_path: Path, document: ParsedDocument) -> None:
+        """Keep a parsed document, evicting the least recently used past the bound."""
+        file_path = Path(file_path)
+        self.discard(file_path)
+        size = estimate_size(document)
+        self._documents[file_path] = document
+        self._sizes[file_path] = size
+        self.size += size
+
+        # The document just added always stays, even if it alone exceeds the bound
+        while self.size > self.max_bytes and len(self._documents) > 1:
+            evicted, _ = self._documents.popitem(last=False)
+            self.size -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    def discard(self, file_path: Path) -> None:
+        """Forget a document (e.g. after it changed on disk)."""
+        file_path = Path(file_path)
+        if self._documents.pop(file_path, None) is not None:
+            self.size -= self._sizes.pop(file_path)
+
+    def clear(self) -> None:
+        """Forget all documents."""
+        self._documents.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters for this run: hits, misses (reads through the cache or disk),
+        evictions and size.
+        """
+        return {'documents': len(self._documents), 'bytes': self.size,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
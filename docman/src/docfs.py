@@ -0,0 +1,336 @@
+"""
+Documentation File Systems
+
+Every component reads and writes documentation through a DocFS: list a
+directory, stat, read bytes and write atomically. DiskFS is the real file
+system (the default everywhere), OverlayFS layers in-memory buffers (unsaved
+editor contents, fixtures) over another file system, and SnapshotFS is a
+read-only tree built from a listing (a git ref, an archive). Paths are the
+absolute (possibly virtual) paths used throughout DocMan.
+"""
+
+import abc
+import io
+import os
+import stat as stat_module
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from utils import write_bytes_atomic
+
+# Names of the subdirectories and files of a directory
+Listing = Tuple[List[str], List[str]]
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """Stat record of a file that only exists in memory (os.stat_result field names)."""
+    st_mode: int
+    st_size: int = 0
+    # No stable signature: stat-keyed caches never store these files
+    st_mtime_ns: Optional[int] = None
+    st_ino: int = 0
+
+
+FILE_MODE = stat_module.S_IFREG | 0o644
+DIRECTORY_MODE = stat_module.S_IFDIR | 0o755
+
+
+def decode_text(data: bytes) -> str:
+    """UTF-8 text with universal newlines, like Path.read_text."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+class DocFS(abc.ABC):
+    """File system interface: list, stat, read bytes and write atomically."""
+
+    # True when some contents are not on disk (worker processes cannot read them)
+    virtual = False
+
+    @abc.abstractmethod
+    def list(self, directory: Path) -> Listing:
+        """Subdirectory and file names of a directory (OSError if it is not one)."""
+
+    @abc.abstractmethod
+    def stat(self, path: Path):
+        """os.stat_result or FileStat of a path (OSError if it does not exist)."""
+
+    @abc.abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        """Contents of a file."""
+
+    def open(self, path: Path, buffering: int = -1) -> BinaryIO:
+        """Binary stream of a file, for readers that stop early (disk buffering)."""
+        return io.BytesIO(self.read_bytes(path))
+
+    @abc.abstractmethod
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        """Replace a file's contents in one step."""
+
+    @abc.abstractmethod
+    def remove(self, path: Path) -> None:
+        """Delete a file (no error if it does not exist)."""
+
+    def exists(self, path) -> bool:
+        try:
+            self.stat(path)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def is_dir(self, path) -> bool:
+        try:
+            return stat_module.S_ISDIR(self.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def is_file(self, path) -> bool:
+        try:
+            return stat_module.S_ISREG(self.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def read_text(self, path) -> str:
+        """UTF-8 text with universal newlines, like Path.read_text."""
+        return decode_text(self.read_bytes(path))
+
+    def write_text_if_changed(self, path, content: str) -> bool:
+        """
+        Write UTF-8 text unless the file already has exactly these bytes;
+        returns True if written.
+        """
+        data = content.encode('utf-8')
+        try:
+            if self.read_bytes(path) == data:
+                return False
+        except OSError:
+            pass
+        self.write_atomic(path, data)
+        return True
+
+
+class DiskFS(DocFS):
+    """The real file system."""
+
+    def list(self, directory: Path) -> Listing:
+        # Symlinked directories are not descended into; symlinked files count as files
+        dirs, files = [], []
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        return dirs, files
+
+    def stat(self, path: Path) -> os.stat_result:
+        return os.stat(path)
+
+    def exists(self, path) -> bool:
+        return os.path.exists(path)
+
+    def read_bytes(self, path: Path) -> bytes:
+        with open(path, 'rb') as handle:
+            return handle.read()
+
+    def read_text(self, path) -> str:
+        return Path(path).read_text(encoding='utf-8')
+
+    def open(self, path: Path, buffering: int = -1) -> BinaryIO:
+        return open(path, 'rb', buffering=buffering)
+
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        write_bytes_atomic(path, data)
+
+    def remove(self, path: Path) -> None:
+        Path(path).unlink(missing_ok=True)
+
+
+# Shared default instance
+DISK = DiskFS()
+
+
+class OverlayFS(DocFS):
+    """
+    In-memory buffers layered over another file system (over nothing: a pure
+    in-memory tree). Only directories holding a buffer cost anything extra;
+    every other path goes straight to the base.
+    """
+
+    virtual = True
+
+    def __init__(self, buffers: Mapping = None, base: Optional[DocFS] = DISK):
+        """
+        Initialize with buffers (path -> bytes or str) and the base file system
+        (None for none).
+        """
+        self.base = base
+        self.buffers: Dict[Path, bytes] = {}
+        self.removed: Set[Path] = set()
+        # Names added by buffers, per directory (including directories created by them)
+        self._children: Dict[Path, Tuple[Set[str], Set[str]]] = {}
+        for path, data in (buffers or {}).items():
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            self.write_atomic(path, data)
+
+    def _add(self, path: Path) -> None:
+        """Record a buffer in its parent's listing, creating virtual parents."""
+        child, kind = path, 1  # index into (dirs, files)
+        for parent in path.parents:
+            self._children.setdefault(parent, (set(), set()))[kind].add(child.name)
+            if self.base is not None and self.base.is_dir(parent):
+                break  # the rest of the chain exists in the base
+            child, kind = parent, 0
+
+    def list(self, directory: Path) -> Listing:
+        directory = Path(directory)
+        added = self._children.get(directory)
+        try:
+            dirs, files = (self.base.list(directory) if self.base is not None
+                           else ([], []))
+        except OSError:
+            if added is None:
+                raise
+            dirs, files = [], []
+        if self.removed:
+            files = [name for name in files if directory / name not in self.removed]
+        if added is None:
+            return dirs, files
+        return sorted(set(dirs) | added[0]), sorted(set(files) | added[1])
+
+    def stat(self, path: Path):
+        path = Path(path)
+        data = self.buffers.get(path)
+        if data is not None:
+            return FileStat(FILE_MODE, len(data))
+        if path in self._children:
+            return FileStat(DIRECTORY_MODE)
+        if path in self.removed or self.base is None:
+            raise FileNotFoundError(f"No such file: {path}")
+        return self.base.stat(path)
+
+    def read_bytes(self, path: Path) -> bytes:
+        path = Path(path)
+        data = self.buffers.get(path)
+        if data is not None:
+            return data
+        if path in self.removed or self.base is None:
+            raise FileNotFoundError(f"No such file: {path}")
+        return self.base.read_bytes(path)
+
+    def open(self, path: Path, buffering: int = -1) -> BinaryIO:
+        path = Path(path)
+        if path in self.buffers or path in self.removed or self.base is None:
+            return io.BytesIO(self.read_bytes(path))
+        return self.base.open(path, buffering)
+
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        """Store the contents in memory; the base is never written."""
+        path = Path(path)
+        if path not in self.buffers:
+            self._add(path)
+        self.buffers[path] = bytes(data)
+        self.removed.discard(path)
+
+    def remove(self, path: Path) -> None:
+        path = Path(path)
+        if self.buffers.pop(path, None) is not None:
+            self._children[path.parent][1].discard(path.name)
+        self.removed.add(path)
+
+    def discard(self, path: Path) -> None:
+        """Drop a buffer (or a removal) so the base shows through again."""
+        path = Path(path)
+        self.removed.discard(path)
+        if self.buffers.pop(path, None) is None:
+            return
+        child, kind = path, 1
+        for parent in path.parents:
+            sets = self._children.get(parent)
+            if sets is None:
+                break
+            sets[kind].discard(child.name)
+            if sets[0] or sets[1] or (self.base is not None
+                                      and self.base.is_dir(parent)):
+                break
+            # A virtual directory that only held this buffer
+            del self._children[parent]
+            child, kind = parent, 0
+
+
+class SnapshotFS(DocFS):
+    """
+    A read-only tree of files given as repo-relative POSIX paths under a
+    (virtual) root. Subclasses read contents from elsewhere by overriding
+    `_read`; by default the mapping's values are the contents.
+    """
+
+    virtual = True
+
+    def __init__(self, root: Path, files: Mapping[str, object],
+                 directories: Iterable[str] = ()):
+        """
+        Index the directory structure of `files` (repo-relative path -> contents
+        or reference); `directories` adds directories that hold no files.
+        """
+        self.root = Path(root)
+        self.files = files
+        self._children: Dict[str, Tuple[Set[str], Set[str]]] = {'': (set(), set())}
+        for relative in files:
+            parent, _, name = relative.rpartition('/')
+            self._child_sets(parent)[1].add(name)
+        for relative in directories:
+            self._child_sets(relative)
+
+    def _child_sets(self, relative: str) -> Tuple[Set[str], Set[str]]:
+        """Name sets of a directory, creating it (and its parents) on first use."""
+        sets = self._children.get(relative)
+        if sets is None:
+            sets = self._children[relative] = (set(), set())
+            parent, _, name = relative.rpartition('/')
+            self._child_sets(parent)[0].add(name)
+        return sets
+
+    def _key(self, path) -> str:
+        """Repo-relative POSIX path of a (virtual) absolute path ('' for the root)."""
+        try:
+            relative = Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            raise FileNotFoundError(f"{path} is outside {self.root}")
+        return '' if relative == '.' else relative
+
+    def list(self, directory: Path) -> Listing:
+        sets = self._children.get(self._key(directory))
+        if sets is None:
+            raise NotADirectoryError(f"Not a directory: {directory}")
+        return list(sets[0]), list(sets[1])
+
+    def stat(self, path: Path):
+        key = self._key(path)
+        if key in self.files:
+            value = self.files[key]
+            return FileStat(FILE_MODE, len(value) if isinstance(value, bytes) else 0)
+        if key in self._children:
+            return FileStat(DIRECTORY_MODE)
+        raise FileNotFoundError(f"No such file: {key}")
+
+    def read_bytes(self, path: Path) -> bytes:
+        key = self._key(path)
+        if key not in self.files:
+            raise FileNotFoundError(f"No such file: {key}")
+        return self._read(key)
+
+    def _read(self, key: str) -> bytes:
+        return self.files[key]
+
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        raise PermissionError(f"Read-only snapshot: cannot write {path}")
+
+    def remove(self, path: Path) -> None:
+        raise PermissionError(f"Read-only snapshot: cannot remove {path}")
@@ -0,0 +1,390 @@
+"""
+Markdown Document Parsing
+
+Tokenizes a markdown file in a single linear pass into the compact record every
+phase needs: the metadata block (with line numbers), inline, image and
+reference-style links (with positions), headings and their anchors, code-fence
+spans and the Last Updated date. Links and headings inside code fences or
+inline code spans are ignored.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from pathlib import Path
+
+
+METADATA_LINE_PATTERN = re.compile(r'\*\*([^*]+)\*\*:\s*(.+)')
+INLINE_LINK_PATTERN = re.compile(
+    r'(!?)\[([^\]]*)\]\(\s*(<[^>]*>|[^)]*?)(?:\s+(?:"[^"]*"|\'[^\']*\'))?\s*\)')
+REFERENCE_DEFINITION_PATTERN = re.compile(r'^ {0,3}\[([^\]^][^\]]*)\]:\s*(<[^>]*>|\S+)')
+CODE_SPAN_PATTERN = re.compile(r'(`+)(.+?)\1')
+LAST_UPDATED_PATTERN = re.compile(r'\*\*Last Updated\*\*:\s*(\d{4}-\d{2}-\d{2})')
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+EXTERNAL_LINK_PREFIXES = ('http://', 'https://', 'mailto:', 'ftp://')
+ATX_HEADING_PATTERN = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+SETEXT_UNDERLINE_PATTERN = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+HTML_ANCHOR_PATTERN = re.compile(r'<a\s[^>]*?(?:name|id)\s*=\s*["\']([^"\']+)["\']',
+                                 re.IGNORECASE)
+INLINE_LINK_TEXT_PATTERN = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\- ]')
+FENCE_LEADS = frozenset('`~')
+SETEXT_LEADS = frozenset('=-')
+# Metadata-only reads: file buffer size, and the longest line kept (longer ones are cut)
+HEADER_CHUNK_SIZE = 4096
+HEADER_MAX_LINE = 64 * 1024
+
+
+class Link(NamedTuple):
+    """A relative link target and where it appears (1-based line and column)."""
+    target: str
+    line: int
+    column: int
+    kind: str  # "inline", "image" or "reference"
+
+
+class Heading(NamedTuple):
+    """A heading with its level, text, line and anchor slug."""
+    level: int
+    text: str
+    line: int
+    slug: str
+
+
+@dataclass
+class ParsedDocument:
+    """Parsed representation of a single markdown file."""
+    metadata: Dict[str, str] = field(default_factory=dict)
+    links: List[Link] = field(default_factory=list)
+    last_updated: Optional[str] = None
+    anchors: List[str] = field(default_factory=list)
+    metadata_lines: Dict[str, int] = field(default_factory=dict)
+    headings: List[Heading] = field(default_factory=list)
+    code_fences: List[Tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def link_targets(self) -> List[str]:
+        """Just the link targets, in document order."""
+        return [link.target for link in self.links]
+
+    def has_anchor(self, fragment: str) -> bool:
+        """O(1) check whether a fragment names a heading or HTML anchor of this doc."""
+        anchor_set = self.__dict__.get('_anchor_set')
+        if anchor_set is None:
+            anchor_set = self.__dict__['_anchor_set'] = frozenset(self.anchors)
+        return fragment in anchor_set or fragment.lower() in anchor_set
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict (used by the parse cache)."""
+        return {
+            'metadata': self.metadata,
+            'metadata_lines': self.metadata_lines,
+            'links': [list(link) for link in self.links],
+            'last_updated': self.last_updated,
+            'anchors': self.anchors,
+            'headings': [list(heading) for heading in self.headings],
+            'code_fences': [list(span) for span in self.code_fences],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParsedDocument":
+        """Deserialize from a plain dict."""
+        return cls(
+            metadata=data.get('metadata', {}),
+            links=[Link(*link) for link in data.get('links', [])],
+            last_updated=data.get('last_updated'),
+            anchors=data.get('anchors', []),
+            metadata_lines=data.get('metadata_lines', {}),
+            headings=[Heading(*heading) for heading in data.get('headings', [])],
+            code_fences=[tuple(span) for span in data.get('code_fences', [])]
+        )
+
+
+def slugify_heading(text: str) -> str:
+    """
+    GitHub-style heading slug: inline markup dropped, lowercased, punctuation
+    removed, spaces to hyphens.
+    """
+    text = INLINE_LINK_TEXT_PATTERN.sub(r'\1', text)
+    text = text.replace('`', '').replace('*', '').strip().lower()
+    return SLUG_STRIP_PATTERN.sub('', text).replace(' ', '-')
+
+
+def _link_destination(raw: str) -> str:
+    """Strip angle brackets and whitespace from a link destination."""
+    raw = raw.strip()
+    if raw.startswith('<') and raw.endswith('>'):
+        raw = raw[1:-1].strip()
+    return raw
+
+
+def _mask_code_spans(line: str) -> str:
+    """Blank out inline code spans, keeping column positions."""
+    if '`' not in line:
+        return line
+    return CODE_SPAN_PATTERN.sub(lambda m: ' ' * len(m.group(0)), line)
+
+
+def _closes_fence(fence: str, fence_match, line: str) -> bool:
+    """
+    Whether a line closes the open fence (same character, at least as long,
+    nothing after it).
+    """
+    if fence_match is None:
+        return False
+    marker = fence_match.group(1)
+    return (marker[0] == fence[0] and len(marker) >= len(fence)
+            and not line[fence_match.end():].strip())
+
+
+def _metadata_step(state: str, stripped: str, line_number: int,
+                   document: ParsedDocument) -> str:
+    """
+    Advance the metadata block state machine by one non-blank line outside code.
+
+    The block is the run of **Field**: Value lines directly after the first
+    "# " title; states are 'before' the title, 'open' and 'done'.
+    """
+    if stripped.startswith('# '):
+        return 'open'
+    if state != 'open':
+        return state
+    if not stripped.startswith('**'):
+        return 'done'
+    if '**:' in stripped:
+        match = METADATA_LINE_PATTERN.match(stripped)
+        if match:
+            name, value = match.group(1).strip(), match.group(2).strip()
+            document.metadata[name] = value
+            document.metadata_lines[name] = line_number
+    return state
+
+
+def parse_document(content: str) -> ParsedDocument:
+    """Tokenize markdown content into a ParsedDocument in one pass over its lines."""
+    document = ParsedDocument()
+    metadata_state = 'before'  # 'before' the title, 'open' right after it, 'done'
+    fallback_last_updated = None
+    fence = None
+    fence_start = 0
+    previous = ''
+    slug_counts: Dict[str, int] = {}
+
+    def add_heading(level: int, text: str, line_number: int) -> None:
+        slug = slugify_heading(text)
+        count = slug_counts.get(slug, 0)
+        slug_counts[slug] = count + 1
+        if count:
+            slug = f"{slug}-{count}"
+        document.headings.append(Heading(level, text.strip(), line_number, slug))
+        document.anchors.append(slug)
+
+    lines = content.split('\n')
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        # Most lines are prose: the first character decides which patterns can apply
+        lead = stripped[:1]
+
+        # Code fences: everything inside is opaque
+        fence_match = FENCE_PATTERN.match(line) if lead in FENCE_LEADS else None
+        if fence is not None:
+            if _closes_fence(fence, fence_match, line):
+                document.code_fences.append((fence_start, line_number))
+                fence = None
+            continue
+        if fence_match:
+            fence, fence_start = fence_match.group(1), line_number
+            if metadata_state == 'open':
+                metadata_state = 'done'
+            previous = ''
+            continue
+        if not stripped:
+            previous = ''
+            continue
+
+        if metadata_state != 'done':
+            metadata_state = _metadata_step(metadata_state, stripped,
+                                            line_number, document)
+
+        if fallback_last_updated is None and '**Last Updated**' in line:
+            match = LAST_UPDATED_PATTERN.search(line)
+            if match:
+                fallback_last_updated = match.group(1)
+
+        # Headings (ATX and setext) and explicit HTML anchors
+        heading = ATX_HEADING_PATTERN.match(line) if lead == '#' else None
+        if heading:
+            add_heading(len(heading.group(1)), heading.group(2) or '', line_number)
+            previous = ''
+        else:
+            underline = (SETEXT_UNDERLINE_PATTERN.match(line)
+                         if lead in SETEXT_LEADS and previous.strip() else None)
+            if underline:
+                level = 1 if underline.group(1)[0] == '=' else 2
+                add_heading(level, previous, line_number - 1)
+                previous = ''
+            else:
+                previous = line
+        if '<a' in line:
+            document.anchors.extend(HTML_ANCHOR_PATTERN.findall(line))
+
+        # Links: inline and image links, and reference definitions
+        if '](' in line:
+            for match in INLINE_LINK_PATTERN.finditer(_mask_code_spans(line)):
+                # Re-read the destination from the original line (code spans are masked)
+                target = _link_destination(line[match.start(3):match.end(3)])
+                if target and not target.startswith(EXTERNAL_LINK_PREFIXES):
+                    kind = 'image' if match.group(1) else 'inline'
+                    document.links.append(
+                        Link(target, line_number, match.start() + 1, kind))
+        if lead == '[' and ']:' in line:
+            match = REFERENCE_DEFINITION_PATTERN.match(line)
+            if match:
+                target = _link_destination(match.group(2))
+                if target and not target.startswith(EXTERNAL_LINK_PREFIXES):
+                    document.links.append(
+                        Link(target, line_number, match.start(2) + 1, 'reference'))
+
+    if fence is not None:
+        # Unclosed fence runs to the end of the document
+        document.code_fences.append((fence_start, len(lines)))
+
+    # The metadata block's value wins; otherwise the first **Last Updated**
+    # line outside code
+    last_updated = document.metadata.get('Last Updated', '')
+    document.last_updated = (last_updated if DATE_PATTERN.match(last_updated)
+                             else fallback_last_updated)
+    return document
+
+
+def _header_lines(handle: BinaryIO) -> Iterator[str]:
+    """
+    Yield decoded lines from a binary file; overlong lines are cut and their
+    rest skipped unread.
+    """
+    while True:
+        line = handle.readline(HEADER_MAX_LINE)
+        if not line:
+            return
+        if len(line) == HEADER_MAX_LINE and not line.endswith(b'\n'):
+            while True:
+                rest = handle.readline(HEADER_MAX_LINE)
+                if not rest or rest.endswith(b'\n'):
+                    break
+            yield line.decode('utf-8', 'ignore')
+        else:
+            yield line.decode('utf-8').rstrip('\n')
+
+
+def read_metadata_header(file_path: Path, fs=None) -> ParsedDocument:
+    """
+    Read only the metadata block of a file, in small chunks, stopping where the
+    block ends. The returned document has metadata and metadata_lines only.
+    """
+    document = ParsedDocument()
+    state = 'before'
+    fence = None
+    if fs is None:
+        handle = open(file_path, 'rb', buffering=HEADER_CHUNK_SIZE)
+    else:
+        handle = fs.open(file_path, buffering=HEADER_CHUNK_SIZE)
+    with handle:
+        for line_number, line in enumerate(_header_lines(handle), 1):
+            stripped = line.strip()
+            fence_match = (FENCE_PATTERN.match(line)
+                           if stripped[:1] in FENCE_LEADS else None)
+            if fence is not None:
+                if _closes_fence(fence, fence_match, line):
+                    fence = None
+                continue
+            if fence_match:
+                if state == 'open':
+                    break
+                fence = fence_match.group(1)
+                continue
+            if stripped:
+                state = _metadata_step(state, stripped, line_number, document)
+                if state == 'done':
+                    break
+    return document
+
+
+def load_metadata_document(file_path: Path, cache=None, fs=None) -> ParsedDocument:
+    """
+    Document holding at least the metadata block of a file (and its line
+    numbers). With a document loader the full record is used (link checks
+    need the rest of the file anyway); without one only the header is read,
+    from `fs` (a DocFS) or the disk.
+    """
+    if cache is not None:
+        return cache.load(file_path)
+    return read_metadata_header(file_path, fs)
+
+
+def load_metadata(file_path: Path, cache=None, fs=None) -> Dict[str, str]:
+    """Metadata block of a file, see load_metadata_document."""
+    return load_metadata_document(file_path, cache, fs).metadata
+
+
+def parse_metadata_block(content: str) -> Dict[str, str]:
+    """Parse metadata block from README content (only from the beginning)."""
+    return parse_document(content).metadata
+
+
+def extract_markdown_links(content: str) -> List[str]:
+    """Extract relative markdown link targets, skipping external URLs and code."""
+    return parse_document(content).link_targets
+
+
+def extract_anchors(content: str) -> List[str]:
+    """
+    Collect heading slugs (numbered -1, -2 ... when repeated) and explicit
+    <a name/id> anchors.
+    """
+    return parse_document(content).anchors
+
+
+def link_destination_span(line: str, link: Link) -> Optional[Tuple[int, int]]:
+    """
+    Character span of a link's destination within its source line (angle brackets
+    included), or None if the line no longer matches; used to rewrite links in place.
+    """
+    if link.kind == 'reference':
+        match = REFERENCE_DEFINITION_PATTERN.match(line)
+        group = 2
+    else:
+        match = INLINE_LINK_PATTERN.match(_mask_code_spans(line), link.column - 1)
+        group = 3
+    if match is None:
+        return None
+    if _link_destination(line[match.start(group):match.end(group)]) != link.target:
+        return None
+    return match.span(group)
+
+
+def split_link(link: str):
+    """Split a link into (path, fragment); the fragment is None when there is no '#'."""
+    path, hash_sign, fragment = link.partition('#')
+    path = path.split('?', 1)[0]
+    return path, (fragment if hash_sign else None)
+
+
+def find_last_updated(content: str) -> Optional[str]:
+    """
+    Find the Last Updated date: the metadata block first, then any
+    **Last Updated** line outside code.
+    """
+    return parse_document(content).last_updated
+
+
+def load_document(file_path: Path, cache=None, fs=None) -> ParsedDocument:
+    """
+    Load and parse a markdown file, going through the parse cache when one is
+    given (else `fs` or the disk).
+    """
+    if cache is not None:
+        return cache.load(file_path)
+    if fs is not None:
+        return parse_document(fs.read_text(file_path))
+    return parse_document(Path(file_path).read_text(encoding='utf-8'))
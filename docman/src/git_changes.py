@@ -0,0 +1,206 @@
+"""
+Git Change Detection
+
+Collects the paths changed since a git ref (or in the index) with a single
+`git diff --name-status` call, plus untracked files for the working tree, for
+the incremental --changed-since / --staged modes.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+from pathlib import Path, PurePosixPath
+
+
+class GitError(RuntimeError):
+    """Raised when a git command fails (not a repository, unknown ref, git missing)."""
+
+    def __init__(self, message: str, returncode: int = None, stderr: str = ""):
+        super().__init__(message)
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+@dataclass
+class ChangeSet:
+    """Paths changed according to git, relative to the repository root."""
+    changed: List[Path] = field(default_factory=list)
+    added: List[Path] = field(default_factory=list)
+    deleted: List[Path] = field(default_factory=list)
+    renamed: Dict[Path, Path] = field(default_factory=dict)
+    # Blob ids of the deleted files' old contents (from `git diff --raw`)
+    deleted_blobs: Dict[Path, str] = field(default_factory=dict)
+
+    @property
+    def removed_paths(self) -> List[Path]:
+        """Paths that no longer exist: deletions and rename sources."""
+        return sorted(set(self.deleted) | set(self.renamed))
+
+    @property
+    def touched_directories(self) -> Set[Path]:
+        """Directories whose README presence may have changed."""
+        directories = {p.parent for p in self.added}
+        directories.update(p.parent for p in self.renamed.values())
+        directories.update(p.parent for p in self.removed_paths
+                           if p.name == "README.md")
+        return directories
+
+
+def run_git(repo_root: Path, args: List[str], input: str = None) -> str:
+    """Run a git command in repo_root (with `input` on stdin) and return its stdout."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_root)] + args,
+            input=input,
+            capture_output=True,
+            text=True,
+            encoding="utf-8"
+        )
+    except FileNotFoundError:
+        raise GitError("git executable not found")
+
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {args[0]} failed",
+                       result.returncode, result.stderr)
+    return result.stdout
+
+
+def parse_name_status(output: str) -> ChangeSet:
+    """Parse `git diff --name-status -z` (or `--raw -z`) output into a ChangeSet."""
+    changes = ChangeSet()
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i]
+        blob = None
+        if status.startswith(":"):
+            # --raw: ":old_mode new_mode old_blob new_blob STATUS"
+            _, _, blob, _, status = status[1:].split(" ")
+        kind = status[0]
+        if kind in "RC":
+            old, new = Path(fields[i + 1]), Path(fields[i + 2])
+            i += 3
+            if kind == "R":
+                changes.renamed[old] = new
+            changes.changed.append(new)
+            changes.added.append(new)
+            continue
+
+        path = Path(fields[i + 1])
+        i += 2
+        if kind == "D":
+            changes.deleted.append(path)
+            if blob:
+                changes.deleted_blobs[path] = blob
+        else:
+            changes.changed.append(path)
+            if kind == "A":
+                changes.added.append(path)
+
+    return changes
+
+
+def get_changes(repo_root: Path, since: str = None, staged: bool = False) -> ChangeSet:
+    """
+    Get the paths changed since `since` (working tree vs ref) or staged in the index.
+
+    Uses one `git diff --raw` call with rename detection and, for the working
+    tree, one `git ls-files` call for untracked files (which git diff never
+    lists; they count as added). An untracked file with the contents of a
+    deleted one (a plain `mv` that is not staged yet) is paired with it as a
+    rename. Paths are relative to repo_root and limited to it.
+    """
+    args = ["diff", "--raw", "--no-abbrev", "-z", "-M", "--relative"]
+    if staged:
+        args.append("--cached")
+    if since:
+        args.append(since)
+    changes = parse_name_status(run_git(repo_root, args))
+    if not staged:
+        untracked = run_git(repo_root,
+                            ["ls-files", "-z", "--others", "--exclude-standard"])
+        untracked = [Path(name) for name in untracked.split("\0") if name]
+        changes.changed.extend(untracked)
+        changes.added.extend(untracked)
+        if untracked and changes.deleted:
+            pair_moved_files(repo_root, changes, untracked)
+    return changes
+
+
+def pair_moved_files(repo_root: Path, changes: ChangeSet,
+                     untracked: List[Path]) -> None:
+    """
+    Record untracked files whose contents equal a deleted file's as renames of
+    it (one `git hash-object`).
+    """
+    suffixes = {path.suffix for path in changes.deleted}
+    candidates = [path for path in untracked if path.suffix in suffixes]
+    if not candidates:
+        return
+    paths = "".join(f"{path.as_posix()}\n" for path in candidates)
+    hashes = run_git(repo_root, ["hash-object", "--stdin-paths"], input=paths).split()
+    by_blob = {}
+    for path, blob in zip(candidates, hashes):
+        by_blob.setdefault(blob, path)
+    for old in list(changes.deleted):
+        new = by_blob.pop(changes.deleted_blobs.get(old), None)
+        if new is not None:
+            changes.renamed[old] = new
+            changes.deleted.remove(old)
+
+
+def link_search_terms(removed_paths: List[Path]) -> List[str]:
+    """Strings that any link to a removed path from outside its directory contains."""
+    terms = set()
+    for path in removed_paths:
+        posix = PurePosixPath(path.as_posix())
+        if posix.name == "README.md" and len(posix.parts) > 1:
+            # Bare "README.md" would match nearly every document; see
+            # readme_search_scopes
+            terms.add(f"{posix.parent.name}/README.md")
+        else:
+            terms.add(posix.name)
+    return sorted(terms)
+
+
+def readme_search_scopes(removed_paths: List[Path]) -> List[str]:
+    """
+    Directories of removed nested READMEs. Siblings link to such a README as
+    `README.md` and subdirectories as `../README.md`, so inside these
+    directories any mention of README.md counts.
+    """
+    return sorted({path.parent.as_posix() for path in removed_paths
+                   if path.name == "README.md" and len(path.parts) > 1})
+
+
+def find_files_mentioning(repo_root: Path, terms: List[str],
+                          pathspecs: List[str] = None) -> List[Path]:
+    """Markdown files (relative to repo_root) that contain any of the terms."""
+    if not terms:
+        return []
+
+    args = ["grep", "-l", "-z", "-F"]
+    for term in terms:
+        args.extend(["-e", term])
+    args.append("--")
+    args.extend(pathspecs or ["*.md"])
+
+    try:
+        output = run_git(repo_root, args)
+    except GitError as e:
+        # git grep exits 1 (with nothing on stderr) when nothing matches
+        if e.returncode == 1 and not e.stderr:
+            return []
+        raise
+    return [Path(p) for p in output.split("\0") if p]
+
+
+def find_files_linking_to(repo_root: Path, removed_paths: List[Path]) -> List[Path]:
+    """Markdown files (relative to repo_root) that may link to a removed path."""
+    found = set(find_files_mentioning(repo_root, link_search_terms(removed_paths)))
+    scopes = readme_search_scopes(removed_paths)
+    if scopes:
+        # git pathspec wildcards cross '/', so this covers the whole subtree
+        found.update(find_files_mentioning(repo_root, ["README.md"],
+                                           [f"{scope}/*.md" for scope in scopes]))
+    return sorted(found)
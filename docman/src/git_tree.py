@@ -0,0 +1,123 @@
+"""
+Git Tree Source
+
+Validates documentation at an arbitrary git ref, also in bare repositories,
+without a checkout. The tree is listed with a single `git ls-tree -r` call
+(plus `git rev-parse --show-prefix` to place a subdirectory root) and
+markdown blobs are streamed on demand through one long-lived
+`git cat-file --batch` process; nothing is extracted to disk. The tree is a
+read-only DocFS, so every component reads it like the working tree.
+"""
+
+import subprocess
+from typing import Dict, Optional
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from docfs import SnapshotFS
+from git_changes import GitError
+from scanner import RepoSnapshot
+
+
+class GitTree(SnapshotFS):
+    """The files of one git tree; blobs are read through a cat-file batch process."""
+
+    def __init__(self, root: Path, ref: str, git_dir: Path = None):
+        """
+        List the tree of `ref`. Paths are exposed under `root` (a virtual
+        location: nothing below it is read from disk). With `git_dir` the
+        repository (bare or not) is addressed directly and `root` is its top.
+        Otherwise `root` must be inside a working tree: the whole tree is
+        exposed at the working tree's top, so links leaving `root` resolve,
+        and `snapshot()` covers `root` only.
+        """
+        self.ref = ref
+        self.repo_root = Path(root)
+        top = self.repo_root
+        if git_dir is not None:
+            self._git = ["git", f"--git-dir={git_dir}"]
+        else:
+            self._git = ["git", "-C", str(root)]
+            prefix = self._run(["rev-parse", "--show-prefix"])
+            prefix = prefix.decode('utf-8', 'surrogateescape').strip()
+            for _ in Path(prefix).parts:
+                top = top.parent
+        self._batch: Optional[subprocess.Popen] = None
+        self.reads = 0
+        super().__init__(top, self._list_tree())
+
+    @property
+    def blobs(self) -> Dict[str, str]:
+        """Repo-relative POSIX path -> object id of every file in the tree."""
+        return self.files
+
+    def _run(self, args) -> bytes:
+        """Run a git command against the repository and return its stdout."""
+        try:
+            result = subprocess.run(self._git + args, capture_output=True)
+        except FileNotFoundError:
+            raise GitError("git executable not found")
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', 'replace').strip()
+            raise GitError(message or f"git {args[0]} failed")
+        return result.stdout
+
+    def _list_tree(self) -> Dict[str, str]:
+        """Record every file of the tree with one `git ls-tree -r` call."""
+        blobs = {}
+        listing = self._run(["ls-tree", "-r", "-z", "--full-tree", self.ref])
+        for record in listing.split(b"\0"):
+            if not record:
+                continue
+            info, _, name = record.partition(b"\t")
+            _, _, object_id = info.split()
+            # Submodules (commits) and symlinks are listed as files; only blobs
+            # are ever read
+            blobs[name.decode('utf-8', 'surrogateescape')] = object_id.decode('ascii')
+        return blobs
+
+    def snapshot(self, ignore_patterns=None) -> RepoSnapshot:
+        """
+        A complete RepoSnapshot of `root` in the tree, scanned from the listing
+        (nothing is read from disk).
+        """
+        return RepoSnapshot(self.repo_root, ignore_patterns, self).scan()
+
+    def _read(self, key: str) -> bytes:
+        """Read one blob through the long-lived `git cat-file --batch` process."""
+        object_id = self.files[key]
+        if self._batch is None:
+            try:
+                self._batch = subprocess.Popen(self._git + ["cat-file", "--batch"],
+                                               stdin=subprocess.PIPE,
+                                               stdout=subprocess.PIPE)
+            except FileNotFoundError:
+                raise GitError("git executable not found")
+        self._batch.stdin.write(object_id.encode('ascii') + b"\n")
+        self._batch.stdin.flush()
+
+        header = self._batch.stdout.readline().split()
+        if len(header) != 3:
+            reply = b' '.join(header).decode('utf-8', 'replace')
+            raise OSError(f"cannot read object {object_id}: {reply}")
+        size = int(header[2])
+        data = self._batch.stdout.read(size)
+        self._batch.stdout.read(1)  # trailing newline
+        self.reads += 1
+        return data
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._batch is None:
+            return
+        self._batch.stdin.close()
+        self._batch.wait()
+        self._batch.stdout.close()
+        self._batch = None
+
+    def __enter__(self) -> "GitTree":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
@@ -5,20 +5,46 @@ Handles creation and maintenance of DOCUMENTATION_INDEX.md files.
 Manages the central index of all documentation files in the repository.
 """
 
-from typing import List, Dict, Optional, Set
+import os
+import posixpath
+import re
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
-from utils import find_all_markdown_files, should_ignore_path, DEFAULT_IGNORE_PATTERNS
+from utils import DEFAULT_IGNORE_PATTERNS
+from scanner import RepoSnapshot, scan_repository
+from docfs import DISK, DocFS
+from documents import load_metadata
+from reporter import Violation
 
 
 class DocumentationIndexer:
     """Manages the DOCUMENTATION_INDEX.md file for a repository."""
 
-    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None):
-        """Initialize the indexer with repository root path."""
+    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None,
+                 snapshot: RepoSnapshot = None, cache=None,
+                 shard_depth: int = 0, shard_threshold: int = 0, catalog=None,
+                 fs: DocFS = None):
+        """
+        Initialize the indexer with repository root path, optional shared snapshot
+        and parse cache.
+
+        With shard_depth > 0 the index is split into per-subtree index files for
+        directories up to that depth holding at least shard_threshold documents;
+        the root index links to them. A DocumentCatalog, if given, is kept in
+        sync with the index and the index entries are rendered from its rows.
+        The index is read and written through `fs` (the snapshot's DocFS by default).
+        """
         self.repo_root = Path(repo_root)
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
+        self.snapshot = snapshot
+        self.cache = cache
+        self.shard_depth = max(0, int(shard_depth))
+        self.shard_threshold = max(0, int(shard_threshold))
+        self._parents: Dict[str, str] = {}
+        self.catalog = catalog
+        self.fs = fs or (snapshot.fs if snapshot is not None else DISK)
         # Only create index in the actual repository root
         self.index_file = self._find_repository_root() / "DOCUMENTATION_INDEX.md"
 
@@ -28,7 +54,7 @@ class DocumentationIndexer:
 
         # Walk up the directory tree to find .git
         while current != current.parent:
-            if (current / ".git").exists():
+            if self.fs.exists(current / ".git"):
                 return current
             current = current.parent
 
@@ -39,11 +65,11 @@ class DocumentationIndexer:
         """Load existing index entries from DOCUMENTATION_INDEX.md."""
         indexed_files = {}
 
-        if not self.index_file.exists():
+        if not self.fs.exists(self.index_file):
             return indexed_files
 
         try:
-            content = self.index_file.read_text(encoding='utf-8')
+            content = self.fs.read_text(self.index_file)
 
             # Parse markdown links in the index: [path](path)
             import re
@@ -60,11 +86,13 @@ class DocumentationIndexer:
         return indexed_files
     
     def find_missing_entries(self, all_md_files: List[Path]) -> List[Path]:
-        """Find markdown files not listed in the index."""
-        indexed_files = self.load_existing_index()
+        """Find markdown files not listed in the index (or any of its shards)."""
+        indexed_files = self._read_index_entries() or {}
         missing_files = []
 
         for md_file in all_md_files:
+            if self._is_index_file(md_file):
+                continue  # The index does not list itself
             # Convert to relative path from repo root
             try:
                 relative_path = md_file.relative_to(self.repo_root)
@@ -85,31 +113,9 @@ class DocumentationIndexer:
         metadata = {'Status': '🚧 Draft', 'Version': '0.0.0', 'Last Updated': '2025-01-01'}
 
         try:
-            content = file_path.read_text(encoding='utf-8')
-
-            # Look for metadata in the first section after title
-            import re
-            lines = content.split('\n')
-            in_metadata_section = False
-
-            for line in lines:
-                line = line.strip()
-
-                if line.startswith('# '):
-                    in_metadata_section = True
-                    continue
-
-                if in_metadata_section and (line.startswith('## ') or
-                                           (line and not line.startswith('**') and not line.startswith('#'))):
-                    if not line.startswith('**'):
-                        break
-
-                if in_metadata_section and line.startswith('**') and '**:' in line:
-                    match = re.match(r'\*\*([^*]+)\*\*:\s*(.+)', line)
-                    if match:
-                        field, value = match.groups()
-                        metadata[field.strip()] = value.strip()
-
+            # Same metadata block rules as MetadataValidator; only the header
+            # is read without a loader
+            metadata.update(load_metadata(file_path, self.cache, self.fs))
         except Exception:
             pass
 
@@ -132,66 +138,384 @@ class DocumentationIndexer:
             return formatted_name
 
     def update_index(self, missing_files: List[Path]) -> int:
-        """Rebuild the documentation index completely to ensure it's always correct and up-to-date."""
-        # Always rebuild the index completely to ensure it's clean and uses current logic
-        # Use the same ignore patterns as the CLI for consistency
-        self._rebuild_index(self.ignore_patterns)
+        """
+        Bring the index in line with the repository; return the number of entries added.
+
+        Entries already in the index are kept and only re-rendered lines that
+        changed (new files, removed or ignored files, new status or date) end up
+        different; each index file is rewritten atomically, and only when its
+        bytes change.
+        """
+        try:
+            existing = self._read_index_files()
+            updated = self._desired_entries(missing_files)
+            added = len(updated.keys() - self._entries_from(existing).keys())
+
+            self._write_files(updated, existing)
+            return added
 
-        # Return 0 since we always rebuild completely
-        # The missing_files parameter is kept for compatibility but not used
-        return 0
+        except Exception as e:
+            print(f"Warning: Index update failed: {e}")
+            return 0
+
+    def check_index(self, missing_files: List[Path] = ()) -> List[Violation]:
+        """
+        Read-only counterpart of update_index(): report how the index on disk
+        differs, writing nothing.
+        """
+        return self._diff_index(self._desired_entries(missing_files))
+
+    def check_entries(self, updated_files: List[Path],
+                      removed_paths: List[Path] = ()) -> List[Violation]:
+        """Read-only counterpart of update_entries() for incremental runs."""
+        entries, _ = self._patched_entries(updated_files, removed_paths)
+        if entries is None:
+            # No index yet: a full rebuild would be needed
+            entries = self._desired_entries([])
+        return self._diff_index(entries)
+
+    def _desired_entries(self, missing_files: List[Path]) -> Dict[str, str]:
+        """Entry line for every file belonging in the index, plus the missing ones."""
+        current = {str(file_path.relative_to(self.repo_root)): file_path
+                   for file_path in self._indexed_files(self.ignore_patterns)}
+        # Files passed in as missing are (re)rendered even if the snapshot predates them
+        for file_path in missing_files:
+            if self._is_index_file(file_path):
+                continue
+            try:
+                relative_path = str(file_path.relative_to(self.repo_root))
+                current.setdefault(relative_path, file_path)
+            except ValueError:
+                continue
+        if self.catalog is not None:
+            # Only files changed since the last run are read; the rest comes from
+            # the catalog
+            self.catalog.sync(current.values(), self.cache, complete=True)
+            fields = self.catalog.index_fields()
+            return {relative_path: self._format_entry(
+                        relative_path,
+                        *fields.get(Path(relative_path).as_posix(), (None, None)))
+                    for relative_path in current}
+        return {relative_path: self._index_entry(file_path)
+                for relative_path, file_path in current.items()}
+
+    def _diff_index(self, desired: Dict[str, str]) -> List[Violation]:
+        """Compare the would-be index files with those on disk, entry by entry."""
+        existing = self._read_index_files()
+        rendered = self._render_files(desired)
+        changed = [path for path, content in rendered.items()
+                   if existing.get(path) != content]
+        stale = [path for path in existing if path not in rendered]
+        if not changed and not stale:
+            return []
+
+        index_name = os.path.relpath(self.index_file, self.repo_root)
+        current = self._entries_from(existing)
+        violations = []
+        for relative_path in sorted(desired.keys() | current.keys()):
+            if relative_path not in current:
+                message = f"{relative_path} is not listed in {index_name}"
+            elif relative_path not in desired:
+                message = (f"{index_name} lists {relative_path}, "
+                           "which is no longer indexed")
+            elif current[relative_path] != desired[relative_path]:
+                message = f"{index_name} entry for {relative_path} is out of date"
+            else:
+                continue
+            violations.append(Violation(rule="index-out-of-date", file=index_name,
+                                        message=message, target=relative_path))
+
+        if not violations:
+            # Same entries, different layout (e.g. written by an older version
+            # or resharded)
+            for path in sorted(changed + stale):
+                name = os.path.relpath(path, self.repo_root)
+                if path in stale:
+                    message = f"{name} is no longer needed"
+                elif path not in existing:
+                    message = f"{name} does not exist"
+                else:
+                    message = f"{name} needs to be regenerated"
+                violations.append(Violation(rule="index-out-of-date", file=name,
+                                            message=message))
+        return violations
+
+    INDEX_HEADER = ("# Documentation Index\n\n"
+                    "This file contains links to all documentation in the repository."
+                    "\n\n")
+    INDEX_ENTRY_PATTERN = re.compile(r'^- \[([^\]]+)\]\(([^)]+)\)')
+    # Sharded layout: per-subtree index files and the links to them
+    SHARD_TITLE = "# Documentation Index: "
+    SHARD_LINK_PATTERN = re.compile(r'^- 📁 \[([^\]]+)\]\(([^)]+)\)')
+
+    def _section_for(self, relative_path: str) -> str:
+        """Section for a repo-relative path: its top-level directory or Project Root."""
+        parts = relative_path.split('/')
+        if len(parts) == 1:  # Root level file
+            return "Project Root"
+        # Use first directory as section name
+        return parts[0].replace('-', ' ').replace('_', ' ').title()
+
+    def _index_entry(self, file_path: Path) -> str:
+        """Render the index line for a single file."""
+        metadata = self.parse_metadata_from_file(file_path)
+        return self._format_entry(str(file_path.relative_to(self.repo_root)),
+                                  metadata.get('Status'), metadata.get('Last Updated'))
+
+    def _format_entry(self, relative_path: str, status: Optional[str],
+                      date: Optional[str]) -> str:
+        """Index line for a document with the given Status and Last Updated values."""
+        status = status or '🚧 Draft'
+        date = date or '2025-01-01'
+        return f"- [{relative_path}]({relative_path}) – {status} – {date}"
+
+    def _render_index(self, entries: Dict[str, str], shard: str = "",
+                      child_shards: List[Tuple[str, int]] = ()) -> str:
+        """
+        Render one index file from a map of repo-relative path to entry line.
+
+        For a shard (a subtree's index) links are made relative to the shard's
+        directory; child_shards are (directory, document count) pairs linked
+        at the top.
+        """
+        # Group entries by top-level directory (of the shard)
+        sections: Dict[str, List[str]] = {}
+        for relative_path in entries:
+            local_path = (posixpath.relpath(Path(relative_path).as_posix(), shard)
+                          if shard else relative_path)
+            section = self._section_for(local_path)
+            if shard and section == "Project Root":
+                section = shard
+            sections.setdefault(section, []).append(relative_path)
+
+        if shard:
+            parent_index = posixpath.relpath(self._shard_parent_file(shard),
+                                             (self.repo_root / shard).as_posix())
+            parts = [f"{self.SHARD_TITLE}{shard}\n\nDocumentation under `{shard}/`. "
+                     f"Back to the [parent index]({parent_index}).\n\n"]
+        else:
+            parts = [self.INDEX_HEADER]
+
+        if child_shards:
+            index_dir = (self.repo_root / shard) if shard else self.index_file.parent
+            parts.append("\n## Indexes\n")
+            for child, count in child_shards:
+                link = posixpath.relpath(self._shard_file(child).as_posix(),
+                                         index_dir.as_posix())
+                parts.append(f"- 📁 [{child}/]({link}) – {count} documents\n")
+            parts.append("\n")
+
+        # Sort sections (Project Root / the shard itself first, then alphabetically),
+        # files by path
+        first = shard or "Project Root"
+        for section_name in sorted(sections, key=lambda x: (x != first, x)):
+            parts.append(f"\n## {section_name}\n")
+            for relative_path in sorted(sections[section_name]):
+                line = entries[relative_path]
+                if shard:
+                    line = self._relink(line, shard)
+                parts.append(line + "\n")
+            parts.append("\n")
+
+        return "".join(parts)
+
+    def _relink(self, line: str, shard: str) -> str:
+        """
+        Rewrite an entry's link target relative to a shard directory (the label
+        stays repo-relative).
+        """
+        match = self.INDEX_ENTRY_PATTERN.match(line)
+        if not match:
+            return line
+        target = posixpath.relpath(Path(match.group(1)).as_posix(), shard)
+        return f"- [{match.group(1)}]({target})" + line[match.end():]
+
+    def _shard_file(self, shard: str) -> Path:
+        """Index file of a shard directory ('' is the root index)."""
+        if not shard:
+            return self.index_file
+        return self.repo_root / shard / self.index_file.name
+
+    def _shard_parent_file(self, shard: str) -> str:
+        """POSIX path of the index file one level above a shard (see _render_files)."""
+        return self._parents.get(shard, self.index_file.as_posix())
+
+    def _plan_shards(self, relative_paths) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """
+        Assign each repo-relative path to an index: the deepest ancestor
+        directory (up to shard_depth) holding at least shard_threshold
+        documents, or the root ('').
+        Returns (path -> shard, shard -> documents in its subtree).
+        """
+        counts: Dict[str, int] = {}
+        directories = {}
+        for relative_path in relative_paths:
+            parts = Path(relative_path).parts[:-1][:self.shard_depth]
+            directories[relative_path] = parts
+            for depth in range(1, len(parts) + 1):
+                key = '/'.join(parts[:depth])
+                counts[key] = counts.get(key, 0) + 1
+
+        minimum = max(self.shard_threshold, 1)
+        shards = {key: count for key, count in counts.items() if count >= minimum}
+        assignment = {}
+        for relative_path, parts in directories.items():
+            assignment[relative_path] = next(
+                ('/'.join(parts[:depth]) for depth in range(len(parts), 0, -1)
+                 if '/'.join(parts[:depth]) in shards), '')
+        return assignment, shards
+
+    def _render_files(self, entries: Dict[str, str]) -> Dict[Path, str]:
+        """Render every index file (just the root one unless sharding is enabled)."""
+        self._parents = {}
+        if not self.shard_depth:
+            return {self.index_file: self._render_index(entries)}
+
+        assignment, shards = self._plan_shards(entries)
+        members: Dict[str, Dict[str, str]] = {shard: {} for shard in shards}
+        members[''] = {}
+        for relative_path, shard in assignment.items():
+            members[shard][relative_path] = entries[relative_path]
+
+        children: Dict[str, List[Tuple[str, int]]] = {shard: [] for shard in members}
+        for shard in sorted(shards):
+            parts = shard.split('/')
+            parent = next(('/'.join(parts[:depth])
+                           for depth in range(len(parts) - 1, 0, -1)
+                           if '/'.join(parts[:depth]) in shards), '')
+            children[parent].append((shard, shards[shard]))
+            self._parents[shard] = self._shard_file(parent).as_posix()
+
+        return {self._shard_file(shard):
+                self._render_index(members[shard], shard, children[shard])
+                for shard in members}
 
     def _generate_index_content(self, files: List[Path]) -> str:
         """Generate complete index content from list of files with simple directory grouping."""
-        content = "# Documentation Index\n\nThis file contains links to all documentation in the repository.\n\n"
-
-        # Group files by top-level directory
-        sections = {}
-
+        entries = {}
         for file_path in files:
-            relative_path = file_path.relative_to(self.repo_root)
-            parts = relative_path.parts
-
-            if len(parts) == 1:  # Root level file
-                section_name = "Project Root"
-            else:
-                # Use first directory as section name
-                section_name = parts[0].replace('-', ' ').replace('_', ' ').title()
-
-            if section_name not in sections:
-                sections[section_name] = []
-            sections[section_name].append(file_path)
-
-        # Sort sections (Project Root first, then alphabetically)
-        sorted_sections = sorted(sections.keys(), key=lambda x: (x != "Project Root", x))
-
-        # Generate content for each section
-        for section_name in sorted_sections:
-            content += f"\n## {section_name}\n"
-
-            # Sort files within section by path
-            section_files = sorted(sections[section_name], key=lambda x: str(x.relative_to(self.repo_root)))
-
-            for file_path in section_files:
-                relative_path = file_path.relative_to(self.repo_root)
-                metadata = self.parse_metadata_from_file(file_path)
-
-                status = metadata.get('Status', '🚧 Draft')
-                date = metadata.get('Last Updated', '2025-01-01')
-
-                content += f"- [{relative_path}]({relative_path}) – {status} – {date}\n"
+            relative_path = str(file_path.relative_to(self.repo_root))
+            entries[relative_path] = self._index_entry(file_path)
+        return self._render_files(entries)[self.index_file]
+
+    def _read_index_files(self) -> Dict[Path, str]:
+        """Text of the root index and every shard it links to (empty if none)."""
+        files: Dict[Path, str] = {}
+        queue = [self.index_file]
+        while queue:
+            index_path = queue.pop()
+            if index_path in files:
+                continue
+            try:
+                text = self.fs.read_bytes(index_path).decode('utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            # Only DocMan-generated shards inside the repository are followed
+            if index_path != self.index_file and not text.startswith(self.SHARD_TITLE):
+                continue
+            files[index_path] = text
+            for line in text.split('\n'):
+                match = (self.SHARD_LINK_PATTERN.match(line)
+                         if line.startswith('- 📁') else None)
+                if match:
+                    shard_path = Path(os.path.normpath(index_path.parent
+                                                       / match.group(2)))
+                    if (shard_path.name == self.index_file.name
+                            and self.repo_root in shard_path.parents):
+                        queue.append(shard_path)
+        return files
+
+    def _entries_from(self, files: Dict[Path, str]) -> Dict[str, str]:
+        """
+        Entry lines of all index files, keyed by repo-relative path and with
+        repo-relative links.
+        """
+        entries = {}
+        for text in files.values():
+            for line in text.split('\n'):
+                match = self.INDEX_ENTRY_PATTERN.match(line)
+                if match:
+                    label = match.group(1)
+                    entries[label] = f"- [{label}]({label})" + line[match.end():]
+        return entries
+
+    def _read_index_entries(self) -> Optional[Dict[str, str]]:
+        """
+        Parse the existing index (and its shards) into a map of path to entry
+        line, or None if there is none.
+        """
+        files = self._read_index_files()
+        if self.index_file not in files:
+            return None
+        return self._entries_from(files)
+
+    def _write_files(self, entries: Dict[str, str], existing: Dict[Path, str]) -> None:
+        """
+        Write the index files whose content changed and delete shards that are
+        no longer part of the layout.
+        """
+        rendered = self._render_files(entries)
+        for index_path, content in rendered.items():
+            self.fs.write_text_if_changed(index_path, content)
+        for index_path in existing:
+            if index_path not in rendered and index_path != self.index_file:
+                self.fs.remove(index_path)
+
+    def _patched_entries(self, updated_files: List[Path],
+                         removed_paths: List[Path] = ()):
+        """
+        Existing entries with updated files re-rendered and removed ones
+        dropped; returns (entries or None, added).
+        """
+        entries = self._read_index_entries()
+        if entries is None:
+            return None, 0
+        entries = dict(entries)
+
+        added = 0
+        for removed in removed_paths:
+            entries.pop(Path(removed).as_posix(), None)
+        for file_path in updated_files:
+            if self._is_index_file(file_path):
+                continue
+            relative_path = str(file_path.relative_to(self.repo_root))
+            if relative_path not in entries:
+                added += 1
+            entries[relative_path] = self._index_entry(file_path)
+        return entries, added
+
+    def update_entries(self, updated_files: List[Path],
+                       removed_paths: List[Path] = ()) -> int:
+        """
+        Incrementally patch the index: refresh updated files and drop removed ones.
+
+        Entries for all other files are kept exactly as they are, so no walk of
+        the repository is needed. Falls back to a full rebuild if there is no index yet.
+        Returns the number of entries that were added.
+        """
+        try:
+            if self.catalog is not None:
+                documents = [f for f in updated_files if not self._is_index_file(f)]
+                self.catalog.sync(documents, self.cache, removed=removed_paths)
+            entries, added = self._patched_entries(updated_files, removed_paths)
+            if entries is None:
+                self._rebuild_index(self.ignore_patterns)
+                return 0
 
-            content += "\n"
+            self._write_files(entries, self._read_index_files())
+            return added
 
-        return content
+        except Exception as e:
+            print(f"Warning: Incremental index update failed: {e}")
+            return 0
 
     def _cleanup_index(self):
         """Remove entries for files that no longer exist or should be ignored."""
-        if not self.index_file.exists():
+        if not self.fs.exists(self.index_file):
             return
 
         try:
-            content = self.index_file.read_text(encoding='utf-8')
+            content = self.fs.read_text(self.index_file)
             lines = content.split('\n')
             cleaned_lines = []
 
@@ -220,7 +544,7 @@ class DocumentationIndexer:
 
                     # Also check if file exists
                     full_path = self.repo_root / file_path
-                    file_exists = full_path.exists()
+                    file_exists = self.fs.exists(full_path)
 
                     # Keep line only if file exists AND is not ignored
                     if file_exists and not should_ignore:
@@ -232,24 +556,61 @@ class DocumentationIndexer:
 
             # Write cleaned content back
             cleaned_content = '\n'.join(cleaned_lines)
-            self.index_file.write_text(cleaned_content, encoding='utf-8')
+            self.fs.write_atomic(self.index_file, cleaned_content.encode('utf-8'))
 
         except Exception as e:
             # If cleanup fails, continue without error
             print(f"Warning: Index cleanup failed: {e}")
             pass
 
+    def sync_catalog(self) -> int:
+        """
+        Bring the catalog (if any) up to date with the indexed files; returns
+        the number of rows rewritten.
+        """
+        if self.catalog is None:
+            return 0
+        return self.catalog.sync(self._indexed_files(self.ignore_patterns), self.cache,
+                                 complete=True)
+
+    def _is_index_file(self, file_path: Path) -> bool:
+        """Whether a path is the root index or a generated shard (never listed)."""
+        if file_path == self.index_file:
+            return True
+        if file_path.name != self.index_file.name:
+            return False
+        try:
+            with self.fs.open(file_path) as handle:
+                return handle.readline().decode('utf-8').startswith(self.SHARD_TITLE)
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def _indexed_files(self, ignore_patterns) -> List[Path]:
+        """
+        Markdown files that belong in the index (from the shared snapshot when
+        its patterns match).
+        """
+        snapshot = self.snapshot
+        if (snapshot is not None and snapshot.complete
+                and snapshot.ignore_patterns == ignore_patterns):
+            files = self.snapshot.markdown_files
+        else:
+            snapshot = scan_repository(self.repo_root, ignore_patterns, self.fs)
+            files = snapshot.markdown_files
+        # The index never lists itself or its shards, so a second run renders
+        # the same bytes
+        return [file_path for file_path in files if not self._is_index_file(file_path)]
+
     def _rebuild_index(self, ignore_patterns: List[str]):
         """Completely rebuild the index with only valid, non-ignored files."""
         try:
-            # Find all markdown files in the repository using the same logic as CLI
-            all_md_files = find_all_markdown_files(self.repo_root, ignore_patterns)
-
-            # Generate new index content
-            content = self._generate_index_content(all_md_files)
-
-            # Write the new index
-            self.index_file.write_text(content, encoding='utf-8')
+            # Index files are only written where their content differs from the
+            # file on disk
+            entries = {}
+            for file_path in self._indexed_files(ignore_patterns):
+                relative_path = str(file_path.relative_to(self.repo_root))
+                entries[relative_path] = self._index_entry(file_path)
+            self._write_files(entries, self._read_index_files())
 
         except Exception as e:
             print(f"Warning: Index rebuild failed: {e}")
@@ -0,0 +1,122 @@
+"""
+Link Graph
+
+Doc-to-doc link graph on top of the documentation catalog. Every link row
+stores the repo-relative path it resolves to, indexed as (resolved, source),
+so the catalog holds both adjacency lists: forward (links of a document) and
+reverse (documents linking to a path). "Who links to X?" and "what breaks if
+X is deleted?" are single index lookups instead of a re-parse of the
+repository; the graph can be exported as Graphviz DOT or JSON.
+"""
+
+import json
+import posixpath
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Iterable
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from catalog import DocumentCatalog
+
+GRAPH_FORMATS = ("dot", "json")
+
+
+@dataclass(frozen=True)
+class InboundLink:
+    """A link in `source` (at `line`) whose target `link` resolves to `target`."""
+    source: str
+    line: int
+    link: str
+    target: str
+
+
+class LinkGraph:
+    """Forward and reverse adjacency lists of the documents in a catalog."""
+
+    def __init__(self, catalog: DocumentCatalog):
+        """Initialize with an open catalog (read-only is enough)."""
+        self.catalog = catalog
+
+    def repo_path(self, name) -> str:
+        """
+        Repo-relative POSIX key for a path argument: paths inside the repository
+        (absolute or relative to the working directory) are made relative to its
+        root; anything else is taken as already repo-relative.
+        """
+        path = Path(name)
+        candidate = path if path.is_absolute() else Path.cwd() / path
+        try:
+            relative = candidate.resolve().relative_to(self.catalog.repo_root.resolve())
+            return relative.as_posix() if relative.parts else '.'
+        except ValueError:
+            return posixpath.normpath(path.as_posix())
+
+    def who_links_to(self, path: str) -> List[InboundLink]:
+        """Links pointing at `path` exactly: a document, or a directory like `docs/`."""
+        rows = self.catalog.execute(
+            "SELECT source, line, target, resolved FROM links "
+            "WHERE resolved = ? ORDER BY source, line",
+            (path,))
+        return [InboundLink(*row) for row in rows]
+
+    def impact_of_delete(self, path: str) -> List[InboundLink]:
+        """
+        Links that would break if `path` (a file or a whole directory) were deleted:
+        links to it or to anything below it, from documents outside of it.
+        """
+        if path == '.':
+            return []
+        prefix = path.rstrip('/') + '/'
+        # resolved in [prefix, prefix with '/' bumped to '0') is a range scan on
+        # the index
+        upper = prefix[:-1] + '0'
+        rows = self.catalog.execute(
+            "SELECT source, line, target, resolved FROM links "
+            "WHERE (resolved = ? OR (resolved >= ? AND resolved < ?)) "
+            "AND source != ? AND NOT (source >= ? AND source < ?) "
+            "ORDER BY source, line",
+            (path, prefix, upper, path, prefix, upper))
+        return [InboundLink(*row) for row in rows]
+
+    def adjacency(self) -> Dict[str, List[str]]:
+        """Forward adjacency lists: every document mapped to its link targets."""
+        paths = self.catalog.execute("SELECT path FROM documents ORDER BY path")
+        graph: Dict[str, List[str]] = {path: [] for (path,) in paths}
+        rows = self.catalog.execute(
+            "SELECT DISTINCT links.source, links.resolved FROM links "
+            "JOIN documents ON documents.path = links.resolved "
+            "WHERE links.resolved != links.source "
+            "ORDER BY links.source, links.resolved")
+        for source, target in rows:
+            graph[source].append(target)
+        return graph
+
+    def to_json(self) -> str:
+        """The graph as JSON: nodes plus forward adjacency lists."""
+        graph = self.adjacency()
+        return json.dumps({'nodes': list(graph), 'adjacency': graph},
+                          ensure_ascii=False, indent=2)
+
+    def to_dot(self) -> str:
+        """The graph in Graphviz DOT format."""
+        lines = ["digraph docs {", "  rankdir=LR;", "  node [shape=box];"]
+        for source, targets in self.adjacency().items():
+            lines.append(f"  {_dot_id(source)};")
+            for target in targets:
+                lines.append(f"  {_dot_id(source)} -> {_dot_id(target)};")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, graph_format: str) -> str:
+        """Render the graph in one of GRAPH_FORMATS."""
+        return self.to_dot() if graph_format == "dot" else self.to_json()
+
+
+def _dot_id(path: str) -> str:
+    """Quoted DOT identifier for a path."""
+    return '"' + path.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def inbound_to_dicts(links: Iterable[InboundLink]) -> List[Dict[str, object]]:
+    """Plain dicts for JSON output."""
+    return [asdict(link) for link in links]
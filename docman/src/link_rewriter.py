@@ -0,0 +1,187 @@
+"""
+Link Rewriter
+
+Rewrites relative links when documents or directories are moved. Documents
+linking into a moved path are found through the catalog's reverse link index
+(no rescan of the repository), links inside moved documents are re-pointed
+from their new location, and every affected file is rewritten once,
+atomically, with all of its edits applied in a single pass. Documents are
+read and written through a DocFS.
+"""
+
+import os
+import posixpath
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from catalog import DocumentCatalog, resolve_link
+from docfs import DISK, DocFS
+from documents import link_destination_span, parse_document, split_link
+
+
+@dataclass
+class LinkEdit:
+    """One link destination to replace in a file."""
+    file: str  # repo-relative path of the file as it is on disk
+    line: int
+    old: str
+    new: str
+
+
+class LinkRewriter:
+    """
+    Plans and applies link rewrites for a set of moves (old path -> new path,
+    repo-relative).
+    """
+
+    def __init__(self, repo_root: Path, catalog: DocumentCatalog, moves: Dict[str, str],
+                 fs: DocFS = None):
+        """Initialize with an up-to-date catalog and the moves (files or folders)."""
+        self.repo_root = Path(repo_root)
+        self.catalog = catalog
+        self.fs = fs or DISK
+        self.moves = {posixpath.normpath(old): posixpath.normpath(new)
+                      for old, new in moves.items()}
+        self._reverse = {new: old for old, new in self.moves.items()}
+
+    def moved(self, path: str) -> Optional[str]:
+        """New location of a path that is, or lies below, a moved path (or None)."""
+        return _map_path(path, self.moves)
+
+    def _origin(self, path: str) -> Optional[str]:
+        """Old location of a path that is, or lies below, a move destination."""
+        return _map_path(path, self._reverse)
+
+    def _subtree_rows(self, column: str, path: str):
+        """Link rows whose `column` (resolved or source) is `path` or lies below it."""
+        prefix = path + '/'
+        upper = path + '0'  # '/' + 1: an index range scan over the subtree
+        return self.catalog.execute(
+            f"SELECT DISTINCT source FROM links "
+            f"WHERE {column} = ? OR ({column} >= ? AND {column} < ?)",
+            (path, prefix, upper))
+
+    def plan(self, moved_files: Iterable[str] = (),
+             already_moved: bool = False) -> Dict[str, List[LinkEdit]]:
+        """
+        Edits per file (keyed by its current repo-relative path) that keep every
+        link pointing at the same document after the moves.
+
+        With already_moved=False the files are still at their old locations
+        (`cli.py move` rewrites first, then moves); with True the moves have
+        happened (renames detected from git) and `moved_files` lists the new
+        paths of the moved documents.
+        """
+        # Sources: documents linking into a moved path (reverse index) and the
+        # moved documents
+        sources: Set[str] = set()
+        for old in self.moves:
+            sources.update(row[0] for row in self._subtree_rows('resolved', old))
+            if not already_moved:
+                sources.update(row[0] for row in self._subtree_rows('source', old))
+        sources.update(moved_files)
+
+        edits: Dict[str, List[LinkEdit]] = {}
+        for current in sorted(sources):
+            old_source = current
+            if already_moved:
+                old_source = self._origin(current) or current
+            new_source = self.moved(old_source) or old_source
+
+            file_edits = self._plan_file(current, old_source, new_source, already_moved)
+            if file_edits:
+                edits[current] = file_edits
+        return edits
+
+    def _plan_file(self, current: str, old_source: str, new_source: str,
+                   already_moved: bool = False) -> List[LinkEdit]:
+        """Edits for one file whose links were written relative to old_source."""
+        try:
+            text = self.fs.read_bytes(self.repo_root / current).decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return []
+
+        edits = []
+        for link in parse_document(text).links:
+            intended = resolve_link(old_source, link.target)
+            if intended is None:
+                continue
+            destination = self.moved(intended) or intended
+            current_target = resolve_link(new_source, link.target)
+            if current_target == destination:
+                continue  # still points at the same document
+            if already_moved and old_source != new_source and (
+                    self._exists(current_target) or not self._exists(destination)):
+                # Fixed by an earlier pass (or broken before the move): leave it alone
+                continue
+
+            path, _ = split_link(link.target)
+            suffix = link.target[len(path):]
+            relative = posixpath.relpath(destination,
+                                         posixpath.dirname(new_source) or '.')
+            if path.endswith('/') and not relative.endswith('/'):
+                relative += '/'
+            edits.append(LinkEdit(current, link.line, link.target, relative + suffix))
+        return edits
+
+    def _exists(self, path: Optional[str]) -> bool:
+        return path is not None and self.fs.exists(self.repo_root / path)
+
+    def apply(self, edits: Dict[str, List[LinkEdit]]) -> Tuple[int, int]:
+        """Rewrite each file once, atomically; return (files, links) rewritten."""
+        files = links = 0
+        for current, file_edits in edits.items():
+            file_path = self.repo_root / current
+            try:
+                text = self.fs.read_bytes(file_path).decode('utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            lines = text.split('\n')
+            by_line: Dict[int, List[LinkEdit]] = {}
+            for edit in file_edits:
+                by_line.setdefault(edit.line, []).append(edit)
+            document_links = parse_document(text).links
+
+            rewritten = 0
+            for line_number, line_edits in by_line.items():
+                line = lines[line_number - 1]
+                pending = {edit.old: edit.new for edit in line_edits}
+                spans = []
+                for link in document_links:
+                    if link.line == line_number and link.target in pending:
+                        span = link_destination_span(line, link)
+                        if span is not None:
+                            spans.append((span, link.target, pending[link.target]))
+                # Right to left, so earlier spans keep their offsets
+                for (start, end), old, new in sorted(spans, reverse=True):
+                    line = (line[:start] + line[start:end].replace(old, new, 1)
+                            + line[end:])
+                    rewritten += 1
+                lines[line_number - 1] = line
+
+            if rewritten:
+                self.fs.write_atomic(file_path, '\n'.join(lines).encode('utf-8'))
+                files += 1
+                links += rewritten
+        return files, links
+
+
+def _map_path(path: str, mapping: Dict[str, str]) -> Optional[str]:
+    """Apply the longest matching (file or directory) prefix of a mapping to a path."""
+    candidate = path
+    while candidate and candidate != '.':
+        target = mapping.get(candidate)
+        if target is not None:
+            return target + path[len(candidate):]
+        candidate = posixpath.dirname(candidate)
+    return None
+
+
+def move_path(repo_root: Path, old: str, new: str) -> None:
+    """Move a file or directory inside the repository, creating missing parents."""
+    source, destination = Path(repo_root) / old, Path(repo_root) / new
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    os.rename(source, destination)
@@ -0,0 +1,191 @@
+"""
+Parallel Validation
+
+Spreads per-file parsing, metadata checks and link checks over a process pool
+for --jobs. Files are sent in chunks, biggest first, and results are merged
+back in sorted path order so the output is identical to a serial run.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from corpus import DocumentCorpus
+from documents import ParsedDocument, load_document, parse_document
+from reporter import Violation
+from scanner import RepoSnapshot
+from validators.metadata_validator import MetadataValidator
+from validators.link_validator import LinkValidator
+
+
+def default_jobs() -> int:
+    """Default worker count: one per CPU."""
+    return os.cpu_count() or 1
+
+
+class _PreparsedLoader:
+    """Serves the documents handed to a worker, parsing the rest from disk."""
+
+    def __init__(self):
+        self.documents: Dict[Path, ParsedDocument] = {}
+        self.fresh: Dict[Path, ParsedDocument] = {}
+
+    def load(self, file_path: Path) -> ParsedDocument:
+        document = self.documents.get(file_path)
+        if document is None:
+            document = parse_document(Path(file_path).read_text(encoding='utf-8'))
+            self.documents[file_path] = self.fresh[file_path] = document
+        return document
+
+
+# Per-process state, set up once by the pool initializer
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(repo_root: Path, ignore_patterns, config,
+                 snapshot: RepoSnapshot = None) -> None:
+    """Create the validators once per worker process."""
+    loader = _PreparsedLoader()
+    _worker['loader'] = loader
+    _worker['metadata'] = MetadataValidator(repo_root, ignore_patterns, config,
+                                            cache=loader)
+    # With the snapshot, link targets are checked against its listings
+    # instead of stat calls
+    _worker['links'] = LinkValidator(repo_root, ignore_patterns, snapshot=snapshot,
+                                     cache=loader)
+
+
+def _validate_chunk(chunk: List[Tuple[Path, Optional[ParsedDocument]]]):
+    """
+    Validate a chunk of files; returns (path, freshly parsed document or None,
+    metadata, links) per file.
+    """
+    loader = _worker['loader']
+    metadata_validator = _worker['metadata']
+    link_validator = _worker['links']
+
+    results = []
+    for file_path, document in chunk:
+        loader.documents.clear()
+        loader.fresh.clear()
+        if document is not None:
+            loader.documents[file_path] = document
+
+        metadata = metadata_validator.collect_violations([file_path])
+        # Fragments need other documents' anchors: checked in the parent afterwards
+        links = link_validator.collect_file_link_violations(file_path,
+                                                            check_fragments=False)
+        results.append((file_path, loader.fresh.get(file_path), metadata, links))
+    return results
+
+
+class ParallelValidator:
+    """Runs metadata and link validation for many files on a process pool."""
+
+    DEFAULT_CHUNK_SIZE = 64
+    # Below this many files the pool start-up costs more than it saves
+    MIN_FILES = 256
+
+    def __init__(self, repo_root: Path, config, jobs: int = None, cache=None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, snapshot: RepoSnapshot = None,
+                 corpus: DocumentCorpus = None):
+        """
+        Initialize with repository root, config, worker count, optional parse
+        cache, snapshot and corpus.
+        """
+        self.repo_root = Path(repo_root)
+        self.config = config
+        self.snapshot = snapshot
+        self.jobs = jobs or default_jobs()
+        self.cache = cache
+        self.chunk_size = chunk_size
+        # Documents parsed during validate(), reused by later phases through load().
+        # With a corpus they are handed over to it once validation is done.
+        self.documents: Dict[Path, ParsedDocument] = {}
+        self.corpus = corpus
+
+    def should_run(self, file_count: int) -> bool:
+        """Whether a pool is worth starting for this many files."""
+        return self.jobs > 1 and file_count >= self.MIN_FILES
+
+    def load(self, file_path: Path) -> ParsedDocument:
+        """Return a parsed document, else load it via the corpus, cache or disk."""
+        document = self.documents.get(Path(file_path))
+        if document is None:
+            if self.corpus is not None:
+                return self.corpus.load(file_path)
+            document = load_document(file_path, self.cache)
+            self.documents[Path(file_path)] = document
+        return document
+
+    def _schedule(self, files: List[Path]):
+        """Look up cached records, sort files biggest first; return (items, stats)."""
+        items = []
+        stats = {}
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                # Let the worker report the read error
+                items.append((0, file_path, None))
+                continue
+            stats[file_path] = stat
+            document = (self.cache.get(file_path, stat)
+                        if self.cache is not None else None)
+            if document is not None:
+                self.cache.hits += 1
+            items.append((stat.st_size, file_path, document))
+
+        items.sort(key=lambda item: (-item[0], item[1]))
+        return [(file_path, document) for _, file_path, document in items], stats
+
+    def validate(self, files: List[Path]) -> Tuple[List[Violation], List[Violation]]:
+        """
+        Validate metadata and links of the given files; returns (metadata, link)
+        violations in path order.
+        """
+        work, stats = self._schedule(list(files))
+        chunks = [work[i:i + self.chunk_size]
+                  for i in range(0, len(work), self.chunk_size)]
+
+        results = {}
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(self.repo_root, self.config.ignore_patterns, self.config,
+                      self.snapshot)
+        ) as executor:
+            futures = [executor.submit(_validate_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for file_path, fresh, metadata, links in future.result():
+                    results[file_path] = (metadata, links)
+                    if fresh is not None:
+                        self.documents[file_path] = fresh
+                        if self.cache is not None and file_path in stats:
+                            self.cache.misses += 1
+                            self.cache.put(file_path, stats[file_path], fresh)
+
+        for file_path, document in work:
+            if document is not None:
+                self.documents[file_path] = document
+
+        # Deterministic merge: same order as a serial run over the sorted file list.
+        # Fragments are checked here, against the documents the workers parsed.
+        fragment_validator = LinkValidator(self.repo_root, self.config.ignore_patterns,
+                                           snapshot=self.snapshot, cache=self)
+        metadata_violations, link_violations = [], []
+        for file_path in sorted(results):
+            metadata, links = results[file_path]
+            metadata_violations.extend(metadata)
+            link_violations.extend(links)
+            if file_path in self.documents:
+                link_violations.extend(
+                    fragment_validator.collect_fragment_violations(file_path))
+
+        if self.corpus is not None:
+            for file_path, document in self.documents.items():
+                self.corpus.add(file_path, document)
+            self.documents.clear()
+        return metadata_violations, link_violations
@@ -5,8 +5,48 @@ Handles all output formatting and reporting functionality.
 Provides terminal output with emojis and proper exit codes.
 """
 
-from typing import List, Dict
-from dataclasses import dataclass
+import json
+import sys
+from typing import Any, List, Dict, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Violation:
+    """A single structured finding produced by a validator."""
+    rule: str
+    file: str
+    message: str
+    line: Optional[int] = None
+    severity: str = "error"
+    target: Optional[str] = None
+
+    # Legacy one-line text for each rule, as printed in the summary
+    TEXT_TEMPLATES = {
+        "missing-readme": "🚧 Missing README: {file}",
+        "metadata": "🚧 Bad metadata in {file}: {message}",
+        "broken-link": "🚧 Broken link in {file}: {target}",
+        "broken-anchor": "🚧 Broken anchor in {file}: {target}",
+        "date-inconsistency": "🚧 {message}",
+        "read-error": "Could not read file: {message}",
+        "index-out-of-date": "🚧 {message}",
+    }
+
+    def format(self) -> str:
+        """Render the violation as the human-readable summary line."""
+        template = self.TEXT_TEMPLATES.get(self.rule, "🚧 {file}: {message}")
+        return template.format(file=self.file, message=self.message, target=self.target)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-friendly dict (omitting empty optional fields)."""
+        data = {"rule": self.rule, "file": self.file, "line": self.line,
+                "message": self.message, "severity": self.severity}
+        if self.target is not None:
+            data["target"] = self.target
+        return data
+
+    def __str__(self) -> str:
+        return self.format()
 
 
 @dataclass
@@ -17,17 +57,87 @@ class ValidationResult:
     broken_links: List[str]
     date_bumps: List[str]
     new_index_entries: List[str]
+    # Structured records behind the text lists (used by JSON/NDJSON output)
+    violations: List[Violation] = field(default_factory=list)
+    index_files: List[str] = field(default_factory=list)
+    # Set by --check: differences between the would-be index and the file on disk
+    index_checked: bool = False
+    index_drift: List[str] = field(default_factory=list)
+
+    @property
+    def total_issues(self) -> int:
+        """Number of issues that fail the run (date inconsistencies are warnings)."""
+        return (len(self.missing_readmes) + len(self.metadata_violations)
+                + len(self.broken_links) + len(self.index_drift))
 
 
 class Reporter:
     """Handles all reporting and output formatting."""
+
+    OUTPUT_FORMATS = ("text", "json", "ndjson")
     
-    def __init__(self, verbose: bool = False):
-        """Initialize reporter with verbosity setting."""
+    def __init__(self, verbose: bool = False, output_format: str = "text", stream=None):
+        """Initialize reporter with verbosity, output format and optional stream."""
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
         self.verbose = verbose
-    
+        self.output_format = output_format
+        self._stream = stream
+        self._emitted = set()
+
+    @property
+    def stream(self):
+        """Stream for JSON/NDJSON records (stdout unless given)."""
+        return self._stream or sys.stdout
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        """Write one NDJSON record and flush so consumers see it immediately."""
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def emit(self, violation: Violation) -> None:
+        """Report a violation as soon as it is found (NDJSON mode only, else no-op)."""
+        if self.output_format == "ndjson" and id(violation) not in self._emitted:
+            self._emitted.add(id(violation))
+            self._write_record({"type": "violation", **violation.to_dict()})
+
+    def _summary_counts(self, results: ValidationResult) -> Dict[str, int]:
+        """Per-section counts for structured output."""
+        return {
+            "missingReadmes": len(results.missing_readmes),
+            "metadataViolations": len(results.metadata_violations),
+            "brokenLinks": len(results.broken_links),
+            "dateInconsistencies": len(results.date_bumps),
+            "newIndexEntries": len(results.new_index_entries),
+            "indexDrift": len(results.index_drift),
+            "issues": results.total_issues,
+        }
+
     def print_summary(self, results: ValidationResult) -> int:
-        """Print terminal summary and return appropriate exit code."""
+        """Print the summary in the configured format and return the exit code."""
+        exit_code = 1 if results.total_issues else 0
+
+        if self.output_format == "json":
+            json.dump({
+                "violations": [v.to_dict() for v in results.violations],
+                "indexEntries": results.index_files,
+                "summary": self._summary_counts(results),
+                "exitCode": exit_code,
+            }, self.stream, ensure_ascii=False, indent=2)
+            self.stream.write("\n")
+            self.stream.flush()
+            return exit_code
+
+        if self.output_format == "ndjson":
+            # Anything not streamed while validating goes out now
+            for violation in results.violations:
+                self.emit(violation)
+            for relative_path in results.index_files:
+                self._write_record({"type": "index-entry", "file": relative_path})
+            self._write_record({"type": "summary", **self._summary_counts(results),
+                                "exitCode": exit_code})
+            return exit_code
+
         print("\n" + "="*60)
         print("📊 DOCUMENTATION VALIDATION SUMMARY")
         print("="*60)
@@ -37,12 +147,13 @@ class Reporter:
         self.print_section("Metadata violations", results.metadata_violations, "🚧")
         self.print_section("Broken links", results.broken_links, "🚧")
         self.print_section("Date inconsistencies", results.date_bumps, "🚧")
-        self.print_section("New index entries", results.new_index_entries, "✅")
+        if results.index_checked:
+            self.print_section("Index out of date", results.index_drift, "🚧")
+        else:
+            self.print_section("New index entries", results.new_index_entries, "✅")
 
         # Calculate total issues (date inconsistencies are warnings, not errors)
-        total_issues = (len(results.missing_readmes) +
-                       len(results.metadata_violations) +
-                       len(results.broken_links))
+        total_issues = results.total_issues
 
         print("-"*60)
         if total_issues == 0:
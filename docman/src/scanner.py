@@ -0,0 +1,249 @@
+"""
+Repository Scanner
+
+Walks the repository once through a DocFS (os.scandir on disk) and produces a
+RepoSnapshot that is shared by every validator phase and the indexer, so the
+tree is never walked more than once per run.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from utils import get_ignore_matcher, CACHE_DIR_NAME, DEFAULT_IGNORE_PATTERNS
+from docfs import DISK, DocFS
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Names of the non-ignored entries of a single directory."""
+    dirs: FrozenSet[str] = field(default_factory=frozenset)
+    files: FrozenSet[str] = field(default_factory=frozenset)
+
+
+class RepoSnapshot:
+    """In-memory view of the repository: directories, markdown files and listings."""
+
+    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None,
+                 fs: DocFS = None):
+        """
+        Initialize an empty snapshot for the given repository root, listed
+        through `fs` (disk by default).
+        """
+        self.repo_root = Path(repo_root)
+        self.fs = fs or DISK
+        self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
+        self.matcher = get_ignore_matcher(set(self.ignore_patterns) | {CACHE_DIR_NAME})
+        self.directories: List[Path] = []
+        self.markdown_files: List[Path] = []
+        # A partial snapshot covers only selected paths (incremental modes)
+        self.complete = True
+        self.root_in_scope = True
+        self._listings: Dict[Path, DirectoryListing] = {}
+        # Memoized exists() answers, cleared whenever the snapshot changes
+        self._known_paths: Dict[str, bool] = {}
+
+    def relative(self, path: Path) -> str:
+        """A path as a POSIX string relative to the repository root ('' for itself)."""
+        try:
+            relative = Path(path).relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+        return '' if relative == '.' else relative
+
+    @property
+    def virtual(self) -> bool:
+        """Whether some contents are not on disk (git tree, archive, buffers)."""
+        return self.fs.virtual
+
+    def is_ignored(self, path: Path) -> bool:
+        """Check if a path is excluded by the snapshot's ignore patterns."""
+        return self.matcher.matches(self.relative(path))
+
+    def listing(self, directory: Path) -> DirectoryListing:
+        """Return the entries of a directory, listing it on demand if not scanned."""
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = self._list_directory(directory)
+            self._listings[directory] = listing
+        return listing
+
+    def exists(self, path) -> bool:
+        """
+        Check whether a lexically normalized path (str or Path) exists.
+
+        Paths recorded in a directory listing are answered from memory; anything
+        else (ignored, symlinked, outside the repository or missing) is stat'ed
+        once. Answers are memoized until the snapshot changes.
+        """
+        key = str(path)
+        exists = self._known_paths.get(key)
+        if exists is None:
+            parent, name = os.path.split(key)
+            listing = self._listings.get(Path(parent))
+            if listing is not None and (name in listing.files or name in listing.dirs):
+                exists = True
+            else:
+                exists = self.fs.exists(key)
+            self._known_paths[key] = exists
+        return exists
+
+    def has_readme(self, directory: Path) -> bool:
+        """Check README.md presence from the recorded entries (no stat needed)."""
+        return "README.md" in self.listing(directory).files
+
+    def readme_for(self, directory: Path) -> Optional[Path]:
+        """Return the README.md of a directory, or None if it has none."""
+        if self.has_readme(directory):
+            return directory / "README.md"
+        return None
+
+    def readme_files(self) -> List[Path]:
+        """Return all README.md files in the snapshot."""
+        return [f for f in self.markdown_files if f.name == "README.md"]
+
+    def _list_directory(self, directory: Path,
+                        relative_dir: str = None) -> DirectoryListing:
+        """List a single directory, dropping ignored entries."""
+        if relative_dir is None:
+            relative_dir = self.relative(directory)
+        prefix = f"{relative_dir}/" if relative_dir else ''
+        matches_entry = self.matcher.matches_entry
+        try:
+            dirs, files = self.fs.list(directory)
+        except OSError:
+            return DirectoryListing()
+        return DirectoryListing(
+            frozenset(name for name in dirs if not matches_entry(prefix + name, name)),
+            frozenset(name for name in files if not matches_entry(prefix + name, name)))
+
+    def scan(self) -> "RepoSnapshot":
+        """Walk the whole tree once, pruning ignored subtrees before descending."""
+        self.directories = []
+        self.markdown_files = []
+        self._listings = {}
+        self._known_paths = {}
+
+        # Patterns are matched relative to the root, so the root itself is never ignored
+        self._walk(self.repo_root, '', self.directories, self.markdown_files)
+
+        self.directories.sort()
+        self.markdown_files.sort()
+        return self
+
+    def _walk(self, start: Path, relative_start: str,
+              directories: List[Path], markdown_files: List[Path]) -> None:
+        """Walk a subtree iteratively, recording listings, directories and documents."""
+        stack = [(start, relative_start)]
+        while stack:
+            directory, relative_dir = stack.pop()
+            listing = self._list_directory(directory, relative_dir)
+            self._listings[directory] = listing
+
+            for name in listing.files:
+                if name.endswith(".md"):
+                    markdown_files.append(directory / name)
+
+            for name in listing.dirs:
+                subdir = directory / name
+                directories.append(subdir)
+                child = f"{relative_dir}/{name}" if relative_dir else name
+                stack.append((subdir, child))
+
+    def refresh(self, paths: Iterable[Path]) -> None:
+        """
+        Bring the snapshot up to date after files or directories were created,
+        modified or deleted, re-listing only the affected directories.
+        """
+        directories = set(self.directories)
+        markdown_files = set(self.markdown_files)
+        relisted = set()
+        self._known_paths.clear()
+
+        for path in paths:
+            path = self.repo_root / path
+            if path == self.repo_root or self.is_ignored(path):
+                continue
+
+            # Re-list each parent once, even for bursts of changes in one directory
+            parent = path.parent
+            if parent not in relisted and (parent in self._listings
+                                           or parent == self.repo_root):
+                self._listings[parent] = self._list_directory(parent)
+                relisted.add(parent)
+
+            if self.fs.is_dir(path):
+                if path not in directories:
+                    new_dirs, new_files = [path], []
+                    self._walk(path, self.relative(path), new_dirs, new_files)
+                    directories.update(new_dirs)
+                    markdown_files.update(new_files)
+            elif path in directories:
+                # A directory disappeared: drop it and everything below it
+                gone = [d for d in directories if d == path or path in d.parents]
+                directories.difference_update(gone)
+                markdown_files = {f for f in markdown_files if path not in f.parents}
+                for directory in gone:
+                    self._listings.pop(directory, None)
+            elif path.suffix == ".md":
+                if self.fs.is_file(path):
+                    markdown_files.add(path)
+                else:
+                    markdown_files.discard(path)
+
+        self.directories = sorted(directories)
+        self.markdown_files = sorted(markdown_files)
+
+    @classmethod
+    def from_paths(cls, repo_root: Path, ignore_patterns: Set[str] = None,
+                   files: Iterable[Path] = (), directories: Iterable[Path] = (),
+                   fs: DocFS = None) -> "RepoSnapshot":
+        """
+        Build a partial snapshot covering only the given files and directories.
+
+        Only the parents of the given paths are listed, so the cost is bounded
+        by the number of paths rather than the size of the repository.
+        """
+        snapshot = cls(repo_root, ignore_patterns, fs)
+        snapshot.complete = False
+        root = snapshot.repo_root
+
+        scope_dirs = set()
+        for file_path in files:
+            file_path = root / file_path
+            if file_path.suffix != ".md" or snapshot.is_ignored(file_path):
+                continue
+            if file_path.name in snapshot.listing(file_path.parent).files:
+                snapshot.markdown_files.append(file_path)
+                scope_dirs.add(file_path.parent)
+
+        for directory in directories:
+            directory = root / directory
+            if snapshot.fs.is_dir(directory) and not snapshot.is_ignored(directory):
+                scope_dirs.add(directory)
+
+        snapshot.root_in_scope = root in scope_dirs
+        snapshot.directories = sorted(d for d in scope_dirs if d != root)
+        snapshot.markdown_files = sorted(set(snapshot.markdown_files))
+        return snapshot
+
+    def add_paths(self, paths: Iterable[Path]) -> None:
+        """Record files created after the scan (e.g. by auto-fix) without rescanning."""
+        self._known_paths.clear()
+        for path in paths:
+            path = Path(path)
+            parent = path.parent
+            listing = self.listing(parent)
+            self._listings[parent] = DirectoryListing(listing.dirs,
+                                                      listing.files | {path.name})
+            if path.suffix == ".md" and path not in self.markdown_files:
+                self.markdown_files.append(path)
+        self.markdown_files.sort()
+
+
+def scan_repository(repo_root: Path, ignore_patterns: Set[str] = None,
+                    fs: DocFS = None) -> RepoSnapshot:
+    """Scan a repository once (through `fs`, disk by default); return its snapshot."""
+    return RepoSnapshot(repo_root, ignore_patterns, fs).scan()
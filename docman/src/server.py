@@ -0,0 +1,229 @@
+"""
+DocMan Language Server
+
+A long-running JSON-RPC 2.0 daemon over stdio. Editors send validateFile,
+validateWorkspace and didChange requests and get structured diagnostics back
+from a warm ValidationSession instead of spawning the CLI per save.
+
+Messages are framed either with LSP-style Content-Length headers or as one
+JSON object per line; the framing of the first message is used for replies.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from reporter import Violation
+from session import ValidationSession
+
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class DocManServer:
+    """Serves validation requests for one repository over a byte stream pair."""
+
+    def __init__(self, session: ValidationSession, reader, writer):
+        """Initialize with a validation session and binary input/output streams."""
+        self.session = session
+        self.reader = reader
+        self.writer = writer
+        # "lsp" or "ndjson", detected from the first message
+        self.framing: Optional[str] = None
+        self.running = False
+        self.methods = {
+            "initialize": self.handle_initialize,
+            "validateFile": self.handle_validate_file,
+            "validateWorkspace": self.handle_validate_workspace,
+            "didChange": self.handle_did_change,
+            "shutdown": self.handle_shutdown,
+            "exit": self.handle_exit,
+        }
+
+    # --- framing -----------------------------------------------------------
+
+    def read_message(self) -> Optional[bytes]:
+        """Read one framed message body; None at end of input, RpcError if malformed."""
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            if not line.strip():
+                continue
+
+            if line.lower().startswith(b"content-length:"):
+                self.framing = self.framing or "lsp"
+                value = line.split(b":", 1)[1].strip()
+                # Skip remaining headers up to the blank separator line
+                while True:
+                    header = self.reader.readline()
+                    if not header or not header.strip():
+                        break
+                if not value.isdigit():
+                    raise RpcError(PARSE_ERROR,
+                                   f"Parse error: invalid Content-Length {value!r}")
+                return self.reader.read(int(value))
+
+            self.framing = self.framing or "ndjson"
+            return line
+
+    def write_message(self, message: Dict[str, Any]) -> None:
+        """Write one message using the framing the client started with."""
+        body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        if self.framing == "lsp":
+            self.writer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        else:
+            self.writer.write(body + b"\n")
+        self.writer.flush()
+
+    # --- dispatch ----------------------------------------------------------
+
+    def serve(self) -> int:
+        """Process messages until exit or end of input and return the exit code."""
+        self.running = True
+        while self.running:
+            try:
+                body = self.read_message()
+            except RpcError as e:
+                # One malformed frame is answered, not fatal
+                response = self._error(None, e.code, e.message)
+            else:
+                if body is None:
+                    break
+                response = self.handle_message(body)
+            if response is not None:
+                try:
+                    self.write_message(response)
+                except BrokenPipeError:
+                    # Client went away
+                    break
+        return 0
+
+    def handle_message(self, body: bytes) -> Optional[Dict[str, Any]]:
+        """Handle one raw message and return the response (None for notifications)."""
+        try:
+            message = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            return self._error(None, PARSE_ERROR, f"Parse error: {e}")
+
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            return self._error(message.get("id") if isinstance(message, dict) else None,
+                               INVALID_REQUEST, "Invalid request")
+
+        request_id = message.get("id")
+        params = message.get("params") or {}
+        handler = self.methods.get(message["method"])
+
+        try:
+            if handler is None:
+                raise RpcError(METHOD_NOT_FOUND,
+                               f"Method not found: {message['method']}")
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            result = handler(params)
+        except RpcError as e:
+            return (self._error(request_id, e.code, e.message)
+                    if "id" in message else None)
+        except Exception as e:
+            return (self._error(request_id, INTERNAL_ERROR, str(e))
+                    if "id" in message else None)
+        finally:
+            # Persist freshly parsed documents between requests
+            if self.session.cache is not None:
+                self.session.cache.commit()
+
+        if "id" not in message:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _error(self, request_id, code: int, message: str) -> Dict[str, Any]:
+        """Build a JSON-RPC error response."""
+        return {"jsonrpc": "2.0", "id": request_id,
+                "error": {"code": code, "message": message}}
+
+    def _diagnostics(self, violations: List[Violation],
+                     started: float) -> Dict[str, Any]:
+        """Build the result payload for a validation request."""
+        errors = sum(1 for v in violations if v.severity == "error")
+        return {
+            "diagnostics": [v.to_dict() for v in violations],
+            "summary": {"errors": errors, "warnings": len(violations) - errors},
+            "durationMs": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _paths(self, params: Dict[str, Any]) -> List[str]:
+        """Read the `path` or `paths` parameter."""
+        if "paths" in params:
+            paths = params["paths"]
+            if (not isinstance(paths, list)
+                    or not all(isinstance(p, str) for p in paths)):
+                raise RpcError(INVALID_PARAMS, "paths must be a list of strings")
+            return paths
+        if isinstance(params.get("path"), str):
+            return [params["path"]]
+        raise RpcError(INVALID_PARAMS, "path is required")
+
+    # --- methods -----------------------------------------------------------
+
+    def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Report server capabilities."""
+        return {
+            "name": "docman",
+            "repoRoot": str(self.session.repo_root),
+            "capabilities": sorted(self.methods),
+        }
+
+    def handle_validate_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate documents; paths that cannot be validated get a read-error."""
+        started = time.perf_counter()
+        paths = self._paths(params)
+        violations = (self.session.validate_files(paths)
+                      + self.session.untracked_violations(paths))
+        return self._diagnostics(violations, started)
+
+    def handle_validate_workspace(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the whole repository."""
+        started = time.perf_counter()
+        return self._diagnostics(self.session.validate_workspace(), started)
+
+    def handle_did_change(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a changed file, optionally with unsaved content, and revalidate it."""
+        started = time.perf_counter()
+        path = params.get("path")
+        content = params.get("content")
+        if not isinstance(path, str) or (content is not None
+                                         and not isinstance(content, str)):
+            raise RpcError(INVALID_PARAMS,
+                           "path (string) and optional content (string) expected")
+        file_path = self.session.did_change(path, content)
+        violations = self.session.validate_files([file_path])
+        if self.session.fs.exists(file_path):
+            # A deleted file has nothing to report; anything else is validated
+            # or explained
+            violations += self.session.untracked_violations([file_path])
+        return self._diagnostics(violations, started)
+
+    def handle_shutdown(self, params: Dict[str, Any]) -> None:
+        """Acknowledge shutdown; the client follows up with exit."""
+        return None
+
+    def handle_exit(self, params: Dict[str, Any]) -> None:
+        """Stop the message loop."""
+        self.running = False
+        return None
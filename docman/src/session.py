@@ -0,0 +1,252 @@
+"""
+Validation Session
+
+Long-lived validation state for one repository. The snapshot and parsed
+documents stay in memory between requests, so repeated validations (daemon,
+watch mode) only re-read what changed and never rewrite the index. Unsaved
+editor buffers live in an OverlayFS over the snapshot's file system, so they
+are listed, validated and resolvable as link targets without touching disk.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from scanner import RepoSnapshot, scan_repository
+from corpus import DocumentCorpus
+from docfs import OverlayFS, decode_text
+from documents import ParsedDocument, parse_document, split_link
+from reporter import Violation
+from validators.readme_validator import ReadmeValidator
+from validators.metadata_validator import MetadataValidator
+from validators.link_validator import LinkValidator
+
+
+class ValidationSession:
+    """Keeps a snapshot and parsed documents in memory across repeated validations."""
+
+    def __init__(self, repo_root: Path, config, cache=None,
+                 snapshot: RepoSnapshot = None, corpus: DocumentCorpus = None):
+        """
+        Scan the repository once (unless a snapshot is given) and set up
+        validators sharing the in-memory state. From then on the snapshot is
+        listed through the session's OverlayFS; writes through it never reach
+        the base file system, so the session never writes.
+        """
+        self.repo_root = Path(repo_root).resolve()
+        self.config = config
+        self.cache = cache
+        self.snapshot = snapshot or scan_repository(self.repo_root,
+                                                    config.ignore_patterns)
+        # Unsaved buffers shadow the files of the snapshot's file system
+        self.fs = OverlayFS(base=self.snapshot.fs)
+        self.snapshot.fs = self.fs
+        # Parsed documents stay in memory across requests (bounded by corpus_max_mb)
+        self.corpus = (corpus if corpus is not None
+                       else DocumentCorpus.for_config(cache, config))
+        # Reverse link map (target -> linking documents), rebuilt lazily after changes
+        self._inbound: Optional[Dict[Path, Set[Path]]] = None
+
+        # Validators load documents through this session (see load())
+        self.readme_validator = ReadmeValidator(self.repo_root, config.ignore_patterns,
+                                                snapshot=self.snapshot)
+        self.metadata_validator = MetadataValidator(self.repo_root,
+                                                    config.ignore_patterns, config,
+                                                    snapshot=self.snapshot, cache=self)
+        self.link_validator = LinkValidator(self.repo_root, config.ignore_patterns,
+                                            snapshot=self.snapshot, cache=self)
+
+    def resolve(self, path) -> Path:
+        """Resolve a repo-relative or absolute path to a normalized absolute path."""
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.repo_root / path
+        return Path(os.path.normpath(path))
+
+    def load(self, file_path: Path) -> ParsedDocument:
+        """Return the parsed document from memory, a buffer, the parse cache or disk."""
+        file_path = Path(file_path)
+        buffer = self.fs.buffers.get(file_path)
+        if buffer is None:
+            return self.corpus.load(file_path)
+        document = self.corpus.get(file_path)
+        if document is None:
+            document = parse_document(decode_text(buffer))
+            self.corpus.add(file_path, document)
+        return document
+
+    def did_change(self, path, content: Optional[str] = None) -> Path:
+        """
+        Record that a file changed: on disk (content=None) or as an unsaved buffer.
+
+        Only the changed document is dropped from memory; the snapshot re-lists
+        the file's directory so creations and deletions (and buffers for files
+        not on disk yet) are picked up.
+        """
+        file_path = self.resolve(path)
+        if content is not None:
+            self.fs.write_atomic(file_path, content.encode('utf-8'))
+        else:
+            self.fs.discard(file_path)
+        self.corpus.discard(file_path)
+        self._inbound = None
+        # Directories that a buffer created (or whose last buffer went away)
+        # are re-listed too
+        known = set(self.snapshot.directories)
+        changed = [file_path] + [parent for parent in file_path.parents
+                                 if self.repo_root in parent.parents
+                                 and (parent in known) != self.fs.is_dir(parent)]
+        self.snapshot.refresh(changed)
+        return file_path
+
+    def apply_changes(self, paths: Iterable[Path]) -> Tuple[List[Path], List[Path]]:
+        """
+        Absorb a batch of on-disk changes and return what must be re-validated.
+
+        Returns (files, directories): the changed documents still present, the
+        documents linking to any changed path, and the directories whose README
+        presence may have changed. Parent/child READMEs of changed READMEs are
+        covered by the date check in validate_files().
+        """
+        paths = sorted({self.resolve(p) for p in paths})
+        for file_path in paths:
+            self.corpus.discard(file_path)
+            self.fs.discard(file_path)
+
+        linking = self.linking_to(paths)  # uses the link map from before the change
+        self._inbound = None
+        self.snapshot.refresh(paths)
+
+        known_dirs = set(self.snapshot.directories) | {self.repo_root}
+        directories = {p.parent for p in paths if p.parent in known_dirs}
+        files = list(paths) + sorted(linking)
+
+        # A new directory arrives as one event: validate everything below it
+        new_dirs = [p for p in paths if p in known_dirs]
+        if new_dirs:
+            directories.update(d for d in known_dirs
+                               if any(d == p or p in d.parents for p in new_dirs))
+            files += [f for f in self.snapshot.markdown_files
+                      if any(p in f.parents for p in new_dirs)]
+
+        return self._tracked_files(files), sorted(directories)
+
+    def rescan(self) -> None:
+        """Drop in-memory state and rescan the repository, e.g. after lost events."""
+        self.corpus.clear()
+        self._inbound = None
+        self.snapshot.scan()
+
+    def _link_target(self, source: Path, link: str) -> Path:
+        """Lexically resolve a relative link from a document, ignoring any #fragment."""
+        path, _ = split_link(link)
+        return Path(os.path.normpath(source.parent / path)) if path else source
+
+    def linking_to(self, paths: Iterable[Path]) -> Set[Path]:
+        """Documents linking to any of the given paths or to anything below them."""
+        if self._inbound is None:
+            self._inbound = {}
+            for source in self.snapshot.markdown_files:
+                try:
+                    links = self.load(source).links
+                except Exception:
+                    continue
+                for link in links:
+                    target = self._link_target(source, link.target)
+                    self._inbound.setdefault(target, set()).add(source)
+
+        sources = set()
+        targets = {self.resolve(p) for p in paths}
+        for target, linked_from in self._inbound.items():
+            if target in targets or not targets.isdisjoint(target.parents):
+                sources.update(linked_from)
+        return sources
+
+    def _tracked_files(self, paths: Iterable[Path]) -> List[Path]:
+        """Filter paths down to markdown files known to the snapshot."""
+        known = set(self.snapshot.markdown_files)
+        files = []
+        for path in paths:
+            file_path = self.resolve(path)
+            if file_path in known and file_path not in files:
+                files.append(file_path)
+        return sorted(files)
+
+    def untracked_violations(self, paths: Iterable[Path]) -> List[Violation]:
+        """
+        read-error violations for requested paths that validate_files() skips:
+        missing, outside the repository, not markdown or ignored. Without them
+        a request for such a path gets no diagnostics, which reads as clean.
+        """
+        known = set(self.snapshot.markdown_files)
+        violations = []
+        for path in paths:
+            file_path = self.resolve(path)
+            if file_path in known:
+                continue
+            severity = "error"
+            if self.repo_root not in file_path.parents:
+                reason = "outside the repository"
+            elif not self.fs.is_file(file_path):
+                reason = "no such file"
+            elif file_path.suffix != ".md":
+                reason = "not a markdown document"
+            else:
+                reason, severity = "ignored by the ignore patterns", "warning"
+            file = (file_path.relative_to(self.repo_root).as_posix()
+                    if self.repo_root in file_path.parents else str(path))
+            violations.append(Violation(rule="read-error", file=file, severity=severity,
+                                        message=f"{file}: {reason}, not validated"))
+        return violations
+
+    def validate_files(self, paths: Iterable[Path],
+                       directories: Iterable[Path] = ()) -> List[Violation]:
+        """
+        Validate only the given documents: README presence of their directories
+        (and any extra directories), their metadata and links, and parent/child
+        date consistency for READMEs.
+        """
+        files = self._tracked_files(paths)
+        directories = sorted({f.parent for f in files} | set(directories))
+        readmes = [f for f in files if f.name == "README.md"]
+
+        violations = self.readme_validator.collect_violations(directories)
+        violations += self.metadata_validator.collect_violations(files)
+        violations += self.link_validator.collect_link_violations(files)
+        violations += self.link_validator.collect_date_violations(readmes)
+        return violations
+
+    def validate_workspace(self) -> List[Violation]:
+        """Validate the whole repository from the in-memory snapshot."""
+        violations = self.readme_validator.collect_violations()
+        violations += self.metadata_validator.collect_violations()
+        violations += self.link_validator.collect_link_violations()
+        violations += self.link_validator.collect_date_violations()
+        return violations
+
+
+def merge_violations(previous: List[Violation], fresh: List[Violation], repo_root: Path,
+                     scope: Iterable[Path]) -> List[Violation]:
+    """
+    Replace the violations of re-validated paths in a previous result.
+
+    `scope` holds the re-validated files and directories plus the changed paths;
+    old violations reported for them (or below a removed directory) are dropped
+    and the fresh ones added.
+    """
+    keys = set()
+    for path in scope:
+        try:
+            keys.add(Path(path).relative_to(repo_root))
+        except ValueError:
+            continue
+    removed = {k for k in keys if not (repo_root / k).exists()}
+
+    def stale(violation: Violation) -> bool:
+        file = Path(violation.file)
+        if file in keys or not removed.isdisjoint(file.parents):
+            return True
+        return violation.rule == "date-inconsistency" and Path(violation.target) in keys
+
+    return [v for v in previous if not stale(v)] + fresh
@@ -4,7 +4,12 @@ Utility functions for DocMan
 Common utilities used across the DocMan application.
 """
 
-from typing import List, Set
+import os
+import re
+import tempfile
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set
 from pathlib import Path
 
 
@@ -23,56 +28,229 @@ DEFAULT_IGNORE_PATTERNS = {
     'build'
 }
 
+# DocMan's own working directory (parse cache etc.), never part of the documentation
+CACHE_DIR_NAME = '.docman-cache'
 
-def should_ignore_path(path: Path, ignore_patterns: Set[str] = None) -> bool:
-    """Check if a path should be ignored based on ignore patterns."""
-    if ignore_patterns is None:
-        ignore_patterns = DEFAULT_IGNORE_PATTERNS
 
-    # Convert path to string for pattern matching
-    path_str = str(path)
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regex ('*' never crosses '/')."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 2] == '**':
+                # '**/' matches zero or more directories, a trailing
+                # '**' matches everything
+                if pattern[i + 2:i + 3] == '/':
+                    out.append('(?:.*/)?')
+                    i += 3
+                else:
+                    out.append('.*')
+                    i += 2
+                continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = pattern.find(']', i + 1)
+            if j == -1:
+                out.append('\\[')
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = j + 1
+                continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+def _combine(fragments: List[str]) -> Optional[Pattern]:
+    """Combine regex fragments into one alternation, or None when there are none."""
+    if not fragments:
+        return None
+    return re.compile('|'.join(f'(?:{fragment})' for fragment in fragments))
+
+
+class IgnoreMatcher:
+    """
+    Ignore patterns compiled once and matched against repo-relative POSIX paths.
+
+    Pattern forms:
+    - ``name`` / ``name/``: any path component with that exact name (set lookup)
+    - ``*.log``: glob matched against any single component (one combined regex)
+    - ``/build``, ``docs/build/``, ``docs/**/drafts``: anchored at the repository
+      root; ``**`` spans any number of directories (one combined regex)
+    """
+
+    def __init__(self, ignore_patterns: Iterable[str] = None):
+        """Compile the given patterns (defaults to DEFAULT_IGNORE_PATTERNS)."""
+        if ignore_patterns is None:
+            ignore_patterns = DEFAULT_IGNORE_PATTERNS
+
+        names = set()
+        name_globs = []
+        anchored = []
+
+        for raw in ignore_patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
 
-    # Check if any part of the path matches ignore patterns
-    for part in path.parts:
-        # Direct part match
-        if part in ignore_patterns:
+            pattern = pattern.rstrip('/')
+            if pattern.startswith('**/') and '/' not in pattern[3:]:
+                # '**/name' is the same as an unanchored 'name'
+                pattern = pattern[3:]
+
+            if pattern.startswith('/') or '/' in pattern:
+                anchored.append(_translate_glob(pattern.lstrip('/')))
+            elif any(c in pattern for c in '*?['):
+                name_globs.append(_translate_glob(pattern))
+            elif pattern:
+                names.add(pattern)
+
+        self.names: FrozenSet[str] = frozenset(names)
+        self._name_regex = _combine(name_globs)
+        self._path_regex = _combine(anchored)
+
+        # Whole-path variants: a glob on any component, an anchored pattern on
+        # any prefix
+        self._component_regex = None
+        if self._name_regex:
+            self._component_regex = re.compile(
+                f'(?:^|/)(?:{self._name_regex.pattern})(?=/|$)')
+        self._prefix_regex = (re.compile(f'(?:{self._path_regex.pattern})(?:/|$)')
+                              if self._path_regex else None)
+
+    def matches_name(self, name: str) -> bool:
+        """Check a single path component against the name set and globs."""
+        if name in self.names:
             return True
-        # Pattern with trailing slash
-        if f"{part}/" in ignore_patterns:
+        return (self._name_regex is not None
+                and self._name_regex.fullmatch(name) is not None)
+
+    def matches_entry(self, relative_path: str, name: str) -> bool:
+        """
+        Check one directory entry whose parent is already known not to be ignored.
+
+        This is the hot path used while scanning: only the entry's own name and
+        its full relative path need to be tested.
+        """
+        if self.matches_name(name):
             return True
+        return (self._path_regex is not None
+                and self._path_regex.fullmatch(relative_path) is not None)
+
+    def matches(self, relative_path: str) -> bool:
+        """Check a repo-relative path, including all of its parent directories."""
+        relative_path = relative_path.strip('/')
+        if not relative_path or relative_path == '.':
+            return False
 
-    # Check for pattern matches in the full path
-    for pattern in ignore_patterns:
-        if pattern.endswith('/'):
-            # Directory pattern
-            if f"/{pattern}" in f"/{path_str}/" or path_str.startswith(pattern[:-1]):
-                return True
-        elif '*' in pattern:
-            # Wildcard pattern
-            import fnmatch
-            if fnmatch.fnmatch(path.name, pattern):
-                return True
+        if not self.names.isdisjoint(relative_path.split('/')):
+            return True
+        if (self._component_regex is not None
+                and self._component_regex.search(relative_path)):
+            return True
+        return (self._prefix_regex is not None
+                and self._prefix_regex.match(relative_path) is not None)
 
-    return False
+
+@lru_cache(maxsize=32)
+def _matcher_for(ignore_patterns: FrozenSet[str]) -> IgnoreMatcher:
+    """Return a cached matcher for a pattern set."""
+    return IgnoreMatcher(ignore_patterns)
+
+
+def get_ignore_matcher(ignore_patterns: Iterable[str] = None) -> IgnoreMatcher:
+    """Get the compiled matcher for a pattern set, compiling it only once."""
+    if ignore_patterns is None:
+        ignore_patterns = DEFAULT_IGNORE_PATTERNS
+    return _matcher_for(frozenset(ignore_patterns))
+
+
+def should_ignore_path(path: Path, ignore_patterns: Set[str] = None,
+                       root: Path = None) -> bool:
+    """
+    Check if a path should be ignored based on ignore patterns.
+
+    When ``root`` is given the path is matched relative to it, so directories
+    above the repository (e.g. a checkout under ``build/``) never match.
+    """
+    path = Path(path)
+    if root is not None:
+        try:
+            path = path.relative_to(root)
+        except ValueError:
+            pass
+    return get_ignore_matcher(ignore_patterns).matches(path.as_posix())
 
 
 def find_all_directories(root: Path, ignore_patterns: Set[str] = None) -> List[Path]:
     """Recursively find all directories, respecting ignore patterns."""
-    directories = []
-    
-    for path in root.rglob('*'):
-        if path.is_dir() and not should_ignore_path(path, ignore_patterns):
-            directories.append(path)
-    
-    return directories
+    from scanner import scan_repository
+    return scan_repository(root, ignore_patterns).directories
 
 
 def find_all_markdown_files(root: Path, ignore_patterns: Set[str] = None) -> List[Path]:
     """Recursively find all markdown files, respecting ignore patterns."""
-    md_files = []
-    
-    for path in root.rglob('*.md'):
-        if not should_ignore_path(path, ignore_patterns):
-            md_files.append(path)
-    
-    return md_files
+    from scanner import scan_repository
+    return scan_repository(root, ignore_patterns).markdown_files
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file in its directory, then rename it into place."""
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=str(path.parent),
+                                     prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+        if path.exists():
+            os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        else:
+            os.chmod(temp_name, 0o666 & ~_current_umask())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _current_umask() -> int:
+    """The process umask; mkstemp creates files 0600, new files get the usual mode."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+class PhaseTimer:
+    """Wall-clock seconds spent in each phase of a run, in the order they started."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._phase: Optional[str] = None
+        self._started = 0.0
+
+    def start(self, phase: Optional[str]) -> None:
+        """End the current phase (if any) and start `phase` (None: stop timing)."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            elapsed = now - self._started
+            self.timings[self._phase] = self.timings.get(self._phase, 0.0) + elapsed
+        self._phase, self._started = phase, now
+
+    def stop(self) -> None:
+        """End the current phase."""
+        self.start(None)
+
+    def reset(self) -> None:
+        """Forget all timings."""
+        self.timings = {}
+        self._phase = None
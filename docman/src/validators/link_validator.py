@@ -5,88 +5,161 @@ Validates that markdown links point to existing files and manages date consisten
 between parent and child documentation files.
 """
 
+import os
 import re
-from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import unquote
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 from datetime import datetime
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from utils import find_all_markdown_files, should_ignore_path, DEFAULT_IGNORE_PATTERNS
+from utils import DEFAULT_IGNORE_PATTERNS
+from scanner import RepoSnapshot, scan_repository
+from docfs import DISK, DocFS
+from documents import (Link, load_document, extract_markdown_links, find_last_updated,
+                       split_link)
+from reporter import Violation
 
 
 class LinkValidator:
     """Validates link integrity and date consistency in markdown files."""
     
-    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None):
-        """Initialize validator with repository root and ignore patterns."""
+    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None,
+                 snapshot: RepoSnapshot = None, cache=None, fs: DocFS = None):
+        """
+        Initialize validator with repository root, ignore patterns, optional
+        shared snapshot, parse cache and DocFS.
+        """
         self.repo_root = Path(repo_root)
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS.copy()
+        self._snapshot = snapshot
+        self.cache = cache
+        self.fs = fs or (snapshot.fs if snapshot is not None else DISK)
+        # Existence of link targets when there is no snapshot to answer from
+        self._stat_exists: Dict[str, bool] = {}
+
+    @property
+    def snapshot(self) -> RepoSnapshot:
+        """Shared repository snapshot, scanned on first use if none was provided."""
+        if self._snapshot is None:
+            self._snapshot = scan_repository(self.repo_root, self.ignore_patterns,
+                                             self.fs)
+        return self._snapshot
     
     def extract_markdown_links(self, content: str) -> List[str]:
-        """Extract markdown links from content."""
-        # Pattern for markdown links: [text](path)
-        pattern = r'\[([^\]]*)\]\(([^)]+)\)'
-        matches = re.findall(pattern, content)
-        
-        # Return only the link paths, filter out external URLs
-        links = []
-        for text, link in matches:
-            # Skip external URLs (http, https, mailto, etc.)
-            if not (link.startswith('http://') or link.startswith('https://') or 
-                   link.startswith('mailto:') or link.startswith('ftp://')):
-                links.append(link)
-        
-        return links
+        """Extract markdown links from content, filtering out external URLs."""
+        return extract_markdown_links(content)
     
-    def validate_links_in_file(self, file_path: Path) -> List[str]:
-        """Validate all links in a single markdown file."""
+    def collect_file_link_violations(self, file_path: Path,
+                                     check_fragments: bool = True) -> List[Violation]:
+        """
+        Return structured violations for the links of a single markdown file:
+        missing targets first, then #fragments that name no heading in their target.
+        """
         violations = []
+        relative_file = str(file_path.relative_to(self.repo_root))
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            links = load_document(file_path, self.cache, self.fs).links
         except Exception as e:
-            violations.append(f"Could not read file: {e}")
-            return violations
-        
-        links = self.extract_markdown_links(content)
+            return [Violation(rule="read-error", file=relative_file, message=str(e))]
         
+        directory = str(file_path.parent)
         for link in links:
-            # Resolve link relative to the file's directory
-            link_path = (file_path.parent / link).resolve()
+            path, _ = split_link(link.target)
+            if not path:
+                continue  # Same-file anchor, checked with the fragments
+            # Normalize the link lexically relative to the file's directory
+            link_path = os.path.normpath(os.path.join(directory, path))
             
             # Check if the linked file exists
-            if not link_path.exists():
-                relative_file = file_path.relative_to(self.repo_root)
-                violations.append(f"🚧 Broken link in {relative_file}: {link}")
+            if not self.target_exists(link_path):
+                violations.append(Violation(rule="broken-link", file=relative_file,
+                                            message=f"Broken link: {link.target}",
+                                            line=link.line, target=link.target))
         
+        if check_fragments:
+            violations.extend(self.collect_fragment_violations(file_path, links))
         return violations
+
+    def collect_fragment_violations(self, file_path: Path,
+                                    links: List[Link] = None) -> List[Violation]:
+        """Check #fragments against linked documents' heading anchors, O(1) per link."""
+        violations = []
+        relative_file = str(file_path.relative_to(self.repo_root))
+        try:
+            if links is None:
+                links = load_document(file_path, self.cache, self.fs).links
+        except Exception:
+            return violations
+
+        directory = str(file_path.parent)
+        for link in links:
+            path, fragment = split_link(link.target)
+            if not fragment:
+                continue
+
+            if path:
+                link_path = os.path.normpath(os.path.join(directory, path))
+                # Missing targets are already reported; anchors only exist in
+                # markdown files
+                if not link_path.endswith('.md') or not self.target_exists(link_path):
+                    continue
+                target = Path(link_path)
+            else:
+                target = file_path
+
+            try:
+                document = load_document(target, self.cache, self.fs)
+            except Exception:
+                continue
+            if not document.has_anchor(unquote(fragment)):
+                violations.append(Violation(rule="broken-anchor", file=relative_file,
+                                            message=f"Broken anchor: {link.target}",
+                                            line=link.line, target=link.target))
+        return violations
+    
+    def target_exists(self, link_path: str) -> bool:
+        """
+        Check a normalized link target against the snapshot's known paths
+        (a memoized stat otherwise).
+        """
+        if self._snapshot is not None:
+            return self._snapshot.exists(link_path)
+        exists = self._stat_exists.get(link_path)
+        if exists is None:
+            exists = self._stat_exists[link_path] = self.fs.exists(link_path)
+        return exists
+
+    def validate_links_in_file(self, file_path: Path) -> List[str]:
+        """Validate all links in a single markdown file."""
+        return [violation.format()
+                for violation in self.collect_file_link_violations(file_path)]
     
     def parse_last_updated_date(self, content: str) -> Optional[datetime]:
         """Parse the Last Updated date from README metadata."""
-        # Look for **Last Updated**: YYYY-MM-DD pattern
-        pattern = r'\*\*Last Updated\*\*:\s*(\d{4}-\d{2}-\d{2})'
-        match = re.search(pattern, content)
-        
-        if match:
-            try:
-                date_str = match.group(1)
-                return datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                return None
-        
-        return None
+        return self._to_date(find_last_updated(content))
+
+    def _to_date(self, date_str: Optional[str]) -> Optional[datetime]:
+        """Convert a YYYY-MM-DD string to a datetime, or None if missing or invalid."""
+        if not date_str:
+            return None
+        try:
+            return datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            return None
     
     def update_last_updated_date(self, file_path: Path, new_date: str) -> bool:
         """Update the Last Updated date in a README file."""
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = self.fs.read_text(file_path)
             
             # Replace the Last Updated date
             pattern = r'(\*\*Last Updated\*\*:\s*)(\d{4}-\d{2}-\d{2})'
             new_content = re.sub(pattern, f'\\g<1>{new_date}', content)
             
             if new_content != content:
-                file_path.write_text(new_content, encoding='utf-8')
+                self.fs.write_atomic(file_path, new_content.encode('utf-8'))
                 return True
             
         except Exception:
@@ -94,67 +167,91 @@ class LinkValidator:
         
         return False
     
-    def check_date_consistency(self) -> List[str]:
-        """Check date consistency between parent and child READMEs and report outdated parents."""
-        date_issues = []
-
-        # Find all README files
-        md_files = find_all_markdown_files(self.repo_root, self.ignore_patterns)
-        readme_files = [f for f in md_files if f.name == 'README.md']
+    def collect_date_violations(self,
+                                readme_files: List[Path] = None) -> List[Violation]:
+        """
+        Return structured date inconsistencies between parent and child READMEs.
 
-        # Build a directory hierarchy map
-        dir_to_readme = {}
-        for readme in readme_files:
-            dir_path = readme.parent
-            dir_to_readme[dir_path] = readme
+        Without arguments all READMEs in the snapshot are checked against their
+        parents. When specific READMEs are given (or the snapshot is partial),
+        each is also checked against the READMEs of its child directories.
+        """
+        date_issues = []
+        snapshot = self.snapshot
+        include_children = readme_files is not None or not snapshot.complete
+        if readme_files is None:
+            readme_files = snapshot.readme_files()
 
-        # Check each README against its parent
+        # Collect (parent, child) README pairs
+        pairs = []
+        seen = set()
         for readme_path in readme_files:
             current_dir = readme_path.parent
-            parent_dir = current_dir.parent
+            candidates = []
 
-            # Skip if we're at the repo root or parent is ignored
-            if parent_dir == self.repo_root.parent or should_ignore_path(parent_dir, self.ignore_patterns):
-                continue
+            # Skip the parent lookup at the repo root (ignored parents
+            # never reach the snapshot)
+            if current_dir != self.repo_root:
+                parent_readme = snapshot.readme_for(current_dir.parent)
+                if parent_readme:
+                    candidates.append((parent_readme, readme_path))
 
-            # Find parent README
-            parent_readme = dir_to_readme.get(parent_dir)
-            if not parent_readme:
-                continue
+            if include_children:
+                for child_name in sorted(snapshot.listing(current_dir).dirs):
+                    child_readme = snapshot.readme_for(current_dir / child_name)
+                    if child_readme:
+                        candidates.append((readme_path, child_readme))
+
+            for pair in candidates:
+                if pair not in seen:
+                    seen.add(pair)
+                    pairs.append(pair)
 
+        for parent_readme, readme_path in pairs:
             # Parse dates from both files
             try:
-                child_content = readme_path.read_text(encoding='utf-8')
-                parent_content = parent_readme.read_text(encoding='utf-8')
-
-                child_date = self.parse_last_updated_date(child_content)
-                parent_date = self.parse_last_updated_date(parent_content)
+                child = load_document(readme_path, self.cache, self.fs)
+                parent = load_document(parent_readme, self.cache, self.fs)
+                child_date = self._to_date(child.last_updated)
+                parent_date = self._to_date(parent.last_updated)
 
                 # If child is newer than parent, report the issue
                 if child_date and parent_date and child_date > parent_date:
                     child_date_str = child_date.strftime('%Y-%m-%d')
                     parent_date_str = parent_date.strftime('%Y-%m-%d')
-                    relative_parent = parent_readme.relative_to(self.repo_root)
-                    relative_child = readme_path.relative_to(self.repo_root)
-                    date_issues.append(f"🚧 Parent {relative_parent} ({parent_date_str}) is older than child {relative_child} ({child_date_str})")
+                    relative_parent = str(parent_readme.relative_to(self.repo_root))
+                    relative_child = str(readme_path.relative_to(self.repo_root))
+                    date_issues.append(Violation(
+                        rule="date-inconsistency", file=relative_parent,
+                        severity="warning", target=relative_child,
+                        message=f"Parent {relative_parent} ({parent_date_str}) is "
+                                f"older than child {relative_child} ({child_date_str})"
+                    ))
 
             except Exception:
                 continue
 
         return date_issues
     
-    def validate_all_links(self) -> List[str]:
-        """Validate links in all markdown files."""
-        all_violations = []
-        
-        # Find all markdown files (not just READMEs)
-        md_files = find_all_markdown_files(self.repo_root, self.ignore_patterns)
+    def check_date_consistency(self) -> List[str]:
+        """Check date consistency between parent and child READMEs and report outdated parents."""
+        return [violation.format() for violation in self.collect_date_violations()]
+    
+    def iter_link_violations(self, files: List[Path] = None) -> Iterator[Violation]:
+        """Yield structured link violations file by file, as they are found."""
+        # All markdown files (not just READMEs) from the shared snapshot
+        md_files = self.snapshot.markdown_files if files is None else files
         
         for md_file in md_files:
-            violations = self.validate_links_in_file(md_file)
-            all_violations.extend(violations)
-        
-        return all_violations
+            yield from self.collect_file_link_violations(md_file)
+
+    def collect_link_violations(self, files: List[Path] = None) -> List[Violation]:
+        """Return link violations for all snapshot documents (or the given ones)."""
+        return list(self.iter_link_violations(files))
+    
+    def validate_all_links(self) -> List[str]:
+        """Validate links in all markdown files."""
+        return [violation.format() for violation in self.collect_link_violations()]
     
     def validate(self) -> Tuple[List[str], List[str]]:
         """Run link validation and date consistency checks."""
@@ -6,11 +6,15 @@ with required fields: Status, Version, and Last Updated.
 """
 
 import re
-from typing import List, Dict, Optional, Set
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from utils import find_all_markdown_files, should_ignore_path, DEFAULT_IGNORE_PATTERNS
+from utils import DEFAULT_IGNORE_PATTERNS
+from scanner import RepoSnapshot, scan_repository
+from docfs import DISK, DocFS
+from documents import load_metadata, load_metadata_document, parse_metadata_block
+from reporter import Violation
 
 
 class MetadataValidator:
@@ -38,11 +42,18 @@ class MetadataValidator:
         'DOCUMENTATION_INDEX.md'
     }
 
-    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None, config=None):
-        """Initialize validator with repository root, ignore patterns, and config."""
+    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None, config=None,
+                 snapshot: RepoSnapshot = None, cache=None, fs: DocFS = None):
+        """
+        Initialize validator with repository root, ignore patterns, config,
+        optional shared snapshot, parse cache and DocFS.
+        """
         self.repo_root = Path(repo_root)
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS.copy()
         self.config = config
+        self._snapshot = snapshot
+        self.cache = cache
+        self.fs = fs or (snapshot.fs if snapshot is not None else DISK)
 
         # Set dynamic fields based on config
         if config and hasattr(config, 'required_metadata') and config.required_metadata:
@@ -58,59 +69,40 @@ class MetadataValidator:
         # Version and date patterns
         self.version_pattern = getattr(config, 'version_pattern', 'semantic') if config else 'semantic'
         self.date_format = getattr(config, 'date_format', 'YYYY-MM-DD') if config else 'YYYY-MM-DD'
+
+    @property
+    def snapshot(self) -> RepoSnapshot:
+        """Shared repository snapshot, scanned on first use if none was provided."""
+        if self._snapshot is None:
+            self._snapshot = scan_repository(self.repo_root, self.ignore_patterns,
+                                             self.fs)
+        return self._snapshot
     
     def parse_metadata_block(self, content: str) -> Dict[str, str]:
         """Parse metadata block from README content (only from the beginning)."""
-        metadata = {}
-
-        # Split content into lines and look for metadata only in the first section
-        lines = content.split('\n')
-
-        # Find the first heading (# Title) and only look for metadata before the next section
-        in_metadata_section = False
-        metadata_section_ended = False
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip empty lines and title
-            if not line or line.startswith('# '):
-                if line.startswith('# '):
-                    in_metadata_section = True
-                continue
-
-            # Stop looking for metadata after the first ## section or other content
-            if in_metadata_section and (line.startswith('## ') or
-                                       (line and not line.startswith('**') and not metadata_section_ended)):
-                if not line.startswith('**'):
-                    metadata_section_ended = True
-                    break
-
-            # Look for metadata pattern: **Field**: Value
-            if in_metadata_section and line.startswith('**') and '**:' in line:
-                match = re.match(r'\*\*([^*]+)\*\*:\s*(.+)', line)
-                if match:
-                    field, value = match.groups()
-                    metadata[field.strip()] = value.strip()
-
-        return metadata
+        return parse_metadata_block(content)
     
     def validate_metadata(self, file_path: Path) -> List[str]:
         """Validate metadata in a single README file."""
-        violations = []
-        
         try:
-            content = file_path.read_text(encoding='utf-8')
+            metadata = load_metadata(file_path, self.cache, self.fs)
         except Exception as e:
-            violations.append(f"Could not read file: {e}")
-            return violations
+            return [f"Could not read file: {e}"]
         
-        metadata = self.parse_metadata_block(content)
+        return self.check_metadata(metadata)
+
+    def check_metadata(self, metadata: Dict[str, str]) -> List[str]:
+        """Validate an already parsed metadata block."""
+        return [message for _, message in self.metadata_problems(metadata)]
+
+    def metadata_problems(self, metadata: Dict[str, str]) -> List[Tuple[str, str]]:
+        """(field, message) pairs for everything wrong with a parsed metadata block."""
+        violations = []
         
         # Check for missing required fields (dynamic based on config)
         missing_fields = self.required_fields - set(metadata.keys())
-        for field in missing_fields:
-            violations.append(f'missing "{field}"')
+        for field in sorted(missing_fields):
+            violations.append((field, f'missing "{field}"'))
 
         # Validate Status field if present (dynamic based on config)
         if 'Status' in metadata:
@@ -118,18 +110,23 @@ class MetadataValidator:
             if status not in self.valid_statuses:
                 # Sort but preserve emoji order (don't sort alphabetically)
                 valid_options = ', '.join(self.valid_statuses)
-                violations.append(f'invalid status "{status}" (valid options: {valid_options})')
+                violations.append(('Status', f'invalid status "{status}" '
+                                             f'(valid options: {valid_options})'))
         
         # Validate Version field format if present (dynamic based on config)
         if 'Version' in metadata:
             version = metadata['Version']
             if self.version_pattern == 'semantic':
                 if not re.match(r'^\d+\.\d+\.\d+$', version):
-                    violations.append(f'invalid version format "{version}" (expected semantic versioning x.y.z)')
+                    violations.append(('Version',
+                                       f'invalid version format "{version}" '
+                                       '(expected semantic versioning x.y.z)'))
             else:
                 # Custom pattern validation could be added here
                 if not re.match(r'^\d+\.\d+\.\d+$', version):
-                    violations.append(f'invalid version format "{version}" (check .docmanrc version_pattern)')
+                    violations.append(('Version',
+                                       f'invalid version format "{version}" '
+                                       '(check .docmanrc version_pattern)'))
 
         # Validate Last Updated field format if present and not empty (dynamic based on config)
         if 'Last Updated' in metadata:
@@ -138,37 +135,51 @@ class MetadataValidator:
             if date:
                 if self.date_format == 'YYYY-MM-DD':
                     if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
-                        violations.append(f'invalid date format "{date}" (expected YYYY-MM-DD ISO 8601 Standard, international eindeutig)')
+                        violations.append(('Last Updated',
+                                           f'invalid date format "{date}" (expected '
+                                           'YYYY-MM-DD ISO 8601 Standard, '
+                                           'international eindeutig)'))
                 else:
                     # Custom date format validation could be added here
                     if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
-                        violations.append(f'invalid date format "{date}" (check .docmanrc date_format: {self.date_format})')
+                        violations.append(('Last Updated',
+                                           f'invalid date format "{date}" (check '
+                                           '.docmanrc date_format: '
+                                           f'{self.date_format})'))
         
         return violations
     
-    def validate_all_readmes(self) -> List[str]:
-        """Validate metadata in all README.md files."""
-        all_violations = []
-        
-        # Find all markdown files
-        md_files = find_all_markdown_files(self.repo_root, self.ignore_patterns)
-        
+    def iter_violations(self, files: List[Path] = None) -> Iterator[Violation]:
+        """Yield structured metadata violations file by file, as they are found."""
         # All markdown files should have metadata (not just READMEs)
-        markdown_files = md_files
+        markdown_files = self.snapshot.markdown_files if files is None else files
         
         for markdown_file in markdown_files:
             # Skip files that don't require metadata
             if markdown_file.name in self.METADATA_EXEMPT_FILES:
                 continue
 
-            violations = self.validate_metadata(markdown_file)
-            if violations:
-                # Make path relative to repo root
-                relative_path = markdown_file.relative_to(self.repo_root)
-                for violation in violations:
-                    all_violations.append(f"🚧 Bad metadata in {relative_path}: {violation}")
-        
-        return all_violations
+            # Make path relative to repo root
+            relative_path = str(markdown_file.relative_to(self.repo_root))
+            try:
+                document = load_metadata_document(markdown_file, self.cache, self.fs)
+            except Exception as e:
+                yield Violation(rule="metadata", file=relative_path,
+                                message=f"Could not read file: {e}")
+                continue
+
+            for field, message in self.metadata_problems(document.metadata):
+                # Missing fields have no line; the others point at their metadata line
+                yield Violation(rule="metadata", file=relative_path, message=message,
+                                line=document.metadata_lines.get(field))
+
+    def collect_violations(self, files: List[Path] = None) -> List[Violation]:
+        """Return metadata violations for all snapshot documents (or the given ones)."""
+        return list(self.iter_violations(files))
+    
+    def validate_all_readmes(self) -> List[str]:
+        """Validate metadata in all README.md files."""
+        return [violation.format() for violation in self.collect_violations()]
     
     def validate(self) -> List[str]:
         """Run metadata validation and return list of violations."""
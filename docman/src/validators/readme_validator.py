@@ -9,46 +9,66 @@ from typing import List, Set
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
-from utils import find_all_directories, should_ignore_path, DEFAULT_IGNORE_PATTERNS
+from utils import DEFAULT_IGNORE_PATTERNS
+from scanner import RepoSnapshot, scan_repository
+from docfs import DISK, DocFS
+from reporter import Violation
 
 
 class ReadmeValidator:
     """Validates README.md presence in directories."""
     
-    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None):
-        """Initialize validator with repository root and ignore patterns."""
+    def __init__(self, repo_root: Path, ignore_patterns: Set[str] = None,
+                 snapshot: RepoSnapshot = None, fs: DocFS = None):
+        """
+        Initialize validator with repository root, ignore patterns, optional
+        shared snapshot and DocFS.
+        """
         self.repo_root = Path(repo_root)
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS.copy()
+        self._snapshot = snapshot
+        self.fs = fs or (snapshot.fs if snapshot is not None else DISK)
+
+    @property
+    def snapshot(self) -> RepoSnapshot:
+        """Shared repository snapshot, scanned on first use if none was provided."""
+        if self._snapshot is None:
+            self._snapshot = scan_repository(self.repo_root, self.ignore_patterns,
+                                             self.fs)
+        return self._snapshot
     
-    def find_directories_without_readme(self) -> List[Path]:
-        """Find all directories that are missing README.md files."""
+    def find_directories_without_readme(self,
+                                        directories: List[Path] = None) -> List[Path]:
+        """Find directories (the snapshot's, or the given ones) without a README.md."""
         missing_readmes = []
+        snapshot = self.snapshot
         
-        # Get all directories that should be checked
-        directories = find_all_directories(self.repo_root, self.ignore_patterns)
-        
-        # Add the root directory to the check
-        if not should_ignore_path(self.repo_root, self.ignore_patterns):
-            directories.insert(0, self.repo_root)
+        if directories is None:
+            # Get all directories that should be checked
+            directories = list(snapshot.directories)
+            
+            # Add the root directory to the check (patterns are
+            # repo-relative, so it is never ignored)
+            if snapshot.root_in_scope:
+                directories.insert(0, self.repo_root)
         
         for directory in directories:
-            readme_path = directory / "README.md"
-            if not readme_path.exists():
+            if not snapshot.has_readme(directory):
                 # Make path relative to repo root for reporting
                 relative_path = directory.relative_to(self.repo_root)
                 missing_readmes.append(relative_path)
         
         return missing_readmes
     
+    def collect_violations(self, directories: List[Path] = None) -> List[Violation]:
+        """Return structured violations for directories missing README.md files."""
+        return [Violation(rule="missing-readme", file=str(dir_path),
+                          message="Missing README")
+                for dir_path in self.find_directories_without_readme(directories)]
+    
     def validate(self) -> List[str]:
         """Run README presence validation and return list of violations."""
-        missing_dirs = self.find_directories_without_readme()
-        
-        violations = []
-        for dir_path in missing_dirs:
-            violations.append(f"🚧 Missing README: {dir_path}")
-        
-        return violations
+        return [violation.format() for violation in self.collect_violations()]
     
     def get_summary(self) -> str:
         """Get a summary of README validation results."""
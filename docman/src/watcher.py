@@ -0,0 +1,234 @@
+"""
+Filesystem Watchers
+
+Report changed markdown files and directories for --watch mode. On Linux the
+kernel's inotify API is used through ctypes; everywhere else (or when inotify
+is unavailable or out of watches) the watched directories are polled with
+os.scandir and compared by (st_size, st_mtime_ns). Bursts of events, such as
+a branch checkout, are coalesced into a single batch.
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Set, Tuple
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent))
+from scanner import RepoSnapshot
+
+
+class BaseWatcher(abc.ABC):
+    """Common batching logic; subclasses implement poll()."""
+
+    def __init__(self, snapshot: RepoSnapshot):
+        """Initialize the watcher for the directories of a snapshot."""
+        self.snapshot = snapshot
+        self.overflowed = False
+
+    def sync(self) -> None:
+        """Start watching directories that appeared in the snapshot since last call."""
+
+    @abc.abstractmethod
+    def poll(self, timeout: float) -> Set[Path]:
+        """Wait up to timeout seconds and return the paths changed in that time."""
+
+    def next_batch(self, debounce: float = 0.3, max_delay: float = 5.0) -> Set[Path]:
+        """
+        Block until something changes, then keep collecting until the tree has
+        been quiet for `debounce` seconds (or `max_delay` has passed).
+        """
+        changed: Set[Path] = set()
+        while not changed:
+            changed = self.poll(1.0)
+
+        deadline = time.monotonic() + max_delay
+        while time.monotonic() < deadline:
+            more = self.poll(debounce)
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def close(self) -> None:
+        """Release any operating system resources."""
+
+
+class PollingWatcher(BaseWatcher):
+    """Detects changes by re-listing watched directories with os.scandir."""
+
+    def __init__(self, snapshot: RepoSnapshot, interval: float = 1.0):
+        """Record the initial state of all snapshot directories."""
+        super().__init__(snapshot)
+        self.interval = interval
+        self._state: Dict[Path, Dict[str, Tuple[bool, int, int]]] = {}
+        self.sync()
+
+    def _list(self, directory: Path) -> Dict[str, Tuple[bool, int, int]]:
+        """Map subdirectory and document names to (is_dir, size, mtime_ns)."""
+        state = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            state[entry.name] = (True, 0, 0)
+                        elif entry.name.endswith(".md"):
+                            stat = entry.stat()
+                            state[entry.name] = (False, stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return state
+
+    def sync(self) -> None:
+        """Track the snapshot's current directories."""
+        directories = set(self.snapshot.directories) | {self.snapshot.repo_root}
+        for directory in list(self._state):
+            if directory not in directories:
+                del self._state[directory]
+        for directory in directories:
+            if directory not in self._state:
+                self._state[directory] = self._list(directory)
+
+    def poll(self, timeout: float) -> Set[Path]:
+        """Sleep up to the interval (or timeout) and diff all watched directories."""
+        time.sleep(min(timeout, self.interval))
+        changed = set()
+        for directory, previous in list(self._state.items()):
+            current = self._list(directory)
+            if current == previous:
+                continue
+            self._state[directory] = current
+            for name in previous.keys() | current.keys():
+                if previous.get(name) != current.get(name):
+                    changed.add(directory / name)
+        return changed
+
+
+class InotifyWatcher(BaseWatcher):
+    """Linux inotify watcher using ctypes (no third-party dependency)."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, snapshot: RepoSnapshot):
+        """
+        Create the inotify instance and watch every snapshot directory.
+
+        Raises OSError if inotify is unavailable.
+        """
+        super().__init__(snapshot)
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is not available on this platform")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available in this C library")
+
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watches: Dict[int, Path] = {}
+        self._watched: Dict[Path, int] = {}
+        try:
+            self.sync()
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        """Watch one directory; raises OSError (e.g. ENOSPC when out of watches)."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory),
+                                          self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno == 2:  # ENOENT: already gone, the pending delete event covers it
+                return
+            raise OSError(errno, f"inotify_add_watch {directory}: {os.strerror(errno)}")
+        self._watches[wd] = directory
+        self._watched[directory] = wd
+
+    def sync(self) -> None:
+        """Watch directories that appeared in the snapshot."""
+        for directory in [self.snapshot.repo_root] + list(self.snapshot.directories):
+            if directory not in self._watched:
+                self._add_watch(directory)
+
+    def poll(self, timeout: float) -> Set[Path]:
+        """Wait for events up to timeout seconds and decode them into changed paths."""
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+
+        try:
+            buffer = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        header_size = self.EVENT_HEADER.size
+        while offset + header_size <= len(buffer):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            start = offset + header_size
+            name = buffer[start:start + length].rstrip(b"\0")
+            offset = start + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost: the caller has to re-scan everything
+                self.overflowed = True
+                changed.add(self.snapshot.repo_root)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & (self.IN_IGNORED | self.IN_DELETE_SELF):
+                self._watches.pop(wd, None)
+                self._watched.pop(directory, None)
+                changed.add(directory)
+                continue
+
+            if name:
+                name = os.fsdecode(name)
+                if mask & self.IN_ISDIR or name.endswith(".md"):
+                    changed.add(directory / name)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(snapshot: RepoSnapshot, poll_interval: float = 1.0,
+                   polling: bool = False) -> BaseWatcher:
+    """Return an inotify watcher when possible, otherwise a polling watcher."""
+    if not polling:
+        try:
+            return InotifyWatcher(snapshot)
+        except OSError:
+            pass
+    return PollingWatcher(snapshot, interval=poll_interval)
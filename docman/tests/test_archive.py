@@ -0,0 +1,127 @@
+"""
+Unit tests for archive module.
+
+Tests for validating tar and zip documentation bundles without extracting them.
+"""
+
+import io
+import tarfile
+import unittest
+import tempfile
+import shutil
+import zipfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive import ArchiveError, ArchiveTree
+from corpus import DocumentCorpus
+from indexer import DocumentationIndexer
+from validators.link_validator import LinkValidator
+from validators.metadata_validator import MetadataValidator
+from validators.readme_validator import ReadmeValidator
+
+MEMBERS = {
+    "README.md": "# Bundle\n**Status**: 🚧 Draft\n**Version**: 1.0.0\n"
+                 "**Last Updated**: 2025-06-01\n\n"
+                 "[Guide](docs/guide.md#install) [Gone](docs/gone.md) "
+                 "[Logo](img/logo.png)\n",
+    "docs/guide.md": "# Guide\n**Status**: 🚧 Draft\n**Version**: 1.0.0\n"
+                     "**Last Updated**: 2025-06-01\n\n## Install\n",
+    "img/logo.png": "\x89PNG",
+    "node_modules/pkg/README.md": "# Pkg\n",
+    "DOCUMENTATION_INDEX.md": "# Documentation Index\n",
+}
+
+
+class TestArchiveTree(unittest.TestCase):
+    """Test cases for archive bundles."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+    def make_tar(self, prefix: str = "./") -> Path:
+        path = self.test_dir / "bundle.tar.gz"
+        with tarfile.open(path, "w:gz") as archive:
+            for name in ([prefix] if prefix != "./" else []) + [f"{prefix}empty"]:
+                directory = tarfile.TarInfo(name)
+                directory.type = tarfile.DIRTYPE
+                archive.addfile(directory)
+            for name, content in MEMBERS.items():
+                data = content.encode("utf-8")
+                info = tarfile.TarInfo(f"{prefix}{name}")
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        return path
+
+    def make_zip(self, prefix: str = "") -> Path:
+        path = self.test_dir / "bundle.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(f"{prefix}empty/", "")
+            for name, content in MEMBERS.items():
+                archive.writestr(f"{prefix}{name}", content)
+        return path
+
+    def test_bundles_are_validated_while_streaming(self):
+        """Test tar and zip bundles agree, with ignored members never parsed."""
+        # Rooted at the archive root, or built from a directory (tar czf x.tgz docs/)
+        archives = ((self.make_tar, "./"), (self.make_zip, ""),
+                    (self.make_tar, "docs-bundle/"), (self.make_zip, "docs-bundle/"))
+        for make, prefix in archives:
+            path = make(prefix)
+            with self.subTest(archive=path.name, prefix=prefix):
+                tree = ArchiveTree(path)
+                self.assertEqual(tree.prefix, prefix.strip("./") or None)
+                snapshot = tree.snapshot()
+                corpus = DocumentCorpus(fs=tree, loader=tree)
+                root = tree.root
+
+                self.assertEqual(sorted(tree.documents), ["DOCUMENTATION_INDEX.md",
+                                                          "README.md", "docs/guide.md"])
+                directories = [str(d.relative_to(root)) for d in snapshot.directories]
+                self.assertEqual(directories, ["docs", "empty", "img"])
+                readme = ReadmeValidator(root, snapshot=snapshot)
+                self.assertEqual([v.file for v in readme.collect_violations()],
+                                 ["docs", "empty", "img"])
+                metadata = MetadataValidator(root, snapshot=snapshot, cache=corpus)
+                self.assertEqual(metadata.collect_violations(), [])
+
+                validator = LinkValidator(root, snapshot=snapshot, cache=corpus)
+                links = validator.collect_link_violations()
+                self.assertEqual([(v.rule, v.target) for v in links],
+                                 [("broken-link", "docs/gone.md")])
+
+                # The index is the only member kept as text, so it can be compared
+                indexer = DocumentationIndexer(root, snapshot=snapshot, cache=corpus)
+                self.assertEqual(sorted(v.target for v in indexer.check_index()),
+                                 ["README.md", "docs/guide.md"])
+                with self.assertRaises(OSError):
+                    tree.read_bytes(root / "docs" / "guide.md")
+
+    def test_rooted_archive_keeps_its_only_directory(self):
+        """Test a ./-rooted bundle with one directory is not taken as a prefixed one."""
+        path = self.test_dir / "bundle.tar"
+        with tarfile.open(path, "w") as archive:
+            data = MEMBERS["docs/guide.md"].encode("utf-8")
+            info = tarfile.TarInfo("./docs/guide.md")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+        tree = ArchiveTree(path)
+        self.assertIsNone(tree.prefix)
+        self.assertEqual(sorted(tree.documents), ["docs/guide.md"])
+
+    def test_invalid_archive(self):
+        """Test a file that is neither tar nor zip is reported as an ArchiveError."""
+        path = self.test_dir / "bundle.tar.gz"
+        path.write_bytes(b"not an archive")
+        with self.assertRaises(ArchiveError):
+            ArchiveTree(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
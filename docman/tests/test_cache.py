@@ -0,0 +1,137 @@
+"""
+Unit tests for cache module.
+
+Tests for the persistent per-file parse cache.
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cache import ParseCache, config_fingerprint
+from config import DocManConfig
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for the parse cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        self.readme = self.test_dir / "README.md"
+        self.readme.write_text("""# Test Repo
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-12
+
+[Apps](apps/README.md)
+""")
+
+    def open_cache(self, **kwargs) -> ParseCache:
+        """Open a cache for the test repository and close it on cleanup."""
+        cache = ParseCache(self.test_dir, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_parsed_record_contents(self):
+        """Test the cached record holds metadata, links and the date."""
+        cache = self.open_cache()
+        document = cache.load(self.readme)
+
+        self.assertEqual(document.metadata["Version"], "1.0.0")
+        self.assertEqual(document.link_targets, ["apps/README.md"])
+        self.assertEqual(document.last_updated, "2025-06-12")
+
+    def test_unchanged_file_is_not_reopened(self):
+        """Test a file with identical size/mtime/inode is served from the cache."""
+        cache = ParseCache(self.test_dir)
+        cache.load(self.readme)
+        cache.close()
+
+        # Same size and restored mtime: the stale content must not be read
+        stat = self.readme.stat()
+        content = self.readme.read_text().replace("1.0.0", "9.9.9")
+        self.readme.write_text(content)
+        os.utime(self.readme, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        cache = self.open_cache()
+        document = cache.load(self.readme)
+
+        self.assertEqual(document.metadata["Version"], "1.0.0")
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 0})
+
+    def test_changed_file_is_reparsed(self):
+        """Test a modified file misses the cache."""
+        cache = ParseCache(self.test_dir)
+        cache.load(self.readme)
+        cache.close()
+
+        self.readme.write_text(self.readme.read_text() + "\n[More](more.md)\n")
+
+        cache = self.open_cache()
+        document = cache.load(self.readme)
+
+        self.assertIn("more.md", document.link_targets)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 1})
+
+    def test_fingerprint_change_invalidates(self):
+        """Test a different config fingerprint drops all entries."""
+        cache = ParseCache(self.test_dir,
+                           fingerprint=config_fingerprint(DocManConfig()))
+        cache.load(self.readme)
+        cache.close()
+
+        other_config = DocManConfig()
+        other_config.valid_statuses = ["Custom"]
+        cache = self.open_cache(fingerprint=config_fingerprint(other_config))
+        cache.load(self.readme)
+
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 1})
+
+    def test_eviction_bounds_size(self):
+        """Test least recently used entries are evicted beyond max_entries."""
+        for name in ("a.md", "b.md", "c.md"):
+            (self.test_dir / name).write_text(f"# {name}\n")
+
+        cache = ParseCache(self.test_dir, max_entries=2)
+        cache.load(self.test_dir / "a.md")
+        cache.close()
+
+        cache = ParseCache(self.test_dir, max_entries=2)
+        cache.load(self.test_dir / "b.md")
+        cache.load(self.test_dir / "c.md")
+        cache.close()
+
+        cache = self.open_cache(max_entries=2)
+        cache.load(self.test_dir / "a.md")
+        cache.load(self.test_dir / "b.md")
+        cache.load(self.test_dir / "c.md")
+
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 1})
+
+    def test_cache_directory_is_gitignored(self):
+        """Test the cache directory ignores itself for git."""
+        self.open_cache()
+
+        gitignore = self.test_dir / ".docman-cache" / ".gitignore"
+        self.assertTrue(gitignore.exists())
+        self.assertIn("*", gitignore.read_text())
+
+    def test_disabled_by_config(self):
+        """Test the cache can be disabled from the configuration."""
+        config = DocManConfig()
+        config.cache_enabled = False
+
+        self.assertIsNone(ParseCache.for_config(self.test_dir, config))
+
+
+if __name__ == '__main__':
+    unittest.main()
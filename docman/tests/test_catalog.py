@@ -0,0 +1,134 @@
+"""
+Unit tests for catalog module.
+
+Tests for the SQLite documentation catalog and its queries.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from catalog import CatalogError, DocumentCatalog
+from docfs import OverlayFS
+from documents import parse_document
+from indexer import DocumentationIndexer
+
+
+class CountingLoader:
+    """Document loader that counts reads per file."""
+
+    def __init__(self):
+        self.reads = {}
+
+    def load(self, file_path):
+        self.reads[file_path] = self.reads.get(file_path, 0) + 1
+        return parse_document(Path(file_path).read_text(encoding='utf-8'))
+
+
+class TestDocumentCatalog(unittest.TestCase):
+    """Test cases for the documentation catalog."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        (self.test_dir / "docs").mkdir()
+
+        (self.test_dir / "README.md").write_text("""# Test Repo
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-12
+
+- [Old API](docs/old.md)
+""")
+        (self.test_dir / "docs" / "old.md").write_text("""# Old API
+**Status**: 🚫 Deprecated
+**Version**: 0.9.0
+**Last Updated**: 2024-11-02
+
+## Migration
+""")
+        (self.test_dir / "docs" / "new.md").write_text("""# New API
+**Status**: 🚫 Deprecated
+**Version**: 2.0.0
+**Last Updated**: 2025-03-01
+""")
+        self.files = sorted(self.test_dir.rglob("*.md"))
+
+        self.catalog = DocumentCatalog(self.test_dir)
+        self.addCleanup(self.catalog.close)
+
+    def test_sync_is_incremental(self):
+        """Test only changed files are re-read and rows of deleted files are dropped."""
+        loader = CountingLoader()
+        self.assertEqual(self.catalog.sync(self.files, loader, complete=True), 3)
+        self.assertEqual(self.catalog.sync(self.files, loader, complete=True), 0)
+
+        (self.test_dir / "docs" / "new.md").write_text(
+            "# New API\n**Status**: ✅ Production Ready\n")
+        (self.test_dir / "docs" / "old.md").unlink()
+        files = [f for f in self.files if f.exists()]
+        self.assertEqual(self.catalog.sync(files, loader, complete=True), 1)
+
+        self.assertEqual(loader.reads[self.test_dir / "README.md"], 1)
+        self.assertEqual(loader.reads[self.test_dir / "docs" / "new.md"], 2)
+        rows = self.catalog.query()
+        self.assertEqual([row["path"] for row in rows], ["README.md", "docs/new.md"])
+        self.assertEqual(rows[1]["status"], "✅ Production Ready")
+        self.assertEqual(rows[1]["title"], "New API")
+
+    def test_sync_reads_through_the_file_system(self):
+        """Test rows come from the catalog's DocFS; buffers are re-read every sync."""
+        new = self.test_dir / "docs" / "new.md"
+        fs = OverlayFS({new: "# Buffered API\n**Status**: 🚧 Draft\n".encode("utf-8")})
+        catalog = DocumentCatalog(self.test_dir, fs=fs)
+        self.addCleanup(catalog.close)
+
+        self.assertEqual(catalog.sync(self.files, complete=True), 3)
+        self.assertEqual(catalog.sync(self.files, complete=True), 1)
+        row = catalog.query("path = 'docs/new.md'")[0]
+        self.assertEqual((row["title"], row["status"]), ("Buffered API", "🚧 Draft"))
+
+    def test_query(self):
+        """Test conditions over metadata columns and the links/headings tables."""
+        self.catalog.sync(self.files)
+
+        deprecated = self.catalog.query(
+            "status='🚫 Deprecated' and last_updated < '2025-01-01'")
+        self.assertEqual([row["path"] for row in deprecated], ["docs/old.md"])
+        self.assertEqual(deprecated[0]["version"], "0.9.0")
+
+        linking = self.catalog.query(
+            "path in (select source from links where target = 'docs/old.md')")
+        self.assertEqual([row["path"] for row in linking], ["README.md"])
+        with_sections = self.catalog.query(
+            "path in (select path from headings where level = 2)")
+        self.assertEqual([row["path"] for row in with_sections], ["docs/old.md"])
+
+        with self.assertRaises(CatalogError):
+            self.catalog.query("1; DELETE FROM documents")
+        with self.assertRaises(CatalogError):
+            self.catalog.query("no_such_column = 1")
+        self.assertEqual(len(self.catalog.query(limit=2)), 2)
+
+    def test_index_rendered_from_catalog(self):
+        """Test the indexer fills the catalog and renders the same index without it."""
+        DocumentationIndexer(self.test_dir, catalog=self.catalog).update_index([])
+        index_file = self.test_dir / "DOCUMENTATION_INDEX.md"
+        with_catalog = index_file.read_text()
+        index_file.unlink()
+        DocumentationIndexer(self.test_dir).update_index([])
+
+        self.assertEqual(index_file.read_text(), with_catalog)
+        self.assertEqual(len(self.catalog.query()), 3)
+        with self.assertRaises(CatalogError):
+            DocumentCatalog(self.test_dir / "docs", read_only=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for corpus module.
+
+Tests for the in-memory document corpus shared by all phases of a run.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import DocumentCorpus, estimate_size
+from documents import parse_document
+from validators.link_validator import LinkValidator
+
+
+README = """# {title}
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: {date}
+"""
+
+
+class CountingLoader:
+    """Parse cache stand-in that counts reads per file."""
+
+    def __init__(self):
+        self.reads = {}
+
+    def load(self, file_path):
+        self.reads[file_path] = self.reads.get(file_path, 0) + 1
+        return parse_document(Path(file_path).read_text(encoding='utf-8'))
+
+
+class TestDocumentCorpus(unittest.TestCase):
+    """Test cases for the document corpus."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        (self.test_dir / "README.md").write_text(
+            README.format(title="Root", date="2025-01-01"))
+        for i in range(20):
+            child = self.test_dir / f"child{i}"
+            child.mkdir()
+            (child / "README.md").write_text(
+                README.format(title=f"Child {i}", date="2025-06-01"))
+
+    def test_parent_readme_read_once(self):
+        """Test the date check reads a parent with many children only once."""
+        loader = CountingLoader()
+        corpus = DocumentCorpus(loader)
+        validator = LinkValidator(self.test_dir, cache=corpus)
+        violations = validator.collect_date_violations()
+
+        self.assertEqual(len(violations), 20)
+        self.assertEqual(loader.reads[self.test_dir / "README.md"], 1)
+        self.assertEqual(corpus.stats()["misses"], 21)
+
+    def test_lru_eviction_respects_bound(self):
+        """Test least recently used documents are evicted beyond the memory bound."""
+        files = [self.test_dir / f"child{i}" / "README.md" for i in range(4)]
+        # Same size for all four
+        per_document = estimate_size(parse_document(files[0].read_text()))
+        corpus = DocumentCorpus(max_bytes=per_document * 3)
+
+        for file_path in files[:3]:
+            corpus.load(file_path)
+        corpus.load(files[0])  # most recently used now
+        corpus.load(files[3])
+
+        self.assertNotIn(files[1], corpus)
+        self.assertIn(files[0], corpus)
+        self.assertLessEqual(corpus.size, corpus.max_bytes)
+        self.assertEqual(corpus.stats()["evictions"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
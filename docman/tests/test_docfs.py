@@ -0,0 +1,125 @@
+"""
+Unit tests for docfs module.
+
+Tests for the disk, overlay and snapshot file systems the validators read through.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cache import ParseCache
+from docfs import DISK, OverlayFS, SnapshotFS
+from indexer import DocumentationIndexer
+from scanner import scan_repository
+from validators.link_validator import LinkValidator
+from validators.metadata_validator import MetadataValidator
+from validators.readme_validator import ReadmeValidator
+
+
+class TestDocFS(unittest.TestCase):
+    """Test cases for the DocFS implementations."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        (self.test_dir / "docs").mkdir()
+        (self.test_dir / "README.md").write_text("# Root\n[Guide](docs/guide.md)\n")
+        (self.test_dir / "docs" / "README.md").write_text("# Docs\n")
+
+    def test_overlay_shadows_disk_without_writing(self):
+        """
+        Test buffers replace or add files, untouched files come from disk and
+        writes stay in memory.
+        """
+        docs = self.test_dir / "docs"
+        fs = OverlayFS({docs / "guide.md": "# Guide\n[Up](../README.md)\n",
+                        self.test_dir / "api" / "README.md": b"# API\n"})
+
+        self.assertEqual(sorted(fs.list(self.test_dir)[0]), ["api", "docs"])
+        self.assertEqual(sorted(fs.list(docs)[1]), ["README.md", "guide.md"])
+        self.assertTrue(fs.is_dir(self.test_dir / "api"))
+        self.assertEqual(fs.read_bytes(docs / "README.md"), b"# Docs\n")
+
+        fs.write_atomic(self.test_dir / "README.md", b"# Changed\n")
+        fs.remove(self.test_dir / "docs" / "README.md")
+        self.assertEqual(fs.read_text(self.test_dir / "README.md"), "# Changed\n")
+        self.assertFalse(fs.exists(self.test_dir / "docs" / "README.md"))
+        self.assertNotIn("README.md", fs.list(self.test_dir / "docs")[1])
+        # The disk is untouched
+        self.assertEqual((self.test_dir / "README.md").read_text(),
+                         "# Root\n[Guide](docs/guide.md)\n")
+        self.assertTrue((self.test_dir / "docs" / "README.md").exists())
+        self.assertFalse((self.test_dir / "api").exists())
+
+    def test_validators_read_through_the_overlay(self):
+        """
+        Test the snapshot, validators and parse cache see buffers, and buffers
+        are never cached.
+        """
+        guide = self.test_dir / "docs" / "guide.md"
+        fs = OverlayFS({guide: "# Guide\n[Missing](nope.md)\n"})
+        snapshot = scan_repository(self.test_dir, fs=fs)
+        self.assertTrue(snapshot.virtual)
+        self.assertIn(guide, snapshot.markdown_files)
+
+        cache = ParseCache(self.test_dir, fs=fs)
+        self.addCleanup(cache.close)
+        validator = LinkValidator(self.test_dir, snapshot=snapshot, cache=cache)
+        violations = validator.collect_link_violations()
+        self.assertEqual([(v.file, v.target) for v in violations],
+                         [("docs/guide.md", "nope.md")])
+        self.assertEqual(cache.misses, 3)
+        self.assertIsNone(cache._db.execute(
+            "SELECT path FROM documents WHERE path = 'docs/guide.md'").fetchone())
+
+        # Against the disk alone the link to the unsaved guide is broken
+        disk_snapshot = scan_repository(self.test_dir)
+        disk_validator = LinkValidator(self.test_dir, snapshot=disk_snapshot)
+        disk_violations = disk_validator.collect_link_violations()
+        self.assertEqual([v.target for v in disk_violations], ["docs/guide.md"])
+
+    def test_in_memory_tree(self):
+        """Test validators and the indexer run on a tree that exists only in memory."""
+        root = self.test_dir / "virtual"
+        fs = OverlayFS({root / "README.md": "# Root\n**Status**: 🚧 Draft\n",
+                        root / "docs" / "guide.md": "# Guide\n"}, base=None)
+        snapshot = scan_repository(root, fs=fs)
+
+        readme = ReadmeValidator(root, snapshot=snapshot).collect_violations()
+        self.assertEqual([v.file for v in readme], ["docs"])
+        metadata = MetadataValidator(root, snapshot=snapshot).collect_violations()
+        self.assertEqual(sorted({v.file for v in metadata}),
+                         ["README.md", "docs/guide.md"])
+
+        indexer = DocumentationIndexer(root, snapshot=snapshot)
+        indexer.update_index([])
+        self.assertIn("- [docs/guide.md](docs/guide.md)",
+                      fs.read_text(root / "DOCUMENTATION_INDEX.md"))
+        self.assertFalse(root.exists())
+
+    def test_snapshot_is_read_only(self):
+        """
+        Test a snapshot lists its files, answers stats from the listing and
+        refuses writes.
+        """
+        root = self.test_dir / "virtual"
+        fs = SnapshotFS(root, {"README.md": b"# Root\n", "docs/api/v1.md": b"# V1\n"})
+
+        self.assertEqual(fs.list(root), (["docs"], ["README.md"]))
+        self.assertTrue(fs.is_dir(root / "docs" / "api"))
+        self.assertEqual(fs.read_bytes(root / "docs" / "api" / "v1.md"), b"# V1\n")
+        self.assertFalse(fs.exists(self.test_dir / "README.md"))
+        with self.assertRaises(PermissionError):
+            fs.write_atomic(root / "README.md", b"")
+        self.assertFalse(DISK.virtual)
+
+
+if __name__ == '__main__':
+    unittest.main()
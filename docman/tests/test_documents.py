@@ -0,0 +1,101 @@
+"""
+Unit tests for documents module.
+
+Tests for the single-pass markdown tokenizer.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from documents import (HEADER_MAX_LINE, Heading, Link, ParsedDocument, parse_document,
+                       read_metadata_header)
+
+
+SAMPLE = """# Title
+**Status**: ✅ Production Ready
+**Last Updated**: 2025-06-12
+
+See [guide](guide.md#setup "Guide") and ![logo](<img/logo.png>).
+Inline `[code](not-a-link.md)` and [web](https://example.com) are skipped.
+
+```markdown
+[fenced](fenced.md)
+## Fenced Heading
+```
+
+Usage
+-----
+
+[ref]: docs/ref.md
+[^note]: footnotes are not links
+"""
+
+
+class TestDocuments(unittest.TestCase):
+    """Test cases for the markdown tokenizer."""
+
+    def test_single_pass_records(self):
+        """Test metadata, links, headings and fences are extracted with positions."""
+        document = parse_document(SAMPLE)
+
+        self.assertEqual(document.metadata,
+                         {"Status": "✅ Production Ready", "Last Updated": "2025-06-12"})
+        self.assertEqual(document.metadata_lines, {"Status": 2, "Last Updated": 3})
+        self.assertEqual(document.last_updated, "2025-06-12")
+        self.assertEqual(document.links, [
+            Link("guide.md#setup", 5, 5, "inline"),
+            Link("img/logo.png", 5, 41, "image"),
+            Link("docs/ref.md", 16, 8, "reference"),
+        ])
+        self.assertEqual(document.headings, [Heading(1, "Title", 1, "title"),
+                                             Heading(2, "Usage", 13, "usage")])
+        self.assertEqual(document.code_fences, [(8, 11)])
+
+    def test_fenced_content_is_ignored(self):
+        """Test metadata-like lines and dates inside fences do not count."""
+        document = parse_document("""```
+# Not a title
+**Last Updated**: 2020-01-01
+```
+# Real
+**Version**: 1.0.0
+""")
+        self.assertEqual(document.metadata, {"Version": "1.0.0"})
+        self.assertIsNone(document.last_updated)
+        self.assertEqual(document.anchors, ["real"])
+
+    def test_round_trip(self):
+        """Test records survive the parse cache serialization."""
+        document = parse_document(SAMPLE)
+        self.assertEqual(ParsedDocument.from_dict(document.to_dict()), document)
+
+    def test_header_read_matches_full_parse(self):
+        """Test the bounded header read finds the same metadata without the body."""
+        test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, test_dir)
+        api = test_dir / "api.md"
+        api.write_bytes(SAMPLE.encode("utf-8") + b"x" * (HEADER_MAX_LINE * 2)
+                        + b"\n\xff\xfe not utf-8\n")
+
+        header = read_metadata_header(api)
+        full = parse_document(SAMPLE)
+        self.assertEqual(header.metadata, full.metadata)
+        self.assertEqual(header.metadata_lines, full.metadata_lines)
+        self.assertEqual(header.links, [])
+
+        # An overlong first line is skipped without losing the title after it
+        long_line = test_dir / "long.md"
+        long_line.write_bytes(b"y" * (HEADER_MAX_LINE + 10) + b"\n"
+                              + SAMPLE.encode("utf-8"))
+        self.assertEqual(read_metadata_header(long_line).metadata_lines,
+                         {"Status": 3, "Last Updated": 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
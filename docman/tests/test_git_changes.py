@@ -0,0 +1,146 @@
+"""
+Unit tests for git_changes module.
+
+Tests for git change detection used by the incremental modes.
+"""
+
+import shutil
+import subprocess
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from git_changes import (get_changes, parse_name_status, link_search_terms,
+                         find_files_mentioning, find_files_linking_to, GitError)
+
+
+class TestParseNameStatus(unittest.TestCase):
+    """Test cases for parsing git diff output."""
+
+    def test_parse_name_status(self):
+        """Test modified, added, deleted and renamed entries."""
+        output = ("M\0docs/a.md\0A\0docs/new/b.md\0D\0old.md\0"
+                  "R087\0x/README.md\0y/README.md\0")
+        changes = parse_name_status(output)
+
+        self.assertEqual(changes.changed,
+                         [Path("docs/a.md"), Path("docs/new/b.md"),
+                          Path("y/README.md")])
+        self.assertEqual(changes.deleted, [Path("old.md")])
+        self.assertEqual(changes.renamed, {Path("x/README.md"): Path("y/README.md")})
+        self.assertEqual(changes.removed_paths, [Path("old.md"), Path("x/README.md")])
+        self.assertEqual(changes.touched_directories,
+                         {Path("docs/new"), Path("y"), Path("x")})
+
+    def test_link_search_terms(self):
+        """Test README removals search for dir/README.md rather than bare README.md."""
+        terms = link_search_terms([Path("docs/guide.md"), Path("libs/utils/README.md")])
+
+        self.assertEqual(terms, ["guide.md", "utils/README.md"])
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestGitChanges(unittest.TestCase):
+    """Test cases against a real git repository."""
+
+    def setUp(self):
+        """Set up a repository with one commit."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        self.git("init", "-q")
+        (self.test_dir / "docs").mkdir()
+        (self.test_dir / "README.md").write_text("# Root\n\n[Guide](docs/guide.md)\n")
+        (self.test_dir / "docs" / "guide.md").write_text("# Guide\n")
+        (self.test_dir / "docs" / "other.md").write_text("# Other\n")
+        self.git("add", "-A")
+        self.git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit",
+                 "-qm", "init")
+
+    def git(self, *args):
+        """Run git in the test repository."""
+        subprocess.run(["git", "-C", str(self.test_dir)] + list(args), check=True,
+                       capture_output=True)
+
+    def test_staged_changes(self):
+        """Test staged renames and modifications are reported."""
+        self.git("mv", "docs/guide.md", "docs/manual.md")
+        (self.test_dir / "docs" / "other.md").write_text("# Other\n\nMore.\n")
+        self.git("add", "docs/other.md")
+
+        changes = get_changes(self.test_dir, staged=True)
+
+        self.assertEqual(changes.renamed,
+                         {Path("docs/guide.md"): Path("docs/manual.md")})
+        self.assertIn(Path("docs/other.md"), changes.changed)
+
+    def test_untracked_files_are_added(self):
+        """Test an unstaged new document counts as added, ignored files do not."""
+        (self.test_dir / ".gitignore").write_text("scratch/\n")
+        (self.test_dir / "scratch").mkdir()
+        (self.test_dir / "scratch" / "notes.md").write_text("# Notes\n")
+        (self.test_dir / "docs" / "new.md").write_text("# New\n")
+
+        changes = get_changes(self.test_dir, since="HEAD")
+
+        self.assertEqual(changes.added, [Path(".gitignore"), Path("docs/new.md")])
+        self.assertEqual(get_changes(self.test_dir, staged=True).added, [])
+
+    def test_unstaged_move_is_a_rename(self):
+        """Test an unstaged plain mv is paired with the deleted path by contents."""
+        (self.test_dir / "docs" / "guide.md").rename(self.test_dir / "manual.md")
+        (self.test_dir / "docs" / "other.md").unlink()
+        (self.test_dir / "docs" / "edited.md").write_text("# Other, edited\n")
+
+        changes = get_changes(self.test_dir, since="HEAD")
+
+        self.assertEqual(changes.renamed, {Path("docs/guide.md"): Path("manual.md")})
+        self.assertEqual(changes.deleted, [Path("docs/other.md")])
+        self.assertEqual(changes.removed_paths,
+                         [Path("docs/guide.md"), Path("docs/other.md")])
+
+    def test_find_files_mentioning(self):
+        """Test files linking to a removed path are found with git grep."""
+        found = find_files_mentioning(self.test_dir, ["guide.md"])
+
+        self.assertEqual(found, [Path("README.md")])
+
+    def test_removed_nested_readme_is_found_from_siblings_and_children(self):
+        """Test links to a removed docs/README.md via ../README.md and README.md."""
+        (self.test_dir / "docs" / "sub").mkdir()
+        (self.test_dir / "docs" / "README.md").write_text("# Docs\n")
+        (self.test_dir / "docs" / "guide.md").write_text("# Guide\n\n[Up](README.md)\n")
+        (self.test_dir / "docs" / "sub" / "README.md").write_text(
+            "# Sub\n\n[Up](../README.md)\n")
+        (self.test_dir / "index.md").write_text("# Index\n\n[Docs](docs/README.md)\n")
+        (self.test_dir / "other.md").write_text("# Other\n\n[Root](README.md)\n")
+        self.git("add", "-A")
+        self.git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit",
+                 "-qm", "docs")
+        self.git("rm", "-q", "docs/README.md")
+
+        found = find_files_linking_to(self.test_dir, [Path("docs/README.md")])
+
+        self.assertEqual(found,
+                         [Path("docs/guide.md"), Path("docs/sub/README.md"),
+                          Path("index.md")])
+
+    def test_grep_failures_are_not_treated_as_no_match(self):
+        """Test only git grep's no-match exit becomes an empty result."""
+        self.assertEqual(find_files_mentioning(self.test_dir,
+                                               ["nothing-links-here.md"]), [])
+        with self.assertRaises(GitError):
+            find_files_mentioning(self.test_dir / "docs" / "missing", ["guide.md"])
+
+    def test_unknown_ref_raises(self):
+        """Test an unknown ref raises GitError."""
+        with self.assertRaises(GitError):
+            get_changes(self.test_dir, since="does-not-exist")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for git_tree module.
+
+Tests for validating a git ref without a checkout.
+"""
+
+import shutil
+import subprocess
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import DocumentCorpus
+from documents import load_document
+from git_changes import GitError
+from git_tree import GitTree
+from indexer import DocumentationIndexer
+from validators.link_validator import LinkValidator
+from validators.readme_validator import ReadmeValidator
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestGitTree(unittest.TestCase):
+    """Test cases against a real (and a bare) git repository."""
+
+    def setUp(self):
+        """Set up a repository with one commit, then change the working tree."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.work = self.test_dir / "work"
+        (self.work / "docs").mkdir(parents=True)
+
+        self.git("init", "-q")
+        (self.work / "README.md").write_text(
+            "# Root\n**Status**: 🚧 Draft\n\n[Guide](docs/guide.md)\n")
+        (self.work / "docs" / "guide.md").write_text("# Guide\n[Missing](nope.md)\n")
+        self.git("add", "-A")
+        self.git("-c", "user.name=test", "-c", "user.email=test@example.com",
+                 "commit", "-qm", "init")
+
+        # The working tree differs from the commit; only the commit is validated
+        (self.work / "docs" / "guide.md").unlink()
+        (self.work / "extra.md").write_text("# Extra\n")
+
+    def git(self, *args):
+        """Run git in the test repository."""
+        subprocess.run(["git", "-C", str(self.work)] + list(args), check=True,
+                       capture_output=True)
+
+    def test_tree_is_validated_without_checkout(self):
+        """Test the snapshot and documents come from the commit, not the worktree."""
+        with GitTree(self.work, "HEAD") as tree:
+            snapshot = tree.snapshot()
+            corpus = DocumentCorpus(fs=tree)
+            self.assertTrue(snapshot.virtual)
+            self.assertEqual(snapshot.markdown_files,
+                             [self.work / "README.md", self.work / "docs" / "guide.md"])
+
+            validator = LinkValidator(self.work, snapshot=snapshot, cache=corpus)
+            violations = validator.collect_link_violations()
+            self.assertEqual([(v.file, v.target) for v in violations],
+                             [("docs/guide.md", "nope.md")])
+            readme = ReadmeValidator(self.work, snapshot=snapshot)
+            self.assertEqual([v.file for v in readme.collect_violations()], ["docs"])
+
+            indexer = DocumentationIndexer(self.work, snapshot=snapshot, cache=corpus)
+            self.assertEqual(sorted(v.target for v in indexer.check_index()),
+                             ["README.md", "docs/guide.md"])
+            self.assertFalse((self.work / "DOCUMENTATION_INDEX.md").exists())
+            # Each blob went through the one cat-file process once
+            self.assertEqual(tree.reads, 2)
+
+    def test_subdirectory_is_validated_on_its_own(self):
+        """Test a root below the top of the working tree only sees its own subtree."""
+        with GitTree(self.work / "docs", "HEAD") as tree:
+            snapshot = tree.snapshot()
+            self.assertEqual(snapshot.markdown_files, [self.work / "docs" / "guide.md"])
+            # Same as validating a checkout of docs/ (which has no README of its own);
+            # links leaving docs/ still resolve against the rest of the tree
+            self.assertTrue(tree.is_file(self.work / "README.md"))
+            readme = ReadmeValidator(self.work / "docs", snapshot=snapshot)
+            self.assertEqual([v.file for v in readme.collect_violations()], ["."])
+
+    def test_bare_repository(self):
+        """Test a bare repository is read through --git-dir, from any (virtual) root."""
+        bare = self.test_dir / "repo.git"
+        subprocess.run(["git", "clone", "-q", "--bare", str(self.work), str(bare)],
+                       check=True)
+
+        with GitTree(self.test_dir / "virtual", "HEAD", git_dir=bare) as tree:
+            self.assertEqual(sorted(tree.blobs), ["README.md", "docs/guide.md"])
+            guide = self.test_dir / "virtual" / "docs" / "guide.md"
+            self.assertEqual(load_document(guide, fs=tree).link_targets, ["nope.md"])
+            with self.assertRaises(FileNotFoundError):
+                tree.read_bytes(self.test_dir / "virtual" / "extra.md")
+
+        with self.assertRaises(GitError):
+            GitTree(self.test_dir, "no-such-ref", git_dir=bare)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -113,6 +113,110 @@ class TestDocumentationIndexer(unittest.TestCase):
         self.assertIn("apps/README.md", content)
         self.assertIn("libs/README.md", content)
 
+    def test_update_entries_patches_index(self):
+        """Test incremental index updates only touch the given entries."""
+        from utils import find_all_markdown_files
+        self.indexer.update_index(find_all_markdown_files(self.test_dir))
+
+        (self.test_dir / "apps" / "README.md").write_text("""# Apps
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-07-01
+""")
+        (self.test_dir / "apps" / "guide.md").write_text("""# Guide
+**Status**: 🚧 Draft
+**Version**: 0.1.0
+**Last Updated**: 2025-07-02
+""")
+        (self.test_dir / "libs" / "README.md").unlink()
+
+        added = self.indexer.update_entries(
+            [self.test_dir / "apps" / "README.md", self.test_dir / "apps" / "guide.md"],
+            [Path("libs/README.md")]
+        )
+
+        content = self.indexer.index_file.read_text()
+        self.assertEqual(added, 1)
+        self.assertIn("- [apps/README.md](apps/README.md) – ✅ Production Ready – "
+                      "2025-07-01", content)
+        self.assertIn("apps/guide.md", content)
+        self.assertNotIn("libs/README.md", content)
+        self.assertIn("- [README.md](README.md) – ✅ Production Ready – 2025-06-12",
+                      content)
+
+    def test_update_index_writes_only_changes(self):
+        """Test the index is refreshed in place and untouched when nothing changed."""
+        from utils import find_all_markdown_files
+        self.assertEqual(self.indexer.update_index([]), 3)
+        index_stat = self.indexer.index_file.stat()
+
+        # A second pass (the index itself now exists) renders the same bytes: no write
+        files = find_all_markdown_files(self.test_dir)
+        self.assertEqual(self.indexer.update_index(files), 0)
+        self.assertEqual(self.indexer.index_file.stat().st_mtime_ns,
+                         index_stat.st_mtime_ns)
+        self.assertEqual(self.indexer.index_file.stat().st_ino, index_stat.st_ino)
+
+        (self.test_dir / "libs" / "README.md").unlink()
+        (self.test_dir / "apps" / "README.md").write_text("""# Apps
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-07-01
+""")
+        self.assertEqual(self.indexer.update_index([]), 0)
+
+        content = self.indexer.index_file.read_text()
+        self.assertIn("- [apps/README.md](apps/README.md) – ✅ Production Ready – "
+                      "2025-07-01", content)
+        self.assertNotIn("libs/README.md", content)
+        self.assertNotIn("DOCUMENTATION_INDEX.md", content)
+        self.assertEqual(list(self.test_dir.glob(".DOCUMENTATION_INDEX.md.*")), [])
+
+    def test_sharded_index(self):
+        """Test subtrees over the threshold get their own index linked from the root."""
+        (self.test_dir / "apps" / "guide.md").write_text("# Guide\n")
+        indexer = DocumentationIndexer(self.test_dir, shard_depth=1, shard_threshold=2)
+        self.assertEqual(indexer.update_index([]), 4)
+
+        root = self.indexer.index_file.read_text()
+        shard_file = self.test_dir / "apps" / "DOCUMENTATION_INDEX.md"
+        shard = shard_file.read_text()
+        self.assertIn("- 📁 [apps/](apps/DOCUMENTATION_INDEX.md) – 2 documents", root)
+        self.assertIn("- [libs/README.md](libs/README.md)", root)
+        self.assertNotIn("apps/guide.md", root)
+        self.assertTrue(shard.startswith("# Documentation Index: apps"))
+        self.assertIn("[parent index](../DOCUMENTATION_INDEX.md)", shard)
+        self.assertIn("- [apps/guide.md](guide.md) – 🚧 Draft – 2025-01-01", shard)
+        self.assertEqual(indexer.check_index(), [])
+
+        # Only the shard whose subtree changed is rewritten
+        root_stat = self.indexer.index_file.stat()
+        (self.test_dir / "apps" / "guide.md").write_text(
+            "# Guide\n**Last Updated**: 2025-07-01\n")
+        self.assertEqual(indexer.update_index([]), 0)
+        self.assertIn("2025-07-01", shard_file.read_text())
+        self.assertEqual(self.indexer.index_file.stat().st_mtime_ns,
+                         root_stat.st_mtime_ns)
+
+    def test_unsharding_removes_shards(self):
+        """Test shards no longer part of the layout are reported and deleted."""
+        sharded = DocumentationIndexer(self.test_dir, shard_depth=1, shard_threshold=1)
+        sharded.update_index([])
+        self.assertTrue((self.test_dir / "libs" / "DOCUMENTATION_INDEX.md").exists())
+
+        drift = self.indexer.check_index()
+        self.assertEqual(sorted(v.message for v in drift), [
+            "DOCUMENTATION_INDEX.md needs to be regenerated",
+            "apps/DOCUMENTATION_INDEX.md is no longer needed",
+            "libs/DOCUMENTATION_INDEX.md is no longer needed",
+        ])
+
+        self.assertEqual(self.indexer.update_index([]), 0)
+        self.assertFalse((self.test_dir / "libs" / "DOCUMENTATION_INDEX.md").exists())
+        self.assertIn("- [libs/README.md](libs/README.md)",
+                      self.indexer.index_file.read_text())
+        self.assertEqual(self.indexer.check_index(), [])
+
     def test_categorize_file(self):
         """Test file categorization logic."""
         # Test different file paths
@@ -4,6 +4,7 @@ Integration tests for DocMan CLI.
 Tests the complete workflow from CLI invocation to final output.
 """
 
+import json
 import unittest
 import tempfile
 import shutil
@@ -65,8 +66,8 @@ Utility functions.
         # Tools directory without README (for testing missing README)
         # Core directory will be ignored
     
-    def run_docman_cli(self, args=None, expect_success=True):
-        """Run DocMan CLI and return result."""
+    def run_docman_cli(self, args=None, expect_success=True, input=None):
+        """Run DocMan CLI (with optional stdin text) and return result."""
         cmd = [sys.executable, str(self.cli_path)]
         if args:
             cmd.extend(args)
@@ -76,6 +77,7 @@ Utility functions.
             cmd,
             capture_output=True,
             text=True,
+            input=input,
             cwd=self.cli_path.parent
         )
         
@@ -142,6 +144,94 @@ Utility functions.
         self.assertIn("README.md", content)
         self.assertIn("apps/web/README.md", content)
     
+    def test_single_file_validation(self):
+        """Test --file validates only the given document and leaves the index alone."""
+        index_file = self.test_dir / "DOCUMENTATION_INDEX.md"
+        if index_file.exists():
+            index_file.unlink()
+
+        target = self.test_dir / "libs" / "utils" / "README.md"
+        result = self.run_docman_cli(["--no-cache", "--file", str(target)],
+                                     expect_success=False)
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Invalid Status", result.stdout)
+        self.assertNotIn("Missing README: tools", result.stdout)
+        self.assertFalse(index_file.exists())
+
+        # A clean file passes on its own even though the repository has issues
+        clean = self.test_dir / "apps" / "web" / "README.md"
+        result = self.run_docman_cli(["--no-cache", "--file", str(clean)])
+        self.assertEqual(result.returncode, 0)
+        self.assertFalse(index_file.exists())
+
+    def test_stdin_validation(self):
+        """Test unsaved stdin contents are validated in place of files, read-only."""
+        target = self.test_dir / "libs" / "utils" / "README.md"
+        guide = self.test_dir / "libs" / "utils" / "guide.md"
+        fixed = ("# Utilities\n**Status**: 🚧 Draft\n**Version**: 0.1.0\n"
+                 "**Last Updated**: 2025-06-01\n")
+        result = self.run_docman_cli(["--stdin-file", str(target)],
+                                     input=fixed + "[Guide](guide.md#setup)\n",
+                                     expect_success=False)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Broken link in libs/utils/README.md: guide.md#setup",
+                      result.stdout)
+        self.assertNotIn("Invalid Status", result.stdout)
+
+        # Batch form: links between the supplied documents resolve against each other
+        buffers = {str(target): fixed + "[Guide](guide.md#setup)\n",
+                   str(guide): fixed + "## Setup\n"}
+        result = self.run_docman_cli(["--stdin-json", "--format", "json"],
+                                     input=json.dumps(buffers))
+        self.assertEqual(json.loads(result.stdout)["violations"], [])
+
+        self.assertFalse(guide.exists())
+        self.assertIn("Invalid Status", target.read_text())
+        self.assertEqual(list(self.test_dir.glob("DOCUMENTATION_INDEX.md")), [])
+        self.assertFalse((self.test_dir / ".docman-cache").exists())
+
+    def test_check_mode_writes_nothing(self):
+        """Test --check reports index differences and fails without writing anything."""
+        index_file = self.test_dir / "DOCUMENTATION_INDEX.md"
+        self.run_docman_cli(expect_success=False)
+        before = {p: p.stat().st_mtime_ns
+                  for p in self.test_dir.rglob("*") if p.is_file()}
+
+        (self.test_dir / "apps" / "web" / "guide.md").write_text("# Guide\n")
+        result = self.run_docman_cli(["--check", "--format", "json"],
+                                     expect_success=False)
+
+        self.assertEqual(result.returncode, 1)
+        drift = [v for v in json.loads(result.stdout)["violations"]
+                 if v["rule"] == "index-out-of-date"]
+        self.assertEqual([v["target"] for v in drift], ["apps/web/guide.md"])
+        self.assertNotIn("apps/web/guide.md", index_file.read_text())
+
+        after = {p: p.stat().st_mtime_ns
+                 for p in self.test_dir.rglob("*") if p.is_file()}
+        del after[self.test_dir / "apps" / "web" / "guide.md"]
+        self.assertEqual(after, before)
+
+    def test_move_paths_are_relative_to_the_repository(self):
+        """Test move resolves relative OLD and NEW against --repo, not the cwd."""
+        elsewhere = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, elsewhere)
+
+        result = subprocess.run(
+            [sys.executable, str(self.cli_path), "move", "--repo", str(self.test_dir),
+             "apps/web/README.md", "apps/web/guide.md"],
+            capture_output=True,
+            text=True,
+            cwd=elsewhere
+        )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertTrue((self.test_dir / "apps" / "web" / "guide.md").exists())
+        self.assertFalse((self.test_dir / "apps" / "web" / "README.md").exists())
+        self.assertIn("[Web App](apps/web/guide.md)",
+                      (self.test_dir / "README.md").read_text())
+
     def test_clean_repository(self):
         """Test validation shows improvement after fixing issues."""
         # First run - should have issues
@@ -0,0 +1,76 @@
+"""
+Unit tests for link_graph module.
+
+Tests for reverse link lookups and graph export from the catalog.
+"""
+
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from catalog import DocumentCatalog
+from link_graph import LinkGraph
+
+
+class TestLinkGraph(unittest.TestCase):
+    """Test cases for the link graph."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        (self.test_dir / "docs" / "api").mkdir(parents=True)
+
+        (self.test_dir / "README.md").write_text(
+            "# Repo\n[Docs](docs/README.md)\n[API](docs/api/v1.md#usage)\n"
+            "[site](https://example.com)\n")
+        (self.test_dir / "docs" / "README.md").write_text(
+            "# Docs\n[v1](api/v1.md)\n[up](../README.md)\n[tree](api/)\n")
+        (self.test_dir / "docs" / "api" / "v1.md").write_text(
+            "# V1\n[index](../README.md)\n[self](#v1)\n")
+
+        catalog = DocumentCatalog(self.test_dir)
+        self.addCleanup(catalog.close)
+        catalog.sync(sorted(self.test_dir.rglob("*.md")), complete=True)
+        self.graph = LinkGraph(catalog)
+
+    def test_reverse_lookups(self):
+        """Test inbound links and the links a deletion would break."""
+        inbound = self.graph.who_links_to("docs/api/v1.md")
+        self.assertEqual([(link.source, link.line, link.link) for link in inbound],
+                         [("README.md", 3, "docs/api/v1.md#usage"),
+                          ("docs/README.md", 2, "api/v1.md")])
+        inbound = self.graph.who_links_to("docs/api")
+        self.assertEqual([link.source for link in inbound], ["docs/README.md"])
+
+        # Links from inside the deleted directory do not count
+        broken = self.graph.impact_of_delete("docs")
+        self.assertEqual([(link.source, link.target) for link in broken],
+                         [("README.md", "docs/README.md"),
+                          ("README.md", "docs/api/v1.md")])
+        self.assertEqual(len(self.graph.impact_of_delete("docs/api")), 3)
+        self.assertEqual(self.graph.impact_of_delete("docs/ap"), [])
+
+    def test_export(self):
+        """Test DOT and JSON exports contain the doc-to-doc edges only."""
+        graph = json.loads(self.graph.export("json"))
+        self.assertEqual(graph["adjacency"], {
+            "README.md": ["docs/README.md", "docs/api/v1.md"],
+            "docs/README.md": ["README.md", "docs/api/v1.md"],
+            "docs/api/v1.md": ["docs/README.md"],
+        })
+
+        dot = self.graph.export("dot")
+        self.assertTrue(dot.startswith("digraph docs {"))
+        self.assertIn('"docs/api/v1.md" -> "docs/README.md";', dot)
+        self.assertNotIn("example.com", dot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for link_rewriter module.
+
+Tests for rewriting relative links after documents are moved.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from catalog import DocumentCatalog
+from docfs import OverlayFS
+from link_rewriter import LinkRewriter, move_path
+
+
+class TestLinkRewriter(unittest.TestCase):
+    """Test cases for the link rewriter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        (self.test_dir / "docs" / "guide").mkdir(parents=True)
+
+        (self.test_dir / "README.md").write_bytes(
+            b"# Repo\r\n[Install](docs/guide/install.md#setup) and "
+            b"[again](<docs/guide/install.md> \"Install\")\r\n\r\n"
+            b"[ref]: docs/guide/\r\n")
+        (self.test_dir / "docs" / "README.md").write_text(
+            "# Docs\n[Guide](guide/README.md)\n`[code](guide/README.md)`\n")
+        (self.test_dir / "docs" / "guide" / "README.md").write_text(
+            "# Guide\n[Install](install.md) [Home](../../README.md) [Self](#guide)\n")
+        (self.test_dir / "docs" / "guide" / "install.md").write_text("# Install\n")
+
+        self.catalog = DocumentCatalog(self.test_dir)
+        self.addCleanup(self.catalog.close)
+        self.sync()
+
+    def sync(self):
+        self.catalog.sync(sorted(self.test_dir.rglob("*.md")), complete=True)
+
+    def test_move_directory(self):
+        """Test links into and out of a moved tree are rewritten, links inside kept."""
+        rewriter = LinkRewriter(self.test_dir, self.catalog, {"docs/guide": "manual"})
+        edits = rewriter.plan()
+        self.assertEqual(sorted(edits),
+                         ["README.md", "docs/README.md", "docs/guide/README.md"])
+
+        self.assertEqual(rewriter.apply(edits), (3, 5))
+        move_path(self.test_dir, "docs/guide", "manual")
+
+        self.assertEqual((self.test_dir / "README.md").read_bytes(),
+                         b"# Repo\r\n[Install](manual/install.md#setup) and "
+                         b"[again](<manual/install.md> \"Install\")\r\n\r\n"
+                         b"[ref]: manual/\r\n")
+        self.assertEqual((self.test_dir / "docs" / "README.md").read_text(),
+                         "# Docs\n[Guide](../manual/README.md)\n"
+                         "`[code](guide/README.md)`\n")
+        self.assertEqual((self.test_dir / "manual" / "README.md").read_text(),
+                         "# Guide\n[Install](install.md) [Home](../README.md) "
+                         "[Self](#guide)\n")
+        self.assertEqual(list(self.test_dir.rglob(".*.tmp")), [])
+
+    def test_fix_links_after_rename(self):
+        """Test links are repaired from the old location of renamed documents."""
+        move_path(self.test_dir, "docs/guide/README.md", "docs/guide.md")
+        self.sync()
+
+        rewriter = LinkRewriter(self.test_dir, self.catalog,
+                                {"docs/guide/README.md": "docs/guide.md"})
+        edits = rewriter.plan(moved_files=["docs/guide.md"], already_moved=True)
+        rewriter.apply(edits)
+
+        self.assertIn("[Guide](guide.md)",
+                      (self.test_dir / "docs" / "README.md").read_text())
+        self.assertEqual((self.test_dir / "docs" / "guide.md").read_text(),
+                         "# Guide\n[Install](guide/install.md) [Home](../README.md) "
+                         "[Self](#guide)\n")
+        edits = rewriter.plan(moved_files=["docs/guide.md"], already_moved=True)
+        self.assertEqual(edits, {})
+
+    def test_rewrites_go_through_the_file_system(self):
+        """Test buffered contents are read and the rewrites go to the given DocFS."""
+        docs_readme = self.test_dir / "docs" / "README.md"
+        root_readme = self.test_dir / "README.md"
+        fs = OverlayFS({docs_readme: b"# Docs\n[Install](guide/install.md)\n"})
+        rewriter = LinkRewriter(self.test_dir, self.catalog, {"docs/guide": "manual"},
+                                fs=fs)
+        rewriter.apply(rewriter.plan())
+
+        self.assertEqual(fs.read_text(docs_readme),
+                         "# Docs\n[Install](../manual/install.md)\n")
+        self.assertEqual(docs_readme.read_text(),
+                         "# Docs\n[Guide](guide/README.md)\n"
+                         "`[code](guide/README.md)`\n")
+        self.assertIn("[Install](manual/install.md#setup)", fs.read_text(root_readme))
+        self.assertIn("docs/guide/install.md", root_readme.read_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for parallel module.
+
+Tests that pooled validation matches a serial run.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cache import ParseCache
+from config import DocManConfig
+from parallel import ParallelValidator
+from scanner import scan_repository
+from validators.metadata_validator import MetadataValidator
+from validators.link_validator import LinkValidator
+
+
+class TestParallelValidator(unittest.TestCase):
+    """Test cases for the process pool validator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.config = DocManConfig()
+
+        for i in range(12):
+            directory = self.test_dir / f"area{i % 3}"
+            directory.mkdir(exist_ok=True)
+            status = "✅ Production Ready" if i % 2 else "Bogus"
+            # different sizes exercise the scheduling order
+            filler = "text " * (i * 200)
+            (directory / f"doc{i}.md").write_text(f"""# Doc {i}
+**Status**: {status}
+**Version**: 1.0.0
+**Last Updated**: 2025-06-01
+
+[Next](doc{i + 1}.md#doc-{i + 1}) [Home](../README.md) [Self](#doc-{i}) [Bad](#nowhere)
+
+{filler}
+""")
+
+        self.files = scan_repository(self.test_dir).markdown_files
+
+    def serial_results(self):
+        """Validate the same files one after another."""
+        validator = MetadataValidator(self.test_dir, config=self.config)
+        metadata = validator.collect_violations(self.files)
+        links = LinkValidator(self.test_dir).collect_link_violations(self.files)
+        return metadata, links
+
+    def test_matches_serial_order(self):
+        """Test the merged results equal a serial run, in the same order."""
+        parallel = ParallelValidator(self.test_dir, self.config, jobs=2, chunk_size=3)
+        results = parallel.validate(self.files)
+        self.assertEqual(results, self.serial_results())
+        self.assertEqual(sum(v.rule == "broken-anchor" for v in results[1]),
+                         len(self.files))
+
+        # Parsed documents are kept for later phases
+        self.assertEqual(set(parallel.documents), set(self.files))
+        self.assertEqual(parallel.load(self.files[0]).metadata["Version"], "1.0.0")
+
+    def test_uses_parse_cache(self):
+        """Test fresh records are written to the parse cache and reused next run."""
+        cache = ParseCache(self.test_dir)
+        self.addCleanup(cache.close)
+        parallel = ParallelValidator(self.test_dir, self.config, jobs=2, cache=cache)
+        parallel.validate(self.files)
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": len(self.files)})
+
+        parallel = ParallelValidator(self.test_dir, self.config, jobs=2, cache=cache)
+        results = parallel.validate(self.files)
+        self.assertEqual(cache.stats()["hits"], len(self.files))
+        self.assertEqual(results, self.serial_results())
+
+    def test_small_runs_stay_serial(self):
+        """Test the pool is only used for enough files and more than one job."""
+        single = ParallelValidator(self.test_dir, self.config, jobs=1)
+        pooled = ParallelValidator(self.test_dir, self.config, jobs=8)
+        self.assertFalse(single.should_run(10_000))
+        self.assertFalse(pooled.should_run(10))
+        self.assertTrue(pooled.should_run(10_000))
+
+
+if __name__ == '__main__':
+    unittest.main()
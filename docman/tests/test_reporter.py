@@ -4,6 +4,7 @@ Unit tests for reporter module.
 Tests for report generation and output formatting.
 """
 
+import json
 import unittest
 from io import StringIO
 import sys
@@ -12,7 +13,7 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from reporter import Reporter, ValidationResult
+from reporter import Reporter, ValidationResult, Violation
 
 
 class TestReporter(unittest.TestCase):
@@ -110,6 +111,59 @@ class TestReporter(unittest.TestCase):
         self.assertEqual(len(results.date_bumps), 1)
         self.assertEqual(len(results.new_index_entries), 1)
 
+    def make_results(self) -> ValidationResult:
+        """Build results backed by structured violation records."""
+        missing = Violation(rule="missing-readme", file="apps",
+                            message="Missing README")
+        broken = Violation(rule="broken-link", file="README.md",
+                           message="Broken link: gone.md", target="gone.md")
+        return ValidationResult(
+            missing_readmes=[missing.format()],
+            metadata_violations=[],
+            broken_links=[broken.format()],
+            date_bumps=[],
+            new_index_entries=["✅ Added docs/new.md to index"],
+            violations=[missing, broken],
+            index_files=["docs/new.md"]
+        )
+
+    def test_json_output(self):
+        """Test JSON output is a single document with records and counts."""
+        stream = StringIO()
+        reporter = Reporter(output_format="json", stream=stream)
+        exit_code = reporter.print_summary(self.make_results())
+        document = json.loads(stream.getvalue())
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(document["exitCode"], 1)
+        self.assertEqual([v["rule"] for v in document["violations"]],
+                         ["missing-readme", "broken-link"])
+        self.assertEqual(document["violations"][1]["target"], "gone.md")
+        self.assertEqual(document["indexEntries"], ["docs/new.md"])
+        self.assertEqual(document["summary"]["issues"], 2)
+        self.assertEqual(sys.stdout.getvalue(), "")
+
+    def test_ndjson_streams_each_violation_once(self):
+        """Test NDJSON records are written when emitted, not repeated in the summary."""
+        stream = StringIO()
+        reporter = Reporter(output_format="ndjson", stream=stream)
+        results = self.make_results()
+
+        reporter.emit(results.violations[0])
+        self.assertEqual(json.loads(stream.getvalue())["file"], "apps")
+
+        reporter.print_summary(results)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["type"] for r in records],
+                         ["violation", "violation", "index-entry", "summary"])
+        self.assertEqual(records[-1]["exitCode"], 1)
+
+    def test_text_mode_ignores_emit(self):
+        """Test emit() writes nothing in text mode."""
+        self.reporter.emit(Violation(rule="metadata", file="a.md",
+                                     message='missing "Version"'))
+        self.assertEqual(sys.stdout.getvalue(), "")
+
 
 if __name__ == '__main__':
     unittest.main()
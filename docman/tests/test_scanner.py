@@ -0,0 +1,110 @@
+"""
+Unit tests for scanner module.
+
+Tests for the single-pass repository scanner and its snapshot.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scanner import RepoSnapshot, scan_repository
+
+
+class TestRepoScanner(unittest.TestCase):
+    """Test cases for the repository scanner."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        (self.test_dir / "apps" / "web").mkdir(parents=True)
+        (self.test_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (self.test_dir / "README.md").write_text("# Root\n")
+        (self.test_dir / "apps" / "web" / "README.md").write_text("# Web\n")
+        (self.test_dir / "apps" / "guide.md").write_text("# Guide\n")
+        (self.test_dir / "apps" / "notes.txt").write_text("notes\n")
+        (self.test_dir / "node_modules" / "pkg" / "README.md").write_text("# Pkg\n")
+
+    def test_scan_collects_directories_and_markdown(self):
+        """Test that directories and markdown files are collected, sorted."""
+        snapshot = scan_repository(self.test_dir)
+
+        relative_dirs = [str(d.relative_to(self.test_dir))
+                         for d in snapshot.directories]
+        relative_files = [str(f.relative_to(self.test_dir))
+                          for f in snapshot.markdown_files]
+
+        self.assertEqual(relative_dirs, ["apps", "apps/web"])
+        self.assertEqual(relative_files,
+                         ["README.md", "apps/guide.md", "apps/web/README.md"])
+
+    def test_ignored_subtrees_are_pruned(self):
+        """Test that ignored directories are never descended into."""
+        snapshot = scan_repository(self.test_dir)
+
+        self.assertNotIn(self.test_dir / "node_modules", snapshot.directories)
+        self.assertNotIn(self.test_dir / "node_modules" / "pkg", snapshot.directories)
+        self.assertNotIn(self.test_dir / "node_modules" / "pkg", snapshot._listings)
+
+    def test_readme_presence_from_listing(self):
+        """Test README lookups use the recorded directory entries."""
+        snapshot = scan_repository(self.test_dir)
+
+        self.assertTrue(snapshot.has_readme(self.test_dir))
+        self.assertFalse(snapshot.has_readme(self.test_dir / "apps"))
+        self.assertEqual(snapshot.readme_for(self.test_dir / "apps" / "web"),
+                         self.test_dir / "apps" / "web" / "README.md")
+        self.assertEqual(len(snapshot.readme_files()), 2)
+
+    def test_exists_uses_listings_and_memoized_stat(self):
+        """Test link targets come from listings; only unscanned paths are stat'ed."""
+        snapshot = scan_repository(self.test_dir)
+
+        self.assertTrue(snapshot.exists(self.test_dir / "apps" / "notes.txt"))
+        self.assertTrue(snapshot.exists(self.test_dir / "apps" / "web"))
+        self.assertFalse(snapshot.exists(self.test_dir / "apps" / "missing.md"))
+        # Ignored paths are not in the listings but still exist on disk
+        ignored = self.test_dir / "node_modules" / "pkg" / "README.md"
+        self.assertTrue(snapshot.exists(ignored))
+
+        # Answers are memoized until the snapshot is refreshed
+        (self.test_dir / "apps" / "missing.md").write_text("# Now here\n")
+        self.assertFalse(snapshot.exists(self.test_dir / "apps" / "missing.md"))
+        snapshot.refresh([self.test_dir / "apps" / "missing.md"])
+        self.assertTrue(snapshot.exists(self.test_dir / "apps" / "missing.md"))
+
+    def test_add_paths_updates_snapshot(self):
+        """Test that files created after the scan can be recorded."""
+        snapshot = scan_repository(self.test_dir)
+        new_readme = self.test_dir / "apps" / "README.md"
+        new_readme.write_text("# Apps\n")
+
+        snapshot.add_paths([new_readme])
+
+        self.assertTrue(snapshot.has_readme(self.test_dir / "apps"))
+        self.assertIn(new_readme, snapshot.markdown_files)
+
+    def test_partial_snapshot_from_paths(self):
+        """Test a partial snapshot only covers the given paths."""
+        snapshot = RepoSnapshot.from_paths(
+            self.test_dir, files=[Path("apps/guide.md"), Path("apps/notes.txt"),
+                                  Path("node_modules/pkg/README.md"), Path("gone.md")],
+            directories=[Path("apps/web")]
+        )
+
+        self.assertFalse(snapshot.complete)
+        self.assertFalse(snapshot.root_in_scope)
+        self.assertEqual(snapshot.markdown_files, [self.test_dir / "apps" / "guide.md"])
+        self.assertEqual(snapshot.directories,
+                         [self.test_dir / "apps", self.test_dir / "apps" / "web"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit tests for server module.
+
+Tests for the JSON-RPC stdio daemon and its validation session.
+"""
+
+import io
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import DocManConfig
+from session import ValidationSession
+from server import DocManServer, METHOD_NOT_FOUND, PARSE_ERROR
+
+
+GOOD_README = """# Test Repo
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-12
+
+[Apps](apps/README.md)
+"""
+
+
+class TestServer(unittest.TestCase):
+    """Test cases for the validation daemon."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        (self.test_dir / "apps").mkdir()
+        (self.test_dir / "README.md").write_text(GOOD_README)
+        (self.test_dir / "apps" / "README.md").write_text("""# Apps
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-01
+""")
+        self.session = ValidationSession(self.test_dir, DocManConfig())
+
+    def run_server(self, raw: bytes) -> bytes:
+        """Feed raw input to a server and return everything it wrote."""
+        output = io.BytesIO()
+        DocManServer(self.session, io.BytesIO(raw), output).serve()
+        return output.getvalue()
+
+    def ndjson(self, *messages) -> list:
+        """Send newline-delimited requests and decode the responses."""
+        raw = b"".join(json.dumps(m).encode("utf-8") + b"\n" for m in messages)
+        return [json.loads(line) for line in self.run_server(raw).splitlines()]
+
+    def test_validate_workspace_clean(self):
+        """Test a clean repository yields no diagnostics."""
+        responses = self.ndjson({"jsonrpc": "2.0", "id": 1,
+                                 "method": "validateWorkspace"})
+        self.assertEqual(responses[0]["id"], 1)
+        self.assertEqual(responses[0]["result"]["diagnostics"], [])
+
+    def test_did_change_uses_unsaved_content(self):
+        """Test didChange validates the buffer content without touching disk."""
+        responses = self.ndjson({
+            "jsonrpc": "2.0", "id": 1, "method": "didChange",
+            "params": {"path": "README.md", "content": "# Test\n\n[Gone](missing.md)\n"}
+        })
+        rules = sorted(d["rule"] for d in responses[0]["result"]["diagnostics"])
+        self.assertIn("broken-link", rules)
+        self.assertIn("metadata", rules)
+        self.assertEqual((self.test_dir / "README.md").read_text(), GOOD_README)
+
+        # Clearing the overlay goes back to the file on disk
+        self.session.did_change("README.md")
+        self.assertEqual(self.session.validate_files(["README.md"]), [])
+
+    def test_unsaved_new_files_are_validated_and_resolvable(self):
+        """Test an unsaved new file is validated and makes links to it resolve."""
+        responses = self.ndjson(
+            {"jsonrpc": "2.0", "id": 1, "method": "didChange",
+             "params": {"path": "libs/new.md",
+                        "content": "# New\n\n[Root](../README.md)\n"}},
+            {"jsonrpc": "2.0", "id": 2, "method": "didChange",
+             "params": {"path": "apps/README.md",
+                        "content": GOOD_README.replace("apps/README.md",
+                                                       "../libs/new.md")}})
+
+        self.assertEqual({(d["rule"], d["file"])
+                          for d in responses[0]["result"]["diagnostics"]},
+                         {("missing-readme", "libs"), ("metadata", "libs/new.md")})
+        self.assertEqual(responses[1]["result"]["diagnostics"], [])
+        self.assertFalse((self.test_dir / "libs").exists())
+
+        # Dropping the buffer removes the virtual file and directory again
+        self.session.did_change("libs/new.md")
+        self.assertNotIn(self.test_dir / "libs", self.session.snapshot.directories)
+        violations = self.session.validate_files(["apps/README.md"])
+        self.assertEqual([v.target for v in violations], ["../libs/new.md"])
+
+    def test_paths_that_cannot_be_validated_are_reported(self):
+        """Test unknown, outside and ignored paths get a read-error diagnostic."""
+        (self.test_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (self.test_dir / "node_modules" / "pkg" / "README.md").write_text("# Pkg\n")
+        self.session.rescan()
+
+        responses = self.ndjson({
+            "jsonrpc": "2.0", "id": 1, "method": "validateFile",
+            "params": {"paths": ["README.md", "gone.md", "../elsewhere.md",
+                                 "node_modules/pkg/README.md"]}
+        })
+        diagnostics = responses[0]["result"]["diagnostics"]
+        self.assertEqual([(d["rule"], d["file"], d["severity"]) for d in diagnostics], [
+            ("read-error", "gone.md", "error"),
+            ("read-error", "../elsewhere.md", "error"),
+            ("read-error", "node_modules/pkg/README.md", "warning"),
+        ])
+        self.assertIn("no such file", diagnostics[0]["message"])
+        self.assertEqual(responses[0]["result"]["summary"],
+                         {"errors": 2, "warnings": 1})
+
+    def test_new_directory_is_picked_up(self):
+        """Test didChange on a new file refreshes the snapshot."""
+        (self.test_dir / "libs").mkdir()
+        (self.test_dir / "libs" / "guide.md").write_text("# Guide\n")
+        responses = self.ndjson({"jsonrpc": "2.0", "id": 7, "method": "didChange",
+                                 "params": {"path": "libs/guide.md"}})
+        rules = {d["rule"] for d in responses[0]["result"]["diagnostics"]}
+        self.assertEqual(rules, {"missing-readme", "metadata"})
+
+    def test_content_length_framing(self):
+        """Test LSP-style framing is detected and used for replies."""
+        body = json.dumps({"jsonrpc": "2.0", "id": 3, "method": "validateFile",
+                           "params": {"path": "apps/README.md"}}).encode("utf-8")
+        output = self.run_server(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+        header, _, payload = output.partition(b"\r\n\r\n")
+        self.assertEqual(int(header.split(b":")[1]), len(payload))
+        self.assertEqual(json.loads(payload)["result"]["summary"],
+                         {"errors": 0, "warnings": 0})
+
+    def test_malformed_content_length(self):
+        """Test a bad Content-Length gets a parse error and the server keeps going."""
+        body = json.dumps({"jsonrpc": "2.0", "id": 4, "method": "validateFile",
+                           "params": {"path": "apps/README.md"}}).encode("utf-8")
+        output = self.run_server(b"Content-Length: abc\r\n\r\n"
+                                 + b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+        payloads = [json.loads(chunk.split(b"\r\n\r\n", 1)[1])
+                    for chunk in output.split(b"Content-Length: ")[1:]]
+        self.assertEqual(payloads[0]["error"]["code"], PARSE_ERROR)
+        self.assertEqual(payloads[1]["id"], 4)
+
+    def test_errors_and_notifications(self):
+        """Test protocol errors, silent notifications and exit."""
+        raw = (b"{not json}\n"
+               + json.dumps({"jsonrpc": "2.0", "id": 2,
+                             "method": "bogus"}).encode() + b"\n"
+               + json.dumps({"jsonrpc": "2.0",
+                             "method": "validateWorkspace"}).encode() + b"\n"
+               + json.dumps({"jsonrpc": "2.0", "method": "exit"}).encode() + b"\n"
+               + json.dumps({"jsonrpc": "2.0", "id": 9,
+                             "method": "validateWorkspace"}).encode() + b"\n")
+        responses = [json.loads(line) for line in self.run_server(raw).splitlines()]
+
+        self.assertEqual([r["error"]["code"] for r in responses],
+                         [PARSE_ERROR, METHOD_NOT_FOUND])
+
+
+if __name__ == '__main__':
+    unittest.main()
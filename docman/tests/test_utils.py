@@ -5,7 +5,17 @@ Tests for utility functions used across DocMan.
 """
 
 import unittest
+import tempfile
+import shutil
 from pathlib import Path
+import sys
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import (IgnoreMatcher, PhaseTimer, should_ignore_path, find_all_directories,
+                   find_all_markdown_files)
 
 
 class TestUtils(unittest.TestCase):
@@ -13,23 +23,119 @@ class TestUtils(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        # TODO: Implement test setup
-        pass
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        (self.test_dir / "docs" / "guide").mkdir(parents=True)
+        (self.test_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (self.test_dir / "README.md").write_text("# Root\n")
+        (self.test_dir / "docs" / "guide" / "README.md").write_text("# Guide\n")
+        (self.test_dir / "node_modules" / "pkg" / "README.md").write_text("# Pkg\n")
     
     def test_should_ignore_path(self):
         """Test path ignore logic."""
-        # TODO: Implement test
-        pass
+        patterns = {"node_modules/", "core", "*.log"}
+
+        self.assertTrue(should_ignore_path(Path("node_modules/pkg/README.md"),
+                                           patterns))
+        self.assertTrue(should_ignore_path(Path("src/core/README.md"), patterns))
+        self.assertTrue(should_ignore_path(Path("logs/debug.log"), patterns))
+        self.assertFalse(should_ignore_path(Path("docs/README.md"), patterns))
+
+    def test_should_ignore_path_relative_to_root(self):
+        """Test that directories above the repository root are never matched."""
+        root = Path("/home/user/build/core/repo")
+        path = root / "docs" / "README.md"
+
+        self.assertFalse(should_ignore_path(path, {"build", "core"}, root=root))
+        self.assertTrue(should_ignore_path(root / "core" / "README.md", {"core"},
+                                           root=root))
     
     def test_find_all_directories(self):
         """Test directory discovery."""
-        # TODO: Implement test
-        pass
+        directories = find_all_directories(self.test_dir)
+        relative = {str(d.relative_to(self.test_dir)) for d in directories}
+
+        self.assertEqual(relative, {"docs", "docs/guide"})
     
     def test_find_all_markdown_files(self):
         """Test markdown file discovery."""
-        # TODO: Implement test
-        pass
+        md_files = find_all_markdown_files(self.test_dir)
+        relative = {str(f.relative_to(self.test_dir)) for f in md_files}
+
+        self.assertEqual(relative, {"README.md", "docs/guide/README.md"})
+
+    def test_phase_timer(self):
+        """Test phases are timed in start order and a repeated phase accumulates."""
+        timer = PhaseTimer()
+        clock = [0.0, 1.0, 3.0, 3.5, 4.0]
+        with mock.patch("utils.time.perf_counter", side_effect=clock):
+            timer.start("scan")
+            timer.start("links")
+            timer.start("scan")
+            timer.start("index")
+            timer.stop()
+
+        self.assertEqual(timer.timings, {"scan": 1.5, "links": 2.0, "index": 0.5})
+        timer.reset()
+        self.assertEqual(timer.timings, {})
+
+
+class TestIgnoreMatcher(unittest.TestCase):
+    """Test cases for the compiled ignore matcher."""
+
+    def test_name_patterns_match_any_component(self):
+        """Test plain and trailing-slash names match at any depth."""
+        matcher = IgnoreMatcher({".git/", "venv"})
+
+        self.assertTrue(matcher.matches(".git"))
+        self.assertTrue(matcher.matches("a/b/.git/config"))
+        self.assertTrue(matcher.matches("tools/venv/lib"))
+        self.assertFalse(matcher.matches("tools/venv2/lib"))
+
+    def test_glob_patterns_match_components(self):
+        """Test wildcard patterns match single components only."""
+        matcher = IgnoreMatcher({"*.tmp", "draft-?"})
+
+        self.assertTrue(matcher.matches("docs/notes.tmp"))
+        self.assertTrue(matcher.matches("docs/draft-1/README.md"))
+        self.assertFalse(matcher.matches("docs/draft-10/README.md"))
+        self.assertFalse(matcher.matches("docs/tmp.md"))
+
+    def test_anchored_patterns(self):
+        """Test patterns containing a slash are anchored at the root."""
+        matcher = IgnoreMatcher({"/build", "docs/generated/"})
+
+        self.assertTrue(matcher.matches("build/README.md"))
+        self.assertFalse(matcher.matches("apps/build/README.md"))
+        self.assertTrue(matcher.matches("docs/generated/api.md"))
+        self.assertFalse(matcher.matches("other/docs/generated/api.md"))
+
+    def test_double_star_patterns(self):
+        """Test '**' spans any number of directories."""
+        matcher = IgnoreMatcher({"docs/**/drafts", "**/fixtures", "archive/**"})
+
+        self.assertTrue(matcher.matches("docs/drafts/a.md"))
+        self.assertTrue(matcher.matches("docs/a/b/drafts/a.md"))
+        self.assertFalse(matcher.matches("other/drafts/a.md"))
+        self.assertTrue(matcher.matches("deep/tests/fixtures/a.md"))
+        self.assertTrue(matcher.matches("archive/2020/a.md"))
+        self.assertFalse(matcher.matches("archive"))
+
+    def test_matches_entry_checks_only_the_entry(self):
+        """Test the scanning hot path checks the entry name and full path."""
+        matcher = IgnoreMatcher({"core", "/dist"})
+
+        self.assertTrue(matcher.matches_entry("libs/core", "core"))
+        self.assertTrue(matcher.matches_entry("dist", "dist"))
+        self.assertFalse(matcher.matches_entry("libs/dist", "dist"))
+
+    def test_root_is_never_ignored(self):
+        """Test the empty relative path (repository root) never matches."""
+        matcher = IgnoreMatcher({"*"})
+
+        self.assertFalse(matcher.matches(""))
+        self.assertFalse(matcher.matches("."))
 
 
 if __name__ == '__main__':
@@ -78,6 +78,29 @@ class TestValidators(unittest.TestCase):
         self.assertTrue(any("invalid status" in v for v in violations))
         self.assertTrue(any("invalid version format" in v for v in violations))
 
+    def test_metadata_violations_carry_line_numbers(self):
+        """Structured metadata violations point at the offending metadata line."""
+        (self.test_dir / "apps" / "README.md").write_text("""# Apps
+**Status**: Invalid Status
+**Version**: 0.5.0
+**Last Updated**: 10.06.2025
+""")
+
+        validator = MetadataValidator(self.test_dir)
+        readme = self.test_dir / "apps" / "README.md"
+        lines = {violation.message.split(" ")[1]: violation.line
+                 for violation in validator.collect_violations([readme])}
+
+        self.assertEqual(lines, {"status": 2, "date": 4})
+
+        # A missing field has no line of its own
+        readme.write_text("# Apps\n**Status**: 🚧 Draft\n**Version**: 0.5.0\n")
+        validator = MetadataValidator(self.test_dir)
+        violations = validator.collect_violations([readme])
+        self.assertEqual([(violation.message, violation.line)
+                          for violation in violations],
+                         [('missing "Last Updated"', None)])
+
     def test_link_integrity_checking(self):
         """Test link integrity validation."""
         # Create README with broken link
@@ -119,6 +142,55 @@ class TestValidators(unittest.TestCase):
         self.assertEqual(len(date_issues), 1)
         self.assertIn("older than child", date_issues[0])
 
+    def test_partial_snapshot_date_check_includes_children(self):
+        """Test incremental date checks compare a changed README with its children."""
+        from scanner import RepoSnapshot
+
+        (self.test_dir / "apps" / "web").mkdir()
+        (self.test_dir / "apps" / "web" / "README.md").write_text("""# Web
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-11
+""")
+
+        snapshot = RepoSnapshot.from_paths(self.test_dir,
+                                           files=[Path("apps/README.md")])
+        validator = LinkValidator(self.test_dir, snapshot=snapshot)
+        date_issues = validator.check_date_consistency()
+
+        # apps (2025-06-10) is older than apps/web (2025-06-11); root
+        # (2025-06-12) is newer than apps
+        self.assertEqual(len(date_issues), 1)
+        self.assertIn("apps/web/README.md", date_issues[0])
+
+    def test_anchor_links(self):
+        """Test #fragments are checked against the heading anchors of the target."""
+        (self.test_dir / "guide.md").write_text("""# Guide
+
+## Install `pip` Packages
+
+```
+## Not A Heading
+```
+
+Setup Notes
+-----------
+""")
+        (self.test_dir / "links.md").write_text("""# Links
+
+[ok](guide.md#install-pip-packages) [setext](guide.md#setup-notes) [self](#links)
+[fenced](guide.md#not-a-heading) [missing](#nowhere) [gone](nothere.md#x)
+""")
+
+        validator = LinkValidator(self.test_dir)
+        violations = validator.collect_file_link_violations(self.test_dir / "links.md")
+
+        self.assertEqual([(v.rule, v.target) for v in violations], [
+            ("broken-link", "nothere.md#x"),
+            ("broken-anchor", "guide.md#not-a-heading"),
+            ("broken-anchor", "#nowhere"),
+        ])
+
     def test_metadata_parser_edge_cases(self):
         """Test metadata parser with edge cases."""
         # Test metadata in wrong section (should be ignored)
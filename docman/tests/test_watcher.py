@@ -0,0 +1,127 @@
+"""
+Unit tests for watcher module.
+
+Tests for filesystem watchers and incremental re-validation in --watch mode.
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import DocManConfig
+from scanner import scan_repository
+from session import ValidationSession, merge_violations
+from watcher import InotifyWatcher, PollingWatcher
+
+
+README = """# {title}
+**Status**: ✅ Production Ready
+**Version**: 1.0.0
+**Last Updated**: 2025-06-01
+
+{body}
+"""
+
+
+class TestWatcher(unittest.TestCase):
+    """Test cases for watch mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+        (self.test_dir / "apps").mkdir()
+        (self.test_dir / "libs").mkdir()
+        (self.test_dir / "README.md").write_text(
+            README.format(title="Root", body="[Apps](apps/README.md)"))
+        (self.test_dir / "apps" / "README.md").write_text(
+            README.format(title="Apps", body=""))
+        (self.test_dir / "libs" / "README.md").write_text(
+            README.format(title="Libs", body=""))
+
+    def test_polling_watcher_detects_changes(self):
+        """Test the polling fallback reports modified, created and deleted docs."""
+        watcher = PollingWatcher(scan_repository(self.test_dir), interval=0)
+        self.assertEqual(watcher.poll(0), set())
+
+        readme = self.test_dir / "apps" / "README.md"
+        readme.write_text(readme.read_text() + "\nMore text\n")
+        (self.test_dir / "libs" / "guide.md").write_text("# Guide\n")
+        (self.test_dir / "libs" / "notes.txt").write_text("not markdown\n")
+        (self.test_dir / "README.md").unlink()
+
+        self.assertEqual(watcher.poll(0), {
+            readme, self.test_dir / "libs" / "guide.md", self.test_dir / "README.md"
+        })
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_inotify_watcher_batches_events(self):
+        """Test a burst of inotify events is coalesced into one batch."""
+        try:
+            watcher = InotifyWatcher(scan_repository(self.test_dir))
+        except OSError as e:
+            self.skipTest(f"inotify unavailable: {e}")
+        self.addCleanup(watcher.close)
+
+        for i in range(50):
+            (self.test_dir / "apps" / f"doc{i}.md").write_text("# Doc\n")
+        batch = watcher.next_batch(debounce=0.1)
+        self.assertEqual(len(batch), 50)
+
+    def test_apply_changes_includes_linking_documents(self):
+        """Test deleting a doc re-validates the docs linking to it and its directory."""
+        session = ValidationSession(self.test_dir, DocManConfig())
+        before = session.validate_workspace()
+        self.assertEqual(before, [])
+
+        target = self.test_dir / "apps" / "README.md"
+        target.unlink()
+        files, directories = session.apply_changes([target])
+
+        self.assertEqual(files, [self.test_dir / "README.md"])
+        self.assertEqual(directories, [self.test_dir / "apps"])
+
+        fresh = session.validate_files(files, directories)
+        self.assertEqual(sorted(v.rule for v in fresh),
+                         ["broken-link", "missing-readme"])
+
+    def test_new_directory_is_validated_recursively(self):
+        """Test a new directory tree arriving as one event is validated completely."""
+        session = ValidationSession(self.test_dir, DocManConfig())
+        (self.test_dir / "docs" / "api").mkdir(parents=True)
+        (self.test_dir / "docs" / "api" / "ref.md").write_text("# Ref\n")
+
+        files, directories = session.apply_changes([self.test_dir / "docs"])
+        self.assertEqual(files, [self.test_dir / "docs" / "api" / "ref.md"])
+        self.assertEqual(directories,
+                         [self.test_dir, self.test_dir / "docs",
+                          self.test_dir / "docs" / "api"])
+
+    def test_merge_violations_replaces_revalidated_paths(self):
+        """Test stale violations of re-validated paths are dropped and others kept."""
+        session = ValidationSession(self.test_dir, DocManConfig())
+        (self.test_dir / "apps" / "README.md").write_text("# Apps\n")
+        (self.test_dir / "libs" / "README.md").write_text("# Libs\n")
+        previous = session.validate_workspace()
+        self.assertEqual({v.file for v in previous},
+                         {os.path.join("apps", "README.md"),
+                          os.path.join("libs", "README.md")})
+
+        fixed = self.test_dir / "apps" / "README.md"
+        fixed.write_text(README.format(title="Apps", body=""))
+        files, directories = session.apply_changes([fixed])
+        merged = merge_violations(previous, session.validate_files(files, directories),
+                                  self.test_dir, [fixed] + files + directories)
+
+        self.assertEqual({v.file for v in merged}, {os.path.join("libs", "README.md")})
+
+
+if __name__ == '__main__':
+    unittest.main()
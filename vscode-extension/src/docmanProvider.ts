@@ -39,12 +39,13 @@ export class DocManProvider {
             const pythonPath = config.get<string>('pythonPath', 'python');
             const cliPath = await this.getCliPath();
 
-            // For single file validation, validate the parent directory but filter results
-            const parentDir = path.dirname(filePath);
-            const result = await this.runDocManCommand(pythonPath, cliPath, [parentDir, '--verbose']);
+            // Validate just this file (no repository walk, no index rewrite)
+            const workspaceFolder = vscode.workspace.getWorkspaceFolder(vscode.Uri.file(filePath));
+            const repoRoot = workspaceFolder ? workspaceFolder.uri.fsPath : path.dirname(filePath);
+            const result = await this.runDocManCommand(pythonPath, cliPath, [repoRoot, '--file', filePath, '--verbose']);
 
             // Parse and filter results for this specific file
-            const workspaceResult = await this.parseWorkspaceValidationOutput(result, parentDir);
+            const workspaceResult = await this.parseWorkspaceValidationOutput(result, repoRoot);
 
             // Filter issues to only include this specific file
             const fileName = path.basename(filePath);
@@ -75,7 +76,8 @@ export class DocManProvider {
             const pythonPath = config.get<string>('pythonPath', 'python');
             const cliPath = await this.getCliPath();
 
-            const result = await this.runDocManCommand(pythonPath, cliPath, [workspacePath, '--verbose']);
+            // Read-only: writing DOCUMENTATION_INDEX.md here would retrigger the file watcher
+            const result = await this.runDocManCommand(pythonPath, cliPath, [workspacePath, '--check', '--verbose']);
             return await this.parseWorkspaceValidationOutput(result, workspacePath);
         } catch (error) {
             return {